@@ -9,17 +9,116 @@ Usage:
     Set environment variable USE_DELTALAKE=true to enable.
 """
 
+import copy
+import functools
+import hashlib
+import json
 import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 
 # Add parquet_test to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'parquet_test'))
 
-from deltalake_cache import build_cache, read_table
+from deltalake_cache import (
+    SNAPSHOT_SOURCE_KEY, build_cache, load_responses, load_snapshot, read_table, save_responses, save_snapshot,
+)
+
+# Repeated string columns (including model and floorplan) stored as pandas categoricals so filters and
+# groupbys compare integer codes instead of Python strings
+CATEGORICAL_COLUMNS = [
+    'dealership', 'dealer_group', 'rv_type', 'manufacturer', 'condition',
+    'state', 'region', 'city', 'county', 'model', 'floorplan',
+]
+
+# Numeric columns cast once at cache build time. Delta decimal(12,2) arrives as
+# Python Decimal objects; prices stay float64 (float32 can't hold cents above
+# ~$130K) while day counts fit in a nullable 32-bit integer and model years in 16 bits.
+# days_to_sell is left as loaded: its mean/median feed float() directly, and a
+# nullable integer would turn an all-null group into pd.NA instead of NaN.
+NUMERIC_DTYPES = {
+    'price': 'float64',
+    'sale_price': 'float64',
+    'days_on_lot': 'Int32',
+    'model_year': 'Int16',
+}
+
+# Date columns parsed to datetime64 once at cache build time (Delta dates arrive as
+# Python date objects)
+DATE_COLUMNS = ['calendar_date']
+
+# Inventory breakdowns returned as by_<column>, with optional top-N limit
+GROUPING_SETS = [
+    ('rv_type', None),
+    ('dealer_group', None),
+    ('manufacturer', None),
+    ('condition', None),
+    ('state', 65),
+    ('region', None),
+    ('city', None),
+    ('county', None),
+]
+
+# Grouping sets of large frames (the unfiltered pre-compute) run on this many threads;
+# bincount and ufunc.at release the GIL, so the breakdowns scale across cores
+AGGREGATION_WORKERS = min(len(GROUPING_SETS), os.cpu_count() or 1)
+PARALLEL_AGGREGATION_MIN_ROWS = 100_000
+
+# Only these inventory columns are read by the aggregation path
+AGGREGATION_COLUMNS = ['stock_number', 'price', 'days_on_lot'] + [col for col, _ in GROUPING_SETS]
+
+# The cache snapshot and the responses pre-computed from it are only reused by the exact code that
+# produced them: deltalake_cache builds the frames, this module converts them and computes the responses
+with open(__file__, 'rb') as _source:
+    CACHE_SOURCE_KEY = hashlib.sha1(_source.read() + SNAPSHOT_SOURCE_KEY.encode()).hexdigest()
+
+# Maximum number of filtered responses kept in the LRU response cache
+RESPONSE_CACHE_SIZE = 512
+
+# Sales columns the sales velocity endpoints break down by (month_year feeds by_month)
+SALES_GROUPING_COLUMNS = [
+    'rv_type', 'condition', 'dealer_group', 'manufacturer', 'state', 'region', 'month_year',
+]
+
+# Sales velocity breakdowns a caller can limit the response to (the others come back empty)
+SALES_VELOCITY_BREAKDOWNS = [
+    'by_rv_type', 'by_condition', 'by_dealer_group', 'by_manufacturer', 'by_state', 'by_region', 'by_month',
+]
+
+# Only these sales columns are read by the top floorplans breakdown
+TOP_FLOORPLANS_COLUMNS = [
+    'stock_number', 'days_to_sell', 'sale_price', 'rv_type', 'floorplan', 'manufacturer', 'model',
+]
+
+# Top floorplans RV type categories, in response order; every other rv_type falls into OTHER
+FLOORPLAN_CATEGORIES = ['CLASS A', 'CLASS B', 'CLASS C', 'FIFTH WHEEL', 'TRAVEL TRAILER', 'OTHER']
+
+# Inventory column -> InventoryItem field returned by get_cached_inventory
+INVENTORY_ITEM_COLUMNS = {
+    'stock_number': 'stock_number',
+    'model_year': 'year',
+    'manufacturer': 'make',
+    'model': 'model',
+    'floorplan': 'floorplan',
+    'rv_type': 'rv_class',
+    'condition': 'condition',
+    'price': 'sale_price',
+    'state': 'location',
+    'dealership': 'dealer_source',
+    'dealer_group': 'dealer_group',
+    'days_on_lot': 'days_on_lot',
+}
+
+# InventoryItem fields not present in fact_inventory_current
+INVENTORY_ITEM_EMPTY_FIELDS = ['title', 'msrp', 'first_image', 'sleeps', 'length', 'weight', 'vin']
 
 
 class DeltaLakeClient:
@@ -28,32 +127,139 @@ class DeltaLakeClient:
     but uses Delta Lake for direct table access.
     """
 
-    _instance = None
     _cache = None
     _cache_loaded = False
     _aggregations_cache = None  # Cache for unfiltered aggregations
     _sales_velocity_cache = None  # Cache for unfiltered sales velocity
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    _filtered_aggregations_cache = None  # Cache for single-filter aggregations ("condition:NEW", ...)
+    _aggregations_json = None  # Cache for serialized unfiltered aggregations
+    _filtered_aggregations_json = None  # Cache for serialized single-filter aggregations
+    _sales_velocity_json = None  # Cache for serialized unfiltered sales velocity
+    _filtered_sales_velocity_cache = None  # Cache for single-filter sales velocity ("condition:NEW", ...)
+    _filtered_sales_velocity_json = None  # Cache for serialized single-filter sales velocity
+    _filter_options = None  # Cache for filter dropdown options
+    _filter_options_json = None  # Cache for serialized filter dropdown options
+    _dealer_names = None  # Cache for sorted dealer names
+    _dealers_json = None  # Cache for the serialized /dealers response
+    _response_cache = None  # LRU cache for filtered responses: {(kind, filter key): _freeze_response entry}
+    _response_cache_lock = threading.Lock()  # Guards the LRU order across FastAPI's worker threads
+    _row_index = None  # Cache for row positions per filter value: {frame: {column: (order, offsets)}}
+    _price_index = None  # Cache for inventory rows ordered by price: (row positions, sorted prices)
+    _stock_numbers_complete = None  # Cache for whether every row has a stock number: {frame: bool}
+    _sales_arrays = None  # Cache for per-row sales values and group bins read by the velocity breakdowns
+    _sales_dates = None  # Cache for the date-sorted sales calendar_date values and how many are not NaT
+    _floorplan_categories = None  # Cache for each sales row's FLOORPLAN_CATEGORIES position (-1 without an rv_type)
+    _load_lock = threading.Lock()  # Prevents concurrent requests from building the cache twice
 
     def load_cache(self):
         """Load dimension tables - delegated to build_cache."""
         pass  # Handled by load_inventory_cache
 
     def load_inventory_cache(self):
-        """Load all data via Delta Lake."""
+        """Load all data via Delta Lake (once, even under concurrent callers)."""
         if self._cache_loaded:
             return
 
+        with self._load_lock:
+            if self._cache_loaded:
+                return
+            self._build_inventory_cache()
+
+    def _build_inventory_cache(self):
+        """Build the Delta Lake cache and every pre-computed response."""
         print("Loading Delta Lake cache...")
         start = datetime.now()
-        self._cache = build_cache(verbose=True)
+        # Warm restarts reuse the Arrow snapshot while the Delta tables are unchanged
+        cache = load_snapshot(source_key=CACHE_SOURCE_KEY)
+        from_snapshot = cache is not None
+        if cache is None:
+            cache = build_cache(verbose=True)
+        # Columns a snapshot already stores converted are skipped
+        for frame in ('inventory', 'sales'):
+            self._convert_categoricals(cache.get(frame))
+            self._convert_numerics(cache.get(frame))
+            self._convert_dates(cache.get(frame))
+        # Sales are kept in calendar_date order so a date range is a contiguous run of rows
+        cache['sales'] = self._sort_by_date(cache.get('sales'))
+        if not from_snapshot:
+            save_snapshot(cache, source_key=CACHE_SOURCE_KEY)
+        self._make_columns_contiguous(cache.get('inventory'))
+        self._make_columns_contiguous(cache.get('sales'))
+        # Frames are published only once fully converted
+        self._cache = cache
         elapsed = (datetime.now() - start).total_seconds()
         print(f"Delta Lake cache loaded in {elapsed:.1f} seconds")
 
+        # Responses and filter code tables computed from the previous cache are stale
+        self._response_cache = OrderedDict()
+        self._allowed_codes.cache_clear()
+
+        # Index row positions by filter value so selective filters never scan every row
+        self._row_index = {
+            frame: self._build_row_index(self._cache.get(frame)) for frame in ('inventory', 'sales')
+        }
+
+        # Sorted prices turn a price range into a contiguous slice of row positions
+        self._price_index = self._build_price_index(self._cache.get('inventory'))
+
+        # Without null stock numbers a group's count is its row count, so the grouping
+        # pass can reuse that bincount instead of scanning stock numbers per request
+        self._stock_numbers_complete = {
+            frame: df is not None and 'stock_number' in df.columns and not df['stock_number'].hasnans
+            for frame, df in ((frame, self._cache.get(frame)) for frame in ('inventory', 'sales'))
+        }
+
+        # Date ranges are resolved by binary search over the sorted sales dates
+        sales = self._cache.get('sales')
+        if sales is not None and pd.api.types.is_datetime64_dtype(sales.get('calendar_date')):
+            dates = sales['calendar_date'].to_numpy(dtype='datetime64[ns]')
+            self._sales_dates = (dates, int(np.count_nonzero(~np.isnat(dates))))
+        else:
+            self._sales_dates = None
+
+        # Sales velocity breakdowns gather their rows straight from these arrays
+        self._sales_arrays = self._build_sales_arrays(self._cache.get('sales'))
+
+        # Top floorplans splits one grouping pass by each row's RV type category
+        self._floorplan_categories = self._build_floorplan_categories(self._cache.get('sales'))
+
+        # Responses pre-computed from this snapshot by this code are reused across restarts
+        responses = load_responses(CACHE_SOURCE_KEY) if from_snapshot else None
+        if responses is not None:
+            self._aggregations_cache = responses['aggregations']
+            self._sales_velocity_cache = responses['sales_velocity']
+            self._filtered_aggregations_cache = responses['filtered_aggregations']
+            self._filtered_sales_velocity_cache = responses['filtered_sales_velocity']
+            print("Loaded pre-computed aggregations from the cache snapshot")
+        else:
+            self._precompute_responses()
+            save_responses({
+                'aggregations': self._aggregations_cache,
+                'sales_velocity': self._sales_velocity_cache,
+                'filtered_aggregations': self._filtered_aggregations_cache,
+                'filtered_sales_velocity': self._filtered_sales_velocity_cache,
+            }, CACHE_SOURCE_KEY)
+
+        # Serialize the static responses once so endpoints can skip per-request JSON encoding
+        self._aggregations_json = self._to_json(self._aggregations_cache)
+        self._sales_velocity_json = self._to_json(self._sales_velocity_cache)
+        self._filtered_aggregations_json = {
+            key: self._to_json(value) for key, value in self._filtered_aggregations_cache.items()
+        }
+        self._filtered_sales_velocity_json = {
+            key: self._to_json(value) for key, value in self._filtered_sales_velocity_cache.items()
+        }
+
+        # Filter options and dealer names only change when the cache is rebuilt
+        self._filter_options = self._compute_filter_options()
+        self._filter_options_json = self._to_json(self._filter_options)
+        self._dealer_names = self._compute_dealer_names()
+        self._dealers_json = self._to_json({'dealers': self._dealer_names, 'count': len(self._dealer_names)})
+
+        self._cache_loaded = True
+
+    def _precompute_responses(self):
+        """Pre-compute the unfiltered and common single-filter responses."""
         # Pre-compute unfiltered aggregations for instant responses
         print("Pre-computing aggregations...")
         agg_start = datetime.now()
@@ -68,17 +274,75 @@ class DeltaLakeClient:
         sales_elapsed = (datetime.now() - sales_start).total_seconds()
         print(f"Sales velocity pre-computed in {sales_elapsed:.1f} seconds")
 
-        self._cache_loaded = True
+        # Pre-compute per-condition and per-rv_type aggregations (most common single filters)
+        print("Pre-computing filtered aggregations...")
+        filtered_start = datetime.now()
+        self._filtered_aggregations_cache = self._compute_filtered_aggregations()
+        filtered_elapsed = (datetime.now() - filtered_start).total_seconds()
+        print(f"{len(self._filtered_aggregations_cache)} filtered aggregations pre-computed in {filtered_elapsed:.1f} seconds")
+
+        # Pre-compute per-condition and per-rv_type sales velocity (the dashboard's common single filters)
+        print("Pre-computing filtered sales velocity...")
+        filtered_start = datetime.now()
+        self._filtered_sales_velocity_cache = self._compute_filtered_sales_velocity()
+        filtered_elapsed = (datetime.now() - filtered_start).total_seconds()
+        print(f"{len(self._filtered_sales_velocity_cache)} filtered sales velocity responses pre-computed in {filtered_elapsed:.1f} seconds")
+
+    def _convert_numerics(self, df: Optional[pd.DataFrame]):
+        """Cast price and day-count columns to compact numeric dtypes once at cache build time."""
+        if df is None:
+            return
+        for col, dtype in NUMERIC_DTYPES.items():
+            if col in df.columns and df[col].dtype != dtype:
+                df[col] = df[col].astype(dtype)
+
+    def _convert_dates(self, df: Optional[pd.DataFrame]):
+        """Parse date columns to datetime64 once at cache build time so date filters compare directly."""
+        if df is None:
+            return
+        for col in DATE_COLUMNS:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col])
+
+    def _sort_by_date(self, df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Order rows by calendar_date (undated rows last), leaving an already ordered frame as is."""
+        if df is None or not pd.api.types.is_datetime64_dtype(df.get('calendar_date')):
+            return df
+        dates = df['calendar_date']
+        dated = dates.notna().to_numpy()
+        # Sorted means every dated row comes first and in order
+        if dated[:dated.sum()].all() and dates[dated].is_monotonic_increasing:
+            return df
+        return df.sort_values('calendar_date', kind='stable', na_position='last').reset_index(drop=True)
+
+    def _make_columns_contiguous(self, df: Optional[pd.DataFrame]):
+        """
+        Copy any column whose values are strided (e.g. from a Fortran-ordered block left by a
+        merge) into its own contiguous array, so every per-request scan and take reads it linearly.
+        """
+        if df is None:
+            return
+        for col in df.columns:
+            # Extension arrays (categoricals, nullable ints) already own 1-D buffers
+            if isinstance(df[col].dtype, np.dtype):
+                values = df[col].to_numpy()
+                if not values.flags['C_CONTIGUOUS']:
+                    df[col] = np.ascontiguousarray(values)
+
+    def _convert_categoricals(self, df: Optional[pd.DataFrame]):
+        """Convert filter columns to category dtype once at cache build time."""
+        if df is None:
+            return
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
 
     def build_aggregations_cache(self):
         """Aggregations are built as part of load_inventory_cache."""
         pass
 
     def build_filtered_aggregations_cache(self):
-        """
-        Pre-compute filtered aggregations for common filters.
-        Delta Lake version computes on-demand since it's fast enough.
-        """
+        """Filtered aggregations for common filters are built as part of load_inventory_cache."""
         pass
 
     def _parse_multi_value(self, value: str) -> List[str]:
@@ -87,19 +351,267 @@ class DeltaLakeClient:
             return []
         return [v.strip() for v in value.split(',') if v.strip()]
 
-    def _apply_filter(self, df: pd.DataFrame, column: str, value: str) -> pd.DataFrame:
-        """Apply filter supporting both single and comma-separated values."""
-        if not value or column not in df.columns:
-            return df
-        values = self._parse_multi_value(value)
-        if len(values) == 1:
-            return df[df[column] == values[0]]
-        return df[df[column].isin(values)]
+    def _build_row_index(self, df: Optional[pd.DataFrame]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Group row positions by category code for every categorical filter column.
+        Rows with code c are order[offsets[c]:offsets[c + 1]], in ascending row order.
+        """
+        index = {}
+        if df is None:
+            return index
+        for col in CATEGORICAL_COLUMNS:
+            if col not in df.columns or not isinstance(df[col].dtype, pd.CategoricalDtype):
+                continue
+            codes = df[col].cat.codes.to_numpy()
+            # Stable sort keeps rows ascending within a code; nulls (-1) sort first and are skipped
+            order = np.argsort(codes, kind='stable').astype(np.int32)
+            counts = np.bincount(codes[codes >= 0], minlength=len(df[col].cat.categories))
+            offsets = np.concatenate(([0], np.cumsum(counts))) + np.count_nonzero(codes < 0)
+            index[col] = (order, offsets)
+        return index
+
+    def _build_sales_arrays(self, df: Optional[pd.DataFrame]) -> Optional[Dict[str, Any]]:
+        """
+        Extract the per-row sales values and group bins once, so a filtered breakdown gathers
+        its matching rows and bincounts them instead of slicing and regrouping the frame.
+        """
+        if df is None:
+            return None
+
+        def values(column):
+            if column not in df.columns:
+                return None
+            return df[column].to_numpy(dtype='float64', na_value=np.nan)
+
+        # Rows without a stock number aren't counted as sold (all rows are when none is missing)
+        if 'stock_number' not in df.columns:
+            counted = np.zeros(len(df))
+        elif self._stock_numbers_complete.get('sales'):
+            counted = None
+        else:
+            counted = df['stock_number'].notna().to_numpy(dtype='float64')
+        bins = {}
+        for column in SALES_GROUPING_COLUMNS:
+            if column not in df.columns:
+                continue
+            # Months are binned by calendar_date's integer month instead of hashing month_year strings
+            if column == 'month_year' and pd.api.types.is_datetime64_dtype(df.get('calendar_date')):
+                bins[column] = self._month_bins(df['calendar_date'], df['month_year'])
+            else:
+                bins[column] = self._group_bins(df[column])
+        return {
+            'counted': counted,
+            'days_to_sell': values('days_to_sell'),
+            'sale_price': values('sale_price'),
+            'bins': bins,
+        }
+
+    def _build_floorplan_categories(self, df: Optional[pd.DataFrame]) -> Optional[np.ndarray]:
+        """Position in FLOORPLAN_CATEGORIES of each sales row's rv_type (-1 where it is null)."""
+        if df is None or 'rv_type' not in df.columns:
+            return None
+        other = FLOORPLAN_CATEGORIES.index('OTHER')
+        rv_types = df['rv_type'].astype('category')
+        # One lookup per category, then a gather through the row codes (the extra slot maps -1 to -1)
+        lookup = np.array(
+            [FLOORPLAN_CATEGORIES.index(t) if t in FLOORPLAN_CATEGORIES[:other] else other
+             for t in rv_types.cat.categories] + [-1],
+            dtype=np.int8,
+        )
+        return lookup[rv_types.cat.codes.to_numpy()]
+
+    def _month_bins(self, dates: pd.Series, labels: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Bin number per sales row by calendar month (months since the earliest date, in order),
+        labelled with each month's month_year value. Rows without a date or label land in bin 0.
+        """
+        months = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+        known = ~np.isnat(months) & labels.notna().to_numpy()
+        if not known.any():
+            return np.zeros(len(dates), dtype=np.intp), pd.Index([], dtype=object)
+
+        codes = months.view(np.int64)
+        bins = np.where(known, codes - codes[known].min() + 1, 0).astype(np.intp)
+
+        # Each month takes the label of its first row (months without rows are never output)
+        month_bins, first_rows = np.unique(bins, return_index=True)
+        month_labels = np.full(bins.max(), None, dtype=object)
+        month_labels[month_bins[month_bins > 0] - 1] = labels.to_numpy(dtype=object)[first_rows[month_bins > 0]]
+        return bins, pd.Index(month_labels, dtype=object)
+
+    def _build_price_index(self, df: Optional[pd.DataFrame]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Row positions of priced rows ordered by price, with the matching sorted prices."""
+        if df is None or 'price' not in df.columns:
+            return None
+        prices = df['price'].to_numpy(dtype='float64', na_value=np.nan)
+        # Rows without a price never match a price range, so they are left out
+        priced = np.flatnonzero(~np.isnan(prices)).astype(np.int32)
+        order = priced[np.argsort(prices[priced], kind='stable')]
+        return order, prices[order]
+
+    def _select_rows(
+        self,
+        frame: str,
+        filters: List[Tuple[str, Optional[str]]],
+        min_price: float = None,
+        max_price: float = None
+    ) -> np.ndarray:
+        """
+        Resolve all active filters on a cached frame to the ascending positions of matching rows.
+
+        The most selective indexed filter (or the price range) seeds the candidate rows;
+        every other predicate is then evaluated on those candidates only.
+        """
+        df = self._cache[frame]
+        row_index = (self._row_index or {}).get(frame, {})
+
+        # Resolve filter values (comma-separated multi-values) and pick the smallest posting list
+        predicates = []
+        seed = None
+        for column, value in filters:
+            if not value or column not in df.columns:
+                continue
+            values = self._parse_multi_value(value)
+            value_codes = allowed = None
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                value_codes, allowed = self._allowed_codes(frame, column, tuple(values))
+                if len(value_codes) == 0:
+                    return np.empty(0, dtype=np.intp)
+                if column in row_index:
+                    offsets = row_index[column][1]
+                    size = int((offsets[value_codes + 1] - offsets[value_codes]).sum())
+                    if seed is None or size < seed[0]:
+                        seed = (size, column, value_codes)
+            predicates.append((column, values, value_codes, allowed))
+
+        # A price range is a binary search over the price-sorted rows; it seeds instead when narrower
+        has_price_range = min_price is not None or max_price is not None
+        price_index = self._price_index if frame == 'inventory' else None
+        if has_price_range and price_index is not None:
+            sorted_prices = price_index[1]
+            lo = np.searchsorted(sorted_prices, min_price, side='left') if min_price is not None else 0
+            hi = np.searchsorted(sorted_prices, max_price, side='right') if max_price is not None else len(sorted_prices)
+            hi = max(lo, hi)
+            if seed is None or hi - lo < seed[0]:
+                seed = (hi - lo, 'price', (lo, hi))
+
+        rows = None  # None = every row
+        if seed is not None and seed[1] == 'price':
+            lo, hi = seed[2]
+            rows = np.sort(price_index[0][lo:hi])
+            has_price_range = False
+        elif seed is not None:
+            _, seed_column, seed_codes = seed
+            order, offsets = row_index[seed_column]
+            rows = np.concatenate([order[offsets[c]:offsets[c + 1]] for c in seed_codes])
+            if len(seed_codes) > 1:
+                rows.sort()
+
+        def gather(array):
+            return array if rows is None else array[rows]
+
+        for column, values, value_codes, allowed in predicates:
+            if seed is not None and column == seed[1]:
+                continue
+            if value_codes is not None:
+                codes = gather(df[column].cat.codes.to_numpy())
+                # Multi-value membership is one gather from the per-category bool table
+                keep = codes == value_codes[0] if len(value_codes) == 1 else allowed[codes]
+            elif len(values) == 1:
+                keep = gather(df[column].to_numpy()) == values[0]
+            else:
+                keep = pd.Series(gather(df[column].to_numpy())).isin(values).to_numpy()
+            rows = np.flatnonzero(keep) if rows is None else rows[keep]
+            if len(rows) == 0:
+                return rows
+
+        if has_price_range:
+            prices = gather(df['price'].to_numpy())
+            # One mask for both bounds: the upper comparison is ANDed into the lower in place
+            if min_price is not None:
+                keep = prices >= min_price
+                if max_price is not None:
+                    np.logical_and(keep, prices <= max_price, out=keep)
+            else:
+                keep = prices <= max_price
+            rows = np.flatnonzero(keep) if rows is None else rows[keep]
+
+        return np.arange(len(df)) if rows is None else rows
+
+    @functools.lru_cache(maxsize=1024)
+    def _allowed_codes(self, frame: str, column: str, values: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Category codes of the filter values on a cached frame's categorical column, and a bool
+        table over codes marking them (its last entry stays False, so null codes (-1) never match).
+        Cleared whenever the cache is rebuilt.
+        """
+        categories = self._cache[frame][column].cat.categories
+        # Values missing from the categories map to -1: nothing can match. Repeated values
+        # (state=TX,TX) collapse to one code so a seed posting list is never taken twice
+        value_codes = categories.get_indexer(values)
+        value_codes = np.unique(value_codes[value_codes >= 0])
+        allowed = np.zeros(len(categories) + 1, dtype=bool)
+        allowed[value_codes] = True
+        return value_codes, allowed
+
+    def _filter_date_range(self, sales: pd.DataFrame, rows: np.ndarray,
+                           start_date: str = None, end_date: str = None) -> np.ndarray:
+        """Narrow ascending sales row positions to an inclusive calendar_date range (unparseable bounds are ignored)."""
+        if 'calendar_date' not in sales.columns or not (start_date or end_date) or len(rows) == 0:
+            return rows
+
+        bounds = []
+        for bound, side in ((start_date, 'left'), (end_date, 'right')):
+            if not bound:
+                continue
+            try:
+                value = pd.Timestamp(bound)
+            except Exception:
+                continue
+            # Timezone-aware bounds can't be compared with the naive dates
+            if value.tz is not None:
+                continue
+            bounds.append((side, value.to_datetime64()))
+        if not bounds:
+            return rows
+
+        if self._sales_dates is not None:
+            # Dates are sorted (NaT last), so the range is rows lo..hi: two binary searches
+            # over the dates, then two over the ascending row positions
+            dates, dated = self._sales_dates
+            lo, hi = 0, dated
+            for side, value in bounds:
+                if side == 'left':
+                    lo = int(np.searchsorted(dates[:dated], value, side='left'))
+                else:
+                    hi = int(np.searchsorted(dates[:dated], value, side='right'))
+            return rows[np.searchsorted(rows, lo):np.searchsorted(rows, max(lo, hi))]
+
+        # Compare raw datetime64 values (NaT never matches) without building pandas Series
+        dates = sales['calendar_date'].to_numpy()[rows]
+        keep = None
+        for side, value in bounds:
+            compare = np.greater_equal if side == 'left' else np.less_equal
+            # The first predicate allocates the mask; later ones are ANDed into it in place
+            if keep is None:
+                keep = compare(dates, value)
+            else:
+                np.logical_and(keep, compare(dates, value), out=keep)
+        return rows[keep]
 
     def get_filter_options(self) -> Dict[str, List[str]]:
-        """Get available filter options."""
+        """Get available filter options (pre-computed at cache load)."""
+        if self._filter_options is None:
+            self._filter_options = self._compute_filter_options()
+        return self._filter_options
+
+    def get_filter_options_json(self) -> Optional[bytes]:
+        """Get pre-computed filter options as JSON bytes, or None if not serializable."""
+        return self._filter_options_json
+
+    def _compute_filter_options(self) -> Dict[str, List[str]]:
+        """Compute available filter options from the inventory cache."""
         inventory = self._cache.get('inventory')
-        dealers = self._cache.get('dealers')
 
         if inventory is None:
             return {
@@ -115,23 +627,48 @@ class DeltaLakeClient:
             }
 
         return {
-            'rv_types': sorted(inventory['rv_type'].dropna().unique().tolist()),
-            'states': sorted(inventory['state'].dropna().unique().tolist()),
-            'regions': sorted(inventory['region'].dropna().unique().tolist()) if 'region' in inventory.columns else [],
-            'cities': sorted(inventory['city'].dropna().unique().tolist()) if 'city' in inventory.columns else [],
-            'conditions': sorted(inventory['condition'].dropna().unique().tolist()),
-            'dealer_groups': sorted(inventory['dealer_group'].dropna().unique().tolist()),
-            'manufacturers': sorted(inventory['manufacturer'].dropna().unique().tolist()),
-            'models': sorted(inventory['model'].dropna().unique().tolist()) if 'model' in inventory.columns else [],
-            'floorplans': sorted(inventory['floorplan'].dropna().unique().tolist()) if 'floorplan' in inventory.columns else []
+            'rv_types': self._sorted_uniques(inventory['rv_type']),
+            'states': self._sorted_uniques(inventory['state']),
+            'regions': self._sorted_uniques(inventory['region']) if 'region' in inventory.columns else [],
+            'cities': self._sorted_uniques(inventory['city']) if 'city' in inventory.columns else [],
+            'conditions': self._sorted_uniques(inventory['condition']),
+            'dealer_groups': self._sorted_uniques(inventory['dealer_group']),
+            'manufacturers': self._sorted_uniques(inventory['manufacturer']),
+            'models': self._sorted_uniques(inventory['model']) if 'model' in inventory.columns else [],
+            'floorplans': self._sorted_uniques(inventory['floorplan']) if 'floorplan' in inventory.columns else []
         }
 
+    def _sorted_uniques(self, series: pd.Series) -> List[str]:
+        """Sorted distinct non-null values (categoricals read their dictionary instead of every row)."""
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            # Dedup and sort the raw array in C rather than sorting a Python list
+            values = pd.unique(series.dropna().to_numpy())
+            values.sort()
+            return values.tolist()
+
+        # Categories built by astype('category') are already sorted; keep only observed ones
+        codes = series.cat.codes.to_numpy()
+        values = series.cat.categories[np.unique(codes[codes >= 0])]
+        if not values.is_monotonic_increasing:
+            values = values.sort_values()
+        return values.tolist()
+
     def list_dealers(self) -> List[str]:
-        """Get list of dealer names."""
+        """Get list of dealer names (pre-computed at cache load)."""
+        if self._dealer_names is None:
+            self._dealer_names = self._compute_dealer_names()
+        return self._dealer_names
+
+    def get_dealers_json(self) -> Optional[bytes]:
+        """Get the pre-computed dealers response ({dealers, count}) as JSON bytes."""
+        return self._dealers_json
+
+    def _compute_dealer_names(self) -> List[str]:
+        """Compute sorted dealer names from the dealer dimension."""
         dealers = self._cache.get('dealers')
         if dealers is None:
             return []
-        return sorted(dealers['dealership'].dropna().unique().tolist())
+        return self._sorted_uniques(dealers['dealership'])
 
     def get_cached_inventory(
         self,
@@ -152,61 +689,101 @@ class DeltaLakeClient:
         if inventory is None:
             return []
 
-        df = inventory.copy()
-
-        # Apply filters (supports comma-separated multi-values)
-        df = self._apply_filter(df, 'dealership', dealer)
-        df = self._apply_filter(df, 'dealer_group', dealer_group)
-        df = self._apply_filter(df, 'rv_type', rv_type)
-        df = self._apply_filter(df, 'manufacturer', manufacturer)
-        df = self._apply_filter(df, 'condition', condition)
-        df = self._apply_filter(df, 'state', state)
-        df = self._apply_filter(df, 'model', model)
-        df = self._apply_filter(df, 'floorplan', floorplan)
-        if min_price is not None:
-            df = df[df['price'] >= min_price]
-        if max_price is not None:
-            df = df[df['price'] <= max_price]
-
-        # Limit results
-        df = df.head(limit)
-
-        # Convert to list of dicts matching expected format
-        results = []
-        for _, row in df.iterrows():
-            results.append({
-                'stock_number': row.get('stock_number'),
-                'title': None,  # Not in Delta tables
-                'year': row.get('model_year'),
-                'make': row.get('manufacturer'),
-                'model': row.get('model'),
-                'floorplan': row.get('floorplan'),
-                'rv_class': row.get('rv_type'),
-                'condition': row.get('condition'),
-                'sale_price': float(row['price']) if pd.notna(row.get('price')) else None,
-                'msrp': None,  # Not in fact_inventory_current
-                'location': row.get('state'),
-                'dealer_source': row.get('dealership'),
-                'dealer_group': row.get('dealer_group'),
-                'first_image': None,  # Not in fact_inventory_current
-                'sleeps': None,
-                'length': None,
-                'weight': None,
-                'vin': None,  # Not in fact_inventory_current
-                'days_on_lot': int(row['days_on_lot']) if pd.notna(row.get('days_on_lot')) else None,
-            })
-
-        return results
+        # Repeated filter combinations are served from the LRU response cache
+        filters = dict(dealer=dealer, dealer_group=dealer_group, rv_type=rv_type, manufacturer=manufacturer,
+                       condition=condition, state=state, model=model, floorplan=floorplan,
+                       min_price=min_price, max_price=max_price)
+        return self._cached_response(
+            ('inventory', limit) + self._filter_key(**filters),
+            lambda: self._compute_cached_inventory(inventory, limit=limit, **filters),
+        )
+
+    def _compute_cached_inventory(
+        self,
+        inventory: pd.DataFrame,
+        dealer: str = None,
+        dealer_group: str = None,
+        rv_type: str = None,
+        manufacturer: str = None,
+        condition: str = None,
+        state: str = None,
+        model: str = None,
+        floorplan: str = None,
+        min_price: float = None,
+        max_price: float = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """Select, project and convert the inventory rows matching the filters."""
+        # Matching row positions from the row index (supports comma-separated multi-values)
+        rows = self._select_rows('inventory', [
+            ('dealership', dealer),
+            ('floorplan', floorplan),
+            ('model', model),
+            ('dealer_group', dealer_group),
+            ('manufacturer', manufacturer),
+            ('state', state),
+            ('rv_type', rv_type),
+            ('condition', condition),
+        ], min_price, max_price)
+        # Only the returned rows and columns are copied out of the cache
+        columns = inventory.columns.intersection(list(INVENTORY_ITEM_COLUMNS))
+        df = inventory.iloc[rows[:limit], inventory.columns.get_indexer(columns)]
+
+        # Rename to the expected format; missing and empty fields come back as null columns,
+        # so each complete record is built directly from the columns
+        df = df.rename(columns=INVENTORY_ITEM_COLUMNS).reindex(
+            columns=INVENTORY_ITEM_EMPTY_FIELDS + list(INVENTORY_ITEM_COLUMNS.values())
+        )
+        df['sale_price'] = df['sale_price'].astype('float64')
+        df['days_on_lot'] = df['days_on_lot'].astype('Int64')
+        # Categorical/nullable nulls come back as NaN/NA, restore None
+        df = df.astype(object).where(df.notna(), None)
+        return self._to_records(df)
 
     def get_fast_aggregations(self) -> Dict[str, Any]:
         """Get pre-computed aggregations (no filters)."""
         return self._build_aggregation_response()
 
+    def get_fast_aggregations_json(self) -> Optional[bytes]:
+        """Get pre-computed aggregations (no filters) as JSON bytes, or None if not serializable."""
+        return self._aggregations_json
+
+    def get_sales_velocity_json(self, **filters: Optional[str]) -> Optional[bytes]:
+        """
+        Get pre-computed sales velocity (no filters, or a single condition / rv_type value)
+        as JSON bytes, or None if not pre-computed or not serializable.
+        """
+        if all(f is None for f in filters.values()):
+            return self._sales_velocity_json
+        key = self._single_filter_key(**filters)
+        if key is None or not self._filtered_sales_velocity_json:
+            return None
+        return self._filtered_sales_velocity_json.get(key)
+
+    def get_filtered_aggregations_cached_json(self, cache_key: str) -> Optional[bytes]:
+        """Get pre-computed filtered aggregations as JSON bytes, or None if not pre-computed."""
+        if not self._filtered_aggregations_json:
+            return None
+        return self._filtered_aggregations_json.get(cache_key)
+
+    def _to_json(self, data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Encode a response the same way FastAPI's JSONResponse does (None if it can't)."""
+        if data is None:
+            return None
+        try:
+            return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('utf-8')
+        except (TypeError, ValueError):
+            # NaN or numpy scalars - let FastAPI encode the dict per request instead
+            return None
+
     def get_filtered_aggregations_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
         Get pre-computed filtered aggregations.
-        Delta Lake computes on-demand since it's fast.
+        Falls back to computing on-demand for values not seen at cache load.
         """
+        if self._filtered_aggregations_cache and cache_key in self._filtered_aggregations_cache:
+            return self._filtered_aggregations_cache[cache_key]
+
         # Parse cache key (e.g., "condition:NEW" or "rv_type:TRAVEL TRAILER")
         parts = cache_key.split(':', 1)
         if len(parts) != 2:
@@ -246,6 +823,150 @@ class DeltaLakeClient:
             max_price=max_price
         )
 
+    def get_filtered_aggregations_json(
+        self,
+        rv_type: str = None,
+        dealer_group: str = None,
+        manufacturer: str = None,
+        condition: str = None,
+        state: str = None,
+        model: str = None,
+        floorplan: str = None,
+        min_price: float = None,
+        max_price: float = None
+    ) -> Optional[bytes]:
+        """Get aggregations with filters applied as JSON bytes (LRU-cached), or None if not serializable."""
+        filters = dict(rv_type=rv_type, dealer_group=dealer_group, manufacturer=manufacturer, condition=condition,
+                       state=state, model=model, floorplan=floorplan, min_price=min_price, max_price=max_price)
+        if all(f is None for f in filters.values()):
+            return self._aggregations_json
+        # Repeated filter combinations skip both the aggregation and the encoding
+        return self._cached_response(
+            ('aggregations_json',) + self._filter_key(**filters),
+            lambda: self._to_json(self.get_filtered_aggregations(**filters)),
+        )
+
+    def get_aggregated_summaries(
+        self,
+        rv_type: str = None,
+        dealer_group: str = None,
+        manufacturer: str = None,
+        condition: str = None,
+        state: str = None,
+        min_price: float = None,
+        max_price: float = None
+    ) -> Dict[str, Any]:
+        """Get aggregated summaries in the FabricGraphQLClient shape (top-N breakdowns), from the cached aggregations."""
+        aggregations = self.get_filtered_aggregations(
+            rv_type=rv_type,
+            dealer_group=dealer_group,
+            manufacturer=manufacturer,
+            condition=condition,
+            state=state,
+            min_price=min_price,
+            max_price=max_price
+        )
+        return {
+            'total_units': aggregations['total_units'],
+            'total_value': aggregations['total_value'],
+            'avg_price': aggregations['avg_price'],
+            'min_price': aggregations['min_price'],
+            'max_price': aggregations['max_price'],
+            'by_rv_type': aggregations['by_rv_type'][:10],
+            'by_dealer_group': aggregations['by_dealer_group'][:5],
+            'by_manufacturer': aggregations['by_manufacturer'][:5],
+            'by_condition': aggregations['by_condition'],
+            'by_state': aggregations['by_state'][:65],
+        }
+
+    def get_inventory_summary(self, dealer: str = None) -> Dict[str, Any]:
+        """Get summary statistics for inventory (optionally one dealership), LRU-cached per dealer."""
+        return self._cached_response(
+            ('inventory_summary',) + self._filter_key(dealer=dealer),
+            lambda: self._compute_inventory_summary(dealer),
+        )
+
+    def _compute_inventory_summary(self, dealer: str = None) -> Dict[str, Any]:
+        """Count units, makes, models and dealers and summarize prices over the matching inventory rows."""
+        inventory = self._cache.get('inventory')
+        rows = self._select_rows('inventory', [('dealership', dealer)]) if inventory is not None else []
+        if len(rows) == 0:
+            return {
+                'total_units': 0,
+                'unique_makes': 0,
+                'unique_models': 0,
+                'dealers_with_data': 0,
+                'avg_price': 0,
+                'min_price': 0,
+                'max_price': 0,
+                'by_class': {},
+                'by_condition': {},
+            }
+
+        def column(name):
+            return inventory[name].iloc[rows] if name in inventory.columns else pd.Series(dtype=object)
+
+        def counts(name):
+            # Categorical value_counts also lists unused categories
+            values = column(name).value_counts()
+            return {str(key): int(count) for key, count in values[values > 0].items()}
+
+        # Missing and zero prices are left out of the price stats
+        prices = column('price').to_numpy(dtype='float64', na_value=np.nan) if 'price' in inventory.columns else np.array([])
+        prices = prices[prices > 0]
+        return {
+            'total_units': len(rows),
+            'unique_makes': int(column('manufacturer').nunique()),
+            'unique_models': int(column('model').nunique()),
+            'dealers_with_data': int(column('dealership').nunique()),
+            'avg_price': float(prices.mean()) if len(prices) else 0,
+            'min_price': float(prices.min()) if len(prices) else 0,
+            'max_price': float(prices.max()) if len(prices) else 0,
+            'by_class': counts('rv_type'),
+            'by_condition': counts('condition'),
+        }
+
+    def _compute_filtered_aggregations(self) -> Dict[str, Dict[str, Any]]:
+        """Pre-compute aggregations for every condition and rv_type value (called once at startup)."""
+        inventory = self._cache.get('inventory')
+        if inventory is None:
+            return {}
+
+        result = {}
+        for column in ('condition', 'rv_type'):
+            if column not in inventory.columns:
+                continue
+            for value in inventory[column].dropna().unique():
+                # Comma-separated values would be split into a multi-value filter
+                if ',' in value:
+                    continue
+                result[f"{column}:{value}"] = self._build_aggregation_response(**{column: value})
+        return result
+
+    def _compute_filtered_sales_velocity(self) -> Dict[str, Dict[str, Any]]:
+        """Pre-compute sales velocity for every condition and rv_type value (called once at startup)."""
+        sales = self._cache.get('sales')
+        if sales is None:
+            return {}
+
+        result = {}
+        for column in ('condition', 'rv_type'):
+            if column not in sales.columns:
+                continue
+            for value in sales[column].dropna().unique():
+                # Comma-separated values would be split into a multi-value filter
+                if ',' in value:
+                    continue
+                result[f"{column}:{value}"] = self._compute_sales_velocity_filtered(**{column: value})
+        return result
+
+    def _single_filter_key(self, **filters: Optional[str]) -> Optional[str]:
+        """Pre-computed response key ("condition:NEW") when exactly one filter is set, else None."""
+        applied = [(name, value) for name, value in filters.items() if value is not None]
+        if len(applied) != 1:
+            return None
+        return '{}:{}'.format(*applied[0])
+
     def _compute_aggregations_no_filter(self) -> Dict[str, Any]:
         """Pre-compute aggregations for unfiltered requests (called once at startup)."""
         inventory = self._cache.get('inventory')
@@ -254,39 +975,20 @@ class DeltaLakeClient:
         if inventory is None:
             return self._empty_aggregation_response()
 
-        # Calculate totals
-        total_units = len(inventory)
-        total_value = float(inventory['price'].sum()) if 'price' in inventory.columns else 0
-        avg_price = float(inventory['price'].mean()) if 'price' in inventory.columns else 0
-        min_price_val = float(inventory['price'].min()) if 'price' in inventory.columns else 0
-        max_price_val = float(inventory['price'].max()) if 'price' in inventory.columns else 0
-
         # Pre-compute all aggregations
-        result = {
-            'total_units': total_units,
-            'total_value': total_value,
-            'avg_price': avg_price,
-            'min_price': min_price_val,
-            'max_price': max_price_val,
-            'by_rv_type': self._aggregate_by_fast(inventory, 'rv_type'),
-            'by_dealer_group': self._aggregate_by_fast(inventory, 'dealer_group'),
-            'by_manufacturer': self._aggregate_by_fast(inventory, 'manufacturer'),
-            'by_condition': self._aggregate_by_fast(inventory, 'condition'),
-            'by_state': self._aggregate_by_fast(inventory, 'state', limit=65),
-            'by_region': self._aggregate_by_fast(inventory, 'region') if 'region' in inventory.columns else [],
-            'by_city': self._aggregate_by_fast(inventory, 'city') if 'city' in inventory.columns else [],
-            'by_county': self._aggregate_by_fast(inventory, 'county') if 'county' in inventory.columns else [],
-        }
+        result = self._aggregate_inventory(inventory)
 
         # Pre-compute sales velocity
         if sales is not None and 'days_to_sell' in sales.columns:
-            result['avg_days_to_sell'] = float(sales['days_to_sell'].mean())
+            metrics = self._sales_metrics(None)
+            avg_days_to_sell = float(sales['days_to_sell'].mean())
+            result['avg_days_to_sell'] = avg_days_to_sell
             result['sales_velocity'] = {
                 'total_sold': len(sales),
-                'avg_days_to_sell': float(sales['days_to_sell'].mean()),
+                'avg_days_to_sell': avg_days_to_sell,
                 'avg_sale_price': float(sales['sale_price'].mean()) if 'sale_price' in sales.columns else None,
-                'by_rv_type': self._aggregate_sales_by_fast(sales, 'rv_type'),
-                'by_condition': self._aggregate_sales_by_fast(sales, 'condition'),
+                'by_rv_type': self._aggregate_sales_by_fast('rv_type', metrics),
+                'by_condition': self._aggregate_sales_by_fast('condition', metrics),
             }
         else:
             result['avg_days_to_sell'] = None
@@ -300,102 +1002,121 @@ class DeltaLakeClient:
         if sales is None:
             return self._empty_sales_velocity_response()
 
-        df = sales
+        return self._sales_velocity_response(sales, None)
+
+    def _sales_velocity_response(
+        self,
+        sales: pd.DataFrame,
+        rows: Optional[np.ndarray],
+        breakdowns: Tuple[str, ...] = tuple(SALES_VELOCITY_BREAKDOWNS),
+    ) -> Dict[str, Any]:
+        """Build the sales velocity response over the given sales rows (all rows if None), computing only the named breakdowns."""
+        metrics = self._sales_metrics(rows)
+        days = None if metrics['days_to_sell'] is None else pd.Series(metrics['days_to_sell'])
+        prices = None if metrics['sale_price'] is None else pd.Series(metrics['sale_price'])
+        # Rows whose days_to_sell are all null have no integer min/max
+        days_known = days is not None and days.notna().any()
 
         return {
-            'total_sold': len(df),
-            'avg_days_to_sell': float(df['days_to_sell'].mean()) if 'days_to_sell' in df.columns else None,
-            'median_days_to_sell': float(df['days_to_sell'].median()) if 'days_to_sell' in df.columns else None,
-            'min_days_to_sell': int(df['days_to_sell'].min()) if 'days_to_sell' in df.columns else None,
-            'max_days_to_sell': int(df['days_to_sell'].max()) if 'days_to_sell' in df.columns else None,
-            'avg_sale_price': float(df['sale_price'].mean()) if 'sale_price' in df.columns else None,
-            'total_sales_value': float(df['sale_price'].sum()) if 'sale_price' in df.columns else None,
-            'by_rv_type': self._aggregate_sales_by_fast_v2(df, 'rv_type'),
-            'by_condition': self._aggregate_sales_by_fast_v2(df, 'condition'),
-            'by_dealer_group': self._aggregate_sales_by_fast_v2(df, 'dealer_group'),
-            'by_manufacturer': self._aggregate_sales_by_fast_v2(df, 'manufacturer'),
-            'by_state': self._aggregate_sales_by_fast_v2(df, 'state'),
-            'by_region': self._aggregate_sales_by_fast_v2(df, 'region') if 'region' in df.columns else [],
-            'by_month': self._aggregate_sales_by_month_fast(df) if 'calendar_date' in df.columns else [],
+            'total_sold': len(sales) if rows is None else len(rows),
+            'avg_days_to_sell': float(days.mean()) if days is not None else None,
+            'median_days_to_sell': float(days.median()) if days is not None else None,
+            'min_days_to_sell': int(days.min()) if days_known else None,
+            'max_days_to_sell': int(days.max()) if days_known else None,
+            'avg_sale_price': float(prices.mean()) if prices is not None else None,
+            'total_sales_value': float(prices.sum()) if prices is not None else None,
+            **{
+                f'by_{column}': self._aggregate_sales_by_fast_v2(column, metrics) if f'by_{column}' in breakdowns else []
+                for column in ('rv_type', 'condition', 'dealer_group', 'manufacturer', 'state', 'region')
+            },
+            'by_month': (
+                self._aggregate_sales_by_month_fast(metrics)
+                if 'by_month' in breakdowns and 'calendar_date' in sales.columns else []
+            ),
         }
 
-    def _aggregate_sales_by_fast_v2(self, df: pd.DataFrame, column: str, limit: int = None) -> List[Dict]:
-        """Aggregate sales data by a column - optimized version using to_dict."""
-        if column not in df.columns:
-            return []
-
-        agg_dict = {'stock_number': 'count'}
-        if 'days_to_sell' in df.columns:
-            agg_dict['days_to_sell'] = 'mean'
-        if 'sale_price' in df.columns:
-            agg_dict['sale_price'] = ['sum', 'mean']
-
-        grouped = df.groupby(column).agg(agg_dict).reset_index()
+    def _sales_metrics(self, rows: Optional[np.ndarray]) -> Dict[str, Any]:
+        """
+        Gather the per-row sales values of the given rows (all rows if None), with the
+        sums/counts weights nulls-neutralized and the group bins of those rows.
+        """
+        arrays = self._sales_arrays
 
-        # Flatten column names
-        if 'sale_price' in agg_dict:
-            grouped.columns = [column, 'sold_count', 'avg_days_to_sell', 'total_value', 'avg_price']
-        elif 'days_to_sell' in agg_dict:
-            grouped.columns = [column, 'sold_count', 'avg_days_to_sell']
-        else:
-            grouped.columns = [column, 'sold_count']
+        def take(array):
+            return array if array is None or rows is None else array[rows]
 
-        grouped = grouped.sort_values('sold_count', ascending=False)
+        metrics = {
+            'counted': take(arrays['counted']),
+            'bins': {column: (take(bins), uniques) for column, (bins, uniques) in arrays['bins'].items()},
+        }
+        for column in ('days_to_sell', 'sale_price'):
+            values = take(arrays[column])
+            metrics[column] = values
+            if values is not None:
+                present = ~np.isnan(values)
+                metrics[f'{column}_count'] = present.astype('float64')
+                metrics[f'{column}_sum'] = np.where(present, values, 0.0)
+        return metrics
+
+    def _aggregate_sales_by_fast_v2(self, column: str, metrics: Dict[str, Any], limit: int = None) -> List[Dict]:
+        """Aggregate sales data by a column (count, avg days to sell, total and avg price)."""
+        grouped = self._sales_group_stats(column, metrics)
+        if grouped is None:
+            return []
+        # Ties keep category order
+        grouped = grouped.sort_values('sold_count', ascending=False, kind='stable')
 
         if limit:
             grouped = grouped.head(limit)
 
-        # Convert to list of dicts - much faster than iterrows
-        grouped['name'] = grouped[column].fillna('Unknown').astype(str)
-        grouped['sold_count'] = grouped['sold_count'].astype(int)
-
-        cols_to_keep = ['name', 'sold_count']
+        # Groups without any days_to_sell have no average; missing prices count as 0
         if 'avg_days_to_sell' in grouped.columns:
-            cols_to_keep.append('avg_days_to_sell')
-        if 'total_value' in grouped.columns:
-            grouped['total_value'] = grouped['total_value'].fillna(0)
-            cols_to_keep.append('total_value')
+            self._nan_to_none(grouped, 'avg_days_to_sell')
         if 'avg_price' in grouped.columns:
             grouped['avg_price'] = grouped['avg_price'].fillna(0)
-            cols_to_keep.append('avg_price')
-
-        return grouped[cols_to_keep].to_dict('records')
+        return self._to_records(grouped)
 
-    def _aggregate_sales_by_month_fast(self, df: pd.DataFrame) -> List[Dict]:
-        """Aggregate sales by month for trend analysis - optimized version."""
-        if 'month_year' not in df.columns:
+    def _aggregate_sales_by_month_fast(self, metrics: Dict[str, Any]) -> List[Dict]:
+        """Aggregate sales by month for trend analysis (months in ascending order)."""
+        grouped = self._sales_group_stats('month_year', metrics)
+        if grouped is None:
             return []
+        # Labels come back sorted, so months are already in order
+        grouped = grouped.drop(columns='avg_price', errors='ignore')
 
-        agg_dict = {'stock_number': 'count'}
-        if 'days_to_sell' in df.columns:
-            agg_dict['days_to_sell'] = 'mean'
-        if 'sale_price' in df.columns:
-            agg_dict['sale_price'] = 'sum'
-
-        grouped = df.groupby('month_year').agg(agg_dict).reset_index()
-
-        if 'sale_price' in agg_dict:
-            grouped.columns = ['month', 'sold_count', 'avg_days_to_sell', 'total_value']
-        elif 'days_to_sell' in agg_dict:
-            grouped.columns = ['month', 'sold_count', 'avg_days_to_sell']
-        else:
-            grouped.columns = ['month', 'sold_count']
+        if 'avg_days_to_sell' in grouped.columns:
+            self._nan_to_none(grouped, 'avg_days_to_sell')
+        return self._to_records(grouped)
 
-        # Sort by month
-        grouped = grouped.sort_values('month')
+    def _sales_group_stats(self, column: str, metrics: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """
+        Per-group sold_count, avg_days_to_sell, total_value and avg_price of the gathered sales
+        rows, from bincount accumulators over the group bins (observed groups, in label order).
+        Averages are NaN for groups without values; None if no row has a group.
+        """
+        if column not in metrics['bins']:
+            return None
+        bins, uniques = metrics['bins'][column]
+        n = len(uniques) + 1
 
-        # Convert to list of dicts - much faster than iterrows
-        grouped['name'] = grouped['month'].fillna('Unknown').astype(str)
-        grouped['sold_count'] = grouped['sold_count'].astype(int)
+        def bincount(weights=None):
+            return np.bincount(bins, weights=weights, minlength=n)[1:]
 
-        cols_to_keep = ['name', 'sold_count']
-        if 'avg_days_to_sell' in grouped.columns:
-            cols_to_keep.append('avg_days_to_sell')
-        if 'total_value' in grouped.columns:
-            grouped['total_value'] = grouped['total_value'].fillna(0)
-            cols_to_keep.append('total_value')
+        rows = bincount()
+        observed = rows > 0
+        if not observed.any():
+            return None
 
-        return grouped[cols_to_keep].to_dict('records')
+        sold_count = rows if metrics['counted'] is None else bincount(metrics['counted']).astype(np.int64)
+        stats = {'name': np.asarray(uniques, dtype=object).astype(str), 'sold_count': sold_count}
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if metrics['days_to_sell'] is not None:
+                stats['avg_days_to_sell'] = bincount(metrics['days_to_sell_sum']) / bincount(metrics['days_to_sell_count'])
+            if metrics['sale_price'] is not None:
+                total = bincount(metrics['sale_price_sum'])
+                stats['total_value'] = total
+                stats['avg_price'] = total / bincount(metrics['sale_price_count'])
+        return pd.DataFrame(stats)[observed]
 
     def _build_aggregation_response(
         self,
@@ -415,162 +1136,265 @@ class DeltaLakeClient:
             if self._aggregations_cache:
                 return self._aggregations_cache
 
+        # Repeated filter combinations are served from the LRU response cache
+        filters = dict(rv_type=rv_type, dealer_group=dealer_group, manufacturer=manufacturer, condition=condition,
+                       state=state, model=model, floorplan=floorplan, min_price=min_price, max_price=max_price)
+        return self._cached_response(
+            ('aggregations',) + self._filter_key(**filters),
+            lambda: self._compute_aggregation_response(**filters),
+        )
+
+    def _filter_key(self, min_price: float = None, max_price: float = None, **filters: Optional[str]) -> Tuple:
+        """Normalize filters into a hashable key (multi-value order, duplicates and whitespace don't matter)."""
+        active = []
+        for name, value in sorted(filters.items()):
+            values = self._parse_multi_value(value)
+            if values:
+                active.append((name, tuple(sorted(set(values)))))
+        return tuple(active) + (('price', min_price, max_price),)
+
+    def _cached_response(self, key: Tuple, compute) -> Any:
+        """
+        Return the LRU-cached response for key, computing and storing it on a miss.
+
+        Every caller gets its own copy of the response, so none can mutate what others are served.
+        """
+        with self._response_cache_lock:
+            if self._response_cache is None:
+                self._response_cache = OrderedDict()
+            # A cache rebuilt while computing gets nothing computed from the old frames
+            cache = self._response_cache
+            entry = cache.get(key)
+            if entry is not None:
+                cache.move_to_end(key)
+        if entry is not None:
+            return self._thaw_response(entry)
+
+        # Computed outside the lock; concurrent misses on one key may both compute it
+        entry = self._freeze_response(compute())
+        with self._response_cache_lock:
+            cache[key] = entry
+            if len(cache) > RESPONSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return self._thaw_response(entry)
+
+    def _freeze_response(self, response: Any) -> Tuple[str, Any]:
+        """
+        Immutable cache entry for a response: bytes and None as is, anything else JSON-encoded
+        (or kept for deep copies if it isn't JSON-serializable).
+        """
+        if response is None or isinstance(response, bytes):
+            return 'raw', response
+        try:
+            return 'json', orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return 'object', response
+
+    def _thaw_response(self, entry: Tuple[str, Any]) -> Any:
+        """A fresh copy of the response a _freeze_response entry holds."""
+        kind, value = entry
+        if kind == 'json':
+            return orjson.loads(value)
+        if kind == 'object':
+            return copy.deepcopy(value)
+        return value
+
+    def _compute_aggregation_response(
+        self,
+        rv_type: str = None,
+        dealer_group: str = None,
+        manufacturer: str = None,
+        condition: str = None,
+        state: str = None,
+        model: str = None,
+        floorplan: str = None,
+        min_price: float = None,
+        max_price: float = None
+    ) -> Dict[str, Any]:
+        """Compute a filtered aggregation response from the cached inventory and sales."""
         inventory = self._cache.get('inventory')
         if inventory is None:
             return self._empty_aggregation_response()
 
-        # Use view instead of copy when possible, only copy if we need to filter
+        # Use the cached frame directly, only select rows if we need to filter
         has_filters = any(f is not None for f in [rv_type, dealer_group, manufacturer, condition, state, model, floorplan, min_price, max_price])
         df = inventory
 
         if has_filters:
-            # Build mask for filtering (more efficient than chained filtering)
-            mask = pd.Series(True, index=inventory.index)
-
-            if rv_type:
-                values = self._parse_multi_value(rv_type)
-                mask &= inventory['rv_type'].isin(values) if len(values) > 1 else (inventory['rv_type'] == values[0])
-            if dealer_group:
-                values = self._parse_multi_value(dealer_group)
-                mask &= inventory['dealer_group'].isin(values) if len(values) > 1 else (inventory['dealer_group'] == values[0])
-            if manufacturer:
-                values = self._parse_multi_value(manufacturer)
-                mask &= inventory['manufacturer'].isin(values) if len(values) > 1 else (inventory['manufacturer'] == values[0])
-            if condition:
-                values = self._parse_multi_value(condition)
-                mask &= inventory['condition'].isin(values) if len(values) > 1 else (inventory['condition'] == values[0])
-            if state:
-                values = self._parse_multi_value(state)
-                mask &= inventory['state'].isin(values) if len(values) > 1 else (inventory['state'] == values[0])
-            if model and 'model' in inventory.columns:
-                values = self._parse_multi_value(model)
-                mask &= inventory['model'].isin(values) if len(values) > 1 else (inventory['model'] == values[0])
-            if floorplan and 'floorplan' in inventory.columns:
-                values = self._parse_multi_value(floorplan)
-                mask &= inventory['floorplan'].isin(values) if len(values) > 1 else (inventory['floorplan'] == values[0])
-            if min_price is not None:
-                mask &= inventory['price'] >= min_price
-            if max_price is not None:
-                mask &= inventory['price'] <= max_price
-
-            df = inventory[mask]
+            rows = self._select_rows('inventory', [
+                ('floorplan', floorplan),
+                ('model', model),
+                ('dealer_group', dealer_group),
+                ('manufacturer', manufacturer),
+                ('state', state),
+                ('rv_type', rv_type),
+                ('condition', condition),
+            ], min_price, max_price)
+            # Project to the aggregated columns while selecting rows (one take, no full-width copy)
+            columns = [col for col in AGGREGATION_COLUMNS if col in inventory.columns]
+            df = inventory.iloc[rows, inventory.columns.get_indexer(columns)]
 
         if len(df) == 0:
             return self._empty_aggregation_response()
 
-        # Calculate totals
-        total_units = len(df)
-        total_value = float(df['price'].sum()) if 'price' in df.columns else 0
-        avg_price = float(df['price'].mean()) if 'price' in df.columns else 0
-        min_price_val = float(df['price'].min()) if 'price' in df.columns else 0
-        max_price_val = float(df['price'].max()) if 'price' in df.columns else 0
+        # Sales velocity data (only compute if filters applied, otherwise use cached).
+        # One filtered pass over sales serves both the summary and avg_days_to_sell.
+        sales_velocity = self._get_sales_velocity_summary_fast(rv_type, dealer_group, manufacturer, condition, state)
+        return {
+            **self._aggregate_inventory(df),
+            'avg_days_to_sell': sales_velocity.get('avg_days_to_sell'),
+            'sales_velocity': sales_velocity,
+        }
 
+    def _aggregate_inventory(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Compute totals and every GROUPING_SETS breakdown for an inventory frame."""
+        # Numeric arrays and null masks are extracted once and shared by the totals
+        # and every grouping set, so each breakdown is a few bincounts over integer codes
+        metrics = self._inventory_metrics(df)
+        result = {'total_units': len(df)}
+        if 'price' not in df.columns:
+            result.update(total_value=0, avg_price=0, min_price=0, max_price=0)
+        else:
+            # Plain NumPy reductions over the null-neutralized price arrays
+            priced = int(metrics['price_count'].sum())
+            total_value = float(metrics['price_sum'].sum())
+            result['total_value'] = total_value
+            result['avg_price'] = total_value / priced if priced else float('nan')
+            result['min_price'] = float(metrics['price_min'].min()) if priced else float('nan')
+            result['max_price'] = float(metrics['price_max'].max()) if priced else float('nan')
+
+        def breakdown(grouping):
+            column, limit = grouping
+            return self._aggregate_by_codes(df, column, metrics, limit=limit)
+
+        # Small (filtered) frames stay serial: thread hand-off would cost more than it saves
+        if AGGREGATION_WORKERS > 1 and len(df) >= PARALLEL_AGGREGATION_MIN_ROWS:
+            with ThreadPoolExecutor(max_workers=AGGREGATION_WORKERS) as pool:
+                breakdowns = list(pool.map(breakdown, GROUPING_SETS))
+        else:
+            breakdowns = [breakdown(grouping) for grouping in GROUPING_SETS]
+        for (column, _), records in zip(GROUPING_SETS, breakdowns):
+            result[f'by_{column}'] = records
+        return result
+
+    def _inventory_metrics(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Extract the per-row weights aggregated per group, with nulls already neutralized
+        (0 for sums/counts, +/-inf for min/max) so every bincount runs over all rows.
+        """
+        def values(column):
+            if column not in df.columns:
+                return np.full(len(df), np.nan)
+            return df[column].to_numpy(dtype='float64', na_value=np.nan)
+
+        price = values('price')
+        days_on_lot = values('days_on_lot')
+        has_price = ~np.isnan(price)
+        has_days_on_lot = ~np.isnan(days_on_lot)
+        # Every frame aggregated here is a subset of the cached inventory
+        if 'stock_number' not in df.columns or (self._stock_numbers_complete or {}).get('inventory'):
+            counted = None
+        else:
+            counted = df['stock_number'].notna().to_numpy(dtype='float64')
         return {
-            'total_units': total_units,
-            'total_value': total_value,
-            'avg_price': avg_price,
-            'min_price': min_price_val,
-            'max_price': max_price_val,
-            'by_rv_type': self._aggregate_by_fast(df, 'rv_type'),
-            'by_dealer_group': self._aggregate_by_fast(df, 'dealer_group'),
-            'by_manufacturer': self._aggregate_by_fast(df, 'manufacturer'),
-            'by_condition': self._aggregate_by_fast(df, 'condition'),
-            'by_state': self._aggregate_by_fast(df, 'state', limit=65),
-            'by_region': self._aggregate_by_fast(df, 'region') if 'region' in df.columns else [],
-            'by_city': self._aggregate_by_fast(df, 'city') if 'city' in df.columns else [],
-            'by_county': self._aggregate_by_fast(df, 'county') if 'county' in df.columns else [],
-            # Sales velocity data (only compute if filters applied, otherwise use cached)
-            'avg_days_to_sell': self._get_avg_days_to_sell_fast(rv_type, dealer_group, manufacturer, condition, state),
-            'sales_velocity': self._get_sales_velocity_summary_fast(rv_type, dealer_group, manufacturer, condition, state),
+            'counted': counted,
+            'price_count': has_price.astype('float64'),
+            'price_sum': np.where(has_price, price, 0.0),
+            'price_min': np.where(has_price, price, np.inf),
+            'price_max': np.where(has_price, price, -np.inf),
+            'days_on_lot_count': has_days_on_lot.astype('float64'),
+            'days_on_lot_sum': np.where(has_days_on_lot, days_on_lot, 0.0),
         }
 
-    def _aggregate_by_fast(self, df: pd.DataFrame, column: str, limit: int = None) -> List[Dict]:
-        """Aggregate dataframe by column - optimized version using to_dict instead of iterrows."""
+    def _aggregate_by_codes(self, df: pd.DataFrame, column: str, metrics: Dict[str, np.ndarray],
+                            limit: int = None) -> List[Dict]:
+        """Aggregate dataframe by column into fixed-size accumulators indexed by category code."""
         if column not in df.columns:
             return []
 
-        # Group by column
-        grouped = df.groupby(column).agg({
-            'stock_number': 'count',
-            'price': ['sum', 'mean', 'min', 'max'],
-            'days_on_lot': 'mean'
-        }).reset_index()
-
-        # Flatten column names
-        grouped.columns = [column, 'count', 'total_value', 'avg_price', 'min_price', 'max_price', 'avg_days_on_lot']
+        bins, uniques = self._group_bins(df[column])
+        n = len(uniques) + 1
 
-        # Sort by count descending
-        grouped = grouped.sort_values('count', ascending=False)
+        def bincount(weights):
+            return np.bincount(bins, weights=weights, minlength=n)[1:]
 
-        # Limit if specified
-        if limit:
-            grouped = grouped.head(limit)
+        rows = np.bincount(bins, minlength=n)[1:]
+        count = rows if metrics['counted'] is None else bincount(metrics['counted']).astype(np.int64)
+        price_count = bincount(metrics['price_count'])
+        total_value = bincount(metrics['price_sum'])
+        min_price = np.full(n, np.inf)
+        np.minimum.at(min_price, bins, metrics['price_min'])
+        max_price = np.full(n, -np.inf)
+        np.maximum.at(max_price, bins, metrics['price_max'])
 
-        # Convert to list of dicts - much faster than iterrows
-        grouped = grouped.fillna({'total_value': 0, 'avg_price': 0, 'min_price': 0, 'max_price': 0})
-        grouped['name'] = grouped[column].fillna('Unknown').astype(str)
-        grouped['count'] = grouped['count'].astype(int)
+        # Keep only categories present in this frame (groupby observed=True)
+        observed = rows > 0
+        if not observed.any():
+            return []
 
-        return grouped[['name', 'count', 'total_value', 'avg_price', 'min_price', 'max_price', 'avg_days_on_lot']].to_dict('records')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            grouped = pd.DataFrame({
+                'name': np.asarray(uniques, dtype=object).astype(str),
+                'count': count,
+                'total_value': total_value,
+                'avg_price': np.where(price_count > 0, total_value / price_count, 0.0),
+                'min_price': np.where(price_count > 0, min_price[1:], 0.0),
+                'max_price': np.where(price_count > 0, max_price[1:], 0.0),
+                'avg_days_on_lot': bincount(metrics['days_on_lot_sum']) / bincount(metrics['days_on_lot_count']),
+            })[observed]
+
+        # Sort by count descending (partial selection when limited; ties keep category order)
+        if limit:
+            grouped = grouped.nlargest(limit, 'count')
+        else:
+            grouped = grouped.sort_values('count', ascending=False, kind='stable')
 
-    def _aggregate_sales_by_fast(self, df: pd.DataFrame, column: str) -> List[Dict]:
-        """Aggregate sales data by column - optimized version."""
-        if column not in df.columns:
-            return []
+        # Groups without any days_on_lot values have no average
+        self._nan_to_none(grouped, 'avg_days_on_lot')
+        return self._to_records(grouped)
 
-        grouped = df.groupby(column).agg({
-            'stock_number': 'count',
-            'days_to_sell': 'mean',
-            'sale_price': 'mean'
-        }).reset_index()
-        grouped.columns = ['name', 'sold_count', 'avg_days_to_sell', 'avg_sale_price']
-        grouped = grouped.sort_values('sold_count', ascending=False)
-        grouped['name'] = grouped['name'].fillna('Unknown').astype(str)
-        grouped['sold_count'] = grouped['sold_count'].astype(int)
+    def _group_bins(self, series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Bin number per row for bincount-based grouping, plus the group labels.
+        Bins are shifted by one so null rows land in bin 0, which callers drop.
+        """
+        # Categorical codes are used as-is; other dtypes are factorized (sorted, like groupby)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, uniques = pd.factorize(series, sort=True)
+        return codes.astype(np.intp) + 1, uniques
 
-        return grouped.to_dict('records')
+    def _to_records(self, df: pd.DataFrame) -> List[Dict]:
+        """
+        Convert a frame to a list of row dicts like to_dict('records'), but by zipping
+        per-column tolist() output instead of boxing every value row by row.
+        """
+        columns = df.columns.tolist()
+        return [dict(zip(columns, row)) for row in zip(*(df[column].tolist() for column in columns))]
 
-    def _get_avg_days_to_sell_fast(
-        self,
-        rv_type: str = None,
-        dealer_group: str = None,
-        manufacturer: str = None,
-        condition: str = None,
-        state: str = None,
-    ) -> Optional[float]:
-        """Get average days to sell - returns cached value if no filters."""
-        # Return cached if no filters
-        if all(f is None for f in [rv_type, dealer_group, manufacturer, condition, state]):
-            if self._aggregations_cache:
-                return self._aggregations_cache.get('avg_days_to_sell')
+    def _nan_to_none(self, grouped: pd.DataFrame, column: str):
+        """Replace NaN with None in an output column in one pass (NaN isn't valid JSON)."""
+        values = grouped[column]
+        grouped[column] = values.astype(object).where(values.notna(), None)
 
-        sales = self._cache.get('sales')
-        if sales is None or 'days_to_sell' not in sales.columns:
-            return None
+    def _aggregate_by_fast(self, df: pd.DataFrame, column: str, limit: int = None) -> List[Dict]:
+        """Aggregate dataframe by column (count, price stats, avg days on lot)."""
+        return self._aggregate_by_codes(df, column, self._inventory_metrics(df), limit=limit)
 
-        # Build mask instead of chained filtering
-        mask = pd.Series(True, index=sales.index)
-        if rv_type:
-            values = self._parse_multi_value(rv_type)
-            mask &= sales['rv_type'].isin(values)
-        if dealer_group:
-            values = self._parse_multi_value(dealer_group)
-            mask &= sales['dealer_group'].isin(values)
-        if manufacturer:
-            values = self._parse_multi_value(manufacturer)
-            mask &= sales['manufacturer'].isin(values)
-        if condition:
-            values = self._parse_multi_value(condition)
-            mask &= sales['condition'].isin(values)
-        if state:
-            values = self._parse_multi_value(state)
-            mask &= sales['state'].isin(values)
-
-        filtered = sales[mask]
-        if len(filtered) == 0:
-            return None
+    def _aggregate_sales_by_fast(self, column: str, metrics: Dict[str, Any]) -> List[Dict]:
+        """Aggregate sales data by column (count, avg days to sell, avg sale price)."""
+        grouped = self._sales_group_stats(column, metrics)
+        if grouped is None:
+            return []
+        grouped = grouped.rename(columns={'avg_price': 'avg_sale_price'}).drop(columns='total_value')
+        # Ties keep category order, as the groupby did
+        grouped = grouped.sort_values('sold_count', ascending=False, kind='stable')
 
-        return float(filtered['days_to_sell'].mean())
+        # Groups without any values have no average
+        self._nan_to_none(grouped, 'avg_days_to_sell')
+        self._nan_to_none(grouped, 'avg_sale_price')
+        return self._to_records(grouped)
 
     def _get_sales_velocity_summary_fast(
         self,
@@ -590,34 +1414,24 @@ class DeltaLakeClient:
         if sales is None or 'days_to_sell' not in sales.columns:
             return {'total_sold': 0, 'avg_days_to_sell': None, 'avg_sale_price': None, 'by_rv_type': [], 'by_condition': []}
 
-        # Build mask instead of chained filtering
-        mask = pd.Series(True, index=sales.index)
-        if rv_type:
-            values = self._parse_multi_value(rv_type)
-            mask &= sales['rv_type'].isin(values)
-        if dealer_group:
-            values = self._parse_multi_value(dealer_group)
-            mask &= sales['dealer_group'].isin(values)
-        if manufacturer:
-            values = self._parse_multi_value(manufacturer)
-            mask &= sales['manufacturer'].isin(values)
-        if condition:
-            values = self._parse_multi_value(condition)
-            mask &= sales['condition'].isin(values)
-        if state:
-            values = self._parse_multi_value(state)
-            mask &= sales['state'].isin(values)
-
-        df = sales[mask]
-        if len(df) == 0:
+        # Matching row positions, then gather only those rows' values and group bins
+        rows = self._select_rows('sales', [
+            ('dealer_group', dealer_group),
+            ('manufacturer', manufacturer),
+            ('state', state),
+            ('rv_type', rv_type),
+            ('condition', condition),
+        ])
+        if len(rows) == 0:
             return {'total_sold': 0, 'avg_days_to_sell': None, 'avg_sale_price': None, 'by_rv_type': [], 'by_condition': []}
 
+        metrics = self._sales_metrics(rows)
         return {
-            'total_sold': len(df),
-            'avg_days_to_sell': float(df['days_to_sell'].mean()),
-            'avg_sale_price': float(df['sale_price'].mean()) if 'sale_price' in df.columns else None,
-            'by_rv_type': self._aggregate_sales_by_fast(df, 'rv_type'),
-            'by_condition': self._aggregate_sales_by_fast(df, 'condition'),
+            'total_sold': len(rows),
+            'avg_days_to_sell': float(pd.Series(metrics['days_to_sell']).mean()),
+            'avg_sale_price': float(pd.Series(metrics['sale_price']).mean()) if metrics['sale_price'] is not None else None,
+            'by_rv_type': self._aggregate_sales_by_fast('rv_type', metrics),
+            'by_condition': self._aggregate_sales_by_fast('condition', metrics),
         }
 
     def _aggregate_by(self, df: pd.DataFrame, column: str, limit: int = None) -> List[Dict]:
@@ -669,19 +1483,18 @@ class DeltaLakeClient:
         if sales is None or 'days_to_sell' not in sales.columns:
             return None
 
-        df = sales.copy()
-
-        # Apply filters (supports comma-separated multi-values)
-        df = self._apply_filter(df, 'rv_type', rv_type)
-        df = self._apply_filter(df, 'dealer_group', dealer_group)
-        df = self._apply_filter(df, 'manufacturer', manufacturer)
-        df = self._apply_filter(df, 'condition', condition)
-        df = self._apply_filter(df, 'state', state)
-
-        if len(df) == 0:
+        # Matching row positions from the row index (supports comma-separated multi-values)
+        rows = self._select_rows('sales', [
+            ('dealer_group', dealer_group),
+            ('manufacturer', manufacturer),
+            ('state', state),
+            ('rv_type', rv_type),
+            ('condition', condition),
+        ])
+        if len(rows) == 0:
             return None
 
-        return float(df['days_to_sell'].mean())
+        return float(sales['days_to_sell'].iloc[rows].mean())
 
     def _get_sales_velocity_summary(
         self,
@@ -702,14 +1515,15 @@ class DeltaLakeClient:
                 'by_condition': [],
             }
 
-        df = sales.copy()
-
-        # Apply filters (supports comma-separated multi-values)
-        df = self._apply_filter(df, 'rv_type', rv_type)
-        df = self._apply_filter(df, 'dealer_group', dealer_group)
-        df = self._apply_filter(df, 'manufacturer', manufacturer)
-        df = self._apply_filter(df, 'condition', condition)
-        df = self._apply_filter(df, 'state', state)
+        # Matching row positions from the row index (supports comma-separated multi-values)
+        rows = self._select_rows('sales', [
+            ('dealer_group', dealer_group),
+            ('manufacturer', manufacturer),
+            ('state', state),
+            ('rv_type', rv_type),
+            ('condition', condition),
+        ])
+        df = sales.iloc[rows]
 
         if len(df) == 0:
             return {
@@ -723,24 +1537,24 @@ class DeltaLakeClient:
         # Build summary
         by_rv_type = []
         if 'rv_type' in df.columns:
-            velocity = df.groupby('rv_type').agg({
+            velocity = df.groupby('rv_type', observed=True).agg({
                 'stock_number': 'count',
                 'days_to_sell': 'mean',
                 'sale_price': 'mean'
             }).reset_index()
             velocity.columns = ['name', 'sold_count', 'avg_days_to_sell', 'avg_sale_price']
             velocity = velocity.sort_values('sold_count', ascending=False)
-            by_rv_type = velocity.to_dict('records')
+            by_rv_type = self._to_records(velocity)
 
         by_condition = []
         if 'condition' in df.columns:
-            velocity = df.groupby('condition').agg({
+            velocity = df.groupby('condition', observed=True).agg({
                 'stock_number': 'count',
                 'days_to_sell': 'mean',
                 'sale_price': 'mean'
             }).reset_index()
             velocity.columns = ['name', 'sold_count', 'avg_days_to_sell', 'avg_sale_price']
-            by_condition = velocity.to_dict('records')
+            by_condition = self._to_records(velocity)
 
         return {
             'total_sold': len(df),
@@ -761,88 +1575,87 @@ class DeltaLakeClient:
         floorplan: str = None,
         start_date: str = None,
         end_date: str = None,
+        include: str = None,
     ) -> Dict[str, Any]:
         """
         Get comprehensive sales velocity data with filters and date range support.
 
-        Returns detailed velocity breakdown by multiple dimensions.
+        Returns detailed velocity breakdown by multiple dimensions. include (comma-separated
+        SALES_VELOCITY_BREAKDOWNS names) limits which breakdowns are computed; the rest are [].
         """
+        breakdowns = self._sales_velocity_breakdowns(include)
+
         # Return cached result if no filters applied (instant response)
         if all(f is None for f in [rv_type, dealer_group, manufacturer, condition, state, model, floorplan, start_date, end_date]):
             if self._sales_velocity_cache:
-                return self._sales_velocity_cache
+                return self._trim_breakdowns(self._sales_velocity_cache, breakdowns)
+
+        # A single condition or rv_type filter was pre-computed at cache load
+        if self._filtered_sales_velocity_cache:
+            key = self._single_filter_key(
+                rv_type=rv_type, dealer_group=dealer_group, manufacturer=manufacturer, condition=condition,
+                state=state, model=model, floorplan=floorplan, start_date=start_date, end_date=end_date,
+            )
+            if key in self._filtered_sales_velocity_cache:
+                return self._trim_breakdowns(self._filtered_sales_velocity_cache[key], breakdowns)
+
+        # Repeated filter combinations and date ranges are served from the LRU response cache
+        filters = dict(rv_type=rv_type, dealer_group=dealer_group, manufacturer=manufacturer, condition=condition,
+                       state=state, model=model, floorplan=floorplan)
+        return self._cached_response(
+            ('sales_velocity', breakdowns) + self._filter_key(**filters) + (('dates', start_date, end_date),),
+            lambda: self._compute_sales_velocity_filtered(
+                start_date=start_date, end_date=end_date, breakdowns=breakdowns, **filters
+            ),
+        )
 
+    def _sales_velocity_breakdowns(self, include: str = None) -> Tuple[str, ...]:
+        """SALES_VELOCITY_BREAKDOWNS named in a comma-separated include (all of them if None; unknown names are ignored)."""
+        if include is None:
+            return tuple(SALES_VELOCITY_BREAKDOWNS)
+        names = set(self._parse_multi_value(include))
+        return tuple(name for name in SALES_VELOCITY_BREAKDOWNS if name in names)
+
+    def _trim_breakdowns(self, response: Dict[str, Any], breakdowns: Tuple[str, ...]) -> Dict[str, Any]:
+        """A sales velocity response with the breakdowns not in breakdowns emptied."""
+        if len(breakdowns) == len(SALES_VELOCITY_BREAKDOWNS):
+            return response
+        return {**response, **{name: [] for name in SALES_VELOCITY_BREAKDOWNS if name not in breakdowns}}
+
+    def _compute_sales_velocity_filtered(
+        self,
+        rv_type: str = None,
+        dealer_group: str = None,
+        manufacturer: str = None,
+        condition: str = None,
+        state: str = None,
+        model: str = None,
+        floorplan: str = None,
+        start_date: str = None,
+        end_date: str = None,
+        breakdowns: Tuple[str, ...] = tuple(SALES_VELOCITY_BREAKDOWNS),
+    ) -> Dict[str, Any]:
+        """Compute a filtered sales velocity response (only the named breakdowns) from the cached sales."""
         sales = self._cache.get('sales')
         if sales is None:
             return self._empty_sales_velocity_response()
 
-        # Use mask-based filtering instead of chained .copy()
-        has_filters = any(f is not None for f in [rv_type, dealer_group, manufacturer, condition, state, model, floorplan, start_date, end_date])
-
-        if has_filters:
-            mask = pd.Series(True, index=sales.index)
-
-            if rv_type:
-                values = self._parse_multi_value(rv_type)
-                mask &= sales['rv_type'].isin(values) if len(values) > 1 else (sales['rv_type'] == values[0])
-            if dealer_group:
-                values = self._parse_multi_value(dealer_group)
-                mask &= sales['dealer_group'].isin(values) if len(values) > 1 else (sales['dealer_group'] == values[0])
-            if manufacturer:
-                values = self._parse_multi_value(manufacturer)
-                mask &= sales['manufacturer'].isin(values) if len(values) > 1 else (sales['manufacturer'] == values[0])
-            if condition:
-                values = self._parse_multi_value(condition)
-                mask &= sales['condition'].isin(values) if len(values) > 1 else (sales['condition'] == values[0])
-            if state:
-                values = self._parse_multi_value(state)
-                mask &= sales['state'].isin(values) if len(values) > 1 else (sales['state'] == values[0])
-            if model and 'model' in sales.columns:
-                values = self._parse_multi_value(model)
-                mask &= sales['model'].isin(values) if len(values) > 1 else (sales['model'] == values[0])
-            if floorplan and 'floorplan' in sales.columns:
-                values = self._parse_multi_value(floorplan)
-                mask &= sales['floorplan'].isin(values) if len(values) > 1 else (sales['floorplan'] == values[0])
-
-            # Apply date filters
-            if 'calendar_date' in sales.columns:
-                if start_date:
-                    try:
-                        start_dt = pd.to_datetime(start_date)
-                        mask &= pd.to_datetime(sales['calendar_date']) >= start_dt
-                    except Exception:
-                        pass
-                if end_date:
-                    try:
-                        end_dt = pd.to_datetime(end_date)
-                        mask &= pd.to_datetime(sales['calendar_date']) <= end_dt
-                    except Exception:
-                        pass
-
-            df = sales[mask]
-        else:
-            df = sales
-
-        if len(df) == 0:
+        # Matching row positions from the row index, then the date range on those rows only
+        rows = self._select_rows('sales', [
+            ('floorplan', floorplan),
+            ('model', model),
+            ('dealer_group', dealer_group),
+            ('manufacturer', manufacturer),
+            ('state', state),
+            ('rv_type', rv_type),
+            ('condition', condition),
+        ])
+        rows = self._filter_date_range(sales, rows, start_date, end_date)
+        if len(rows) == 0:
             return self._empty_sales_velocity_response()
 
-        # Build comprehensive response using optimized aggregation methods
-        return {
-            'total_sold': len(df),
-            'avg_days_to_sell': float(df['days_to_sell'].mean()) if 'days_to_sell' in df.columns else None,
-            'median_days_to_sell': float(df['days_to_sell'].median()) if 'days_to_sell' in df.columns else None,
-            'min_days_to_sell': int(df['days_to_sell'].min()) if 'days_to_sell' in df.columns else None,
-            'max_days_to_sell': int(df['days_to_sell'].max()) if 'days_to_sell' in df.columns else None,
-            'avg_sale_price': float(df['sale_price'].mean()) if 'sale_price' in df.columns else None,
-            'total_sales_value': float(df['sale_price'].sum()) if 'sale_price' in df.columns else None,
-            'by_rv_type': self._aggregate_sales_by_fast_v2(df, 'rv_type'),
-            'by_condition': self._aggregate_sales_by_fast_v2(df, 'condition'),
-            'by_dealer_group': self._aggregate_sales_by_fast_v2(df, 'dealer_group'),
-            'by_manufacturer': self._aggregate_sales_by_fast_v2(df, 'manufacturer'),
-            'by_state': self._aggregate_sales_by_fast_v2(df, 'state'),
-            'by_region': self._aggregate_sales_by_fast_v2(df, 'region') if 'region' in df.columns else [],
-            'by_month': self._aggregate_sales_by_month_fast(df) if 'calendar_date' in df.columns else [],
-        }
+        # The breakdowns gather just these rows from the cached sales arrays
+        return self._sales_velocity_response(sales, rows, breakdowns)
 
     def _aggregate_sales_by(self, df: pd.DataFrame, column: str, limit: int = None) -> List[Dict]:
         """Aggregate sales data by a column."""
@@ -855,7 +1668,7 @@ class DeltaLakeClient:
         if 'sale_price' in df.columns:
             agg_dict['sale_price'] = ['sum', 'mean']
 
-        grouped = df.groupby(column).agg(agg_dict).reset_index()
+        grouped = df.groupby(column, observed=True).agg(agg_dict).reset_index()
 
         # Flatten column names
         if 'sale_price' in agg_dict:
@@ -870,21 +1683,20 @@ class DeltaLakeClient:
         if limit:
             grouped = grouped.head(limit)
 
-        results = []
-        for _, row in grouped.iterrows():
-            item = {
-                'name': str(row[column]) if pd.notna(row[column]) else 'Unknown',
-                'sold_count': int(row['sold_count']),
-            }
-            if 'avg_days_to_sell' in grouped.columns:
-                item['avg_days_to_sell'] = float(row['avg_days_to_sell']) if pd.notna(row['avg_days_to_sell']) else None
-            if 'total_value' in grouped.columns:
-                item['total_value'] = float(row['total_value']) if pd.notna(row['total_value']) else 0
-            if 'avg_price' in grouped.columns:
-                item['avg_price'] = float(row['avg_price']) if pd.notna(row['avg_price']) else 0
-            results.append(item)
+        # Columns to Python lists once, then zip - no per-row Series like iterrows
+        names = grouped[column].astype(object).where(grouped[column].notna(), 'Unknown').astype(str).tolist()
+        fields = {'sold_count': [int(count) for count in grouped['sold_count'].tolist()]}
+        if 'avg_days_to_sell' in grouped.columns:
+            fields['avg_days_to_sell'] = [None if pd.isna(days) else float(days) for days in grouped['avg_days_to_sell'].tolist()]
+        if 'total_value' in grouped.columns:
+            fields['total_value'] = [float(value) if pd.notna(value) else 0 for value in grouped['total_value'].tolist()]
+        if 'avg_price' in grouped.columns:
+            fields['avg_price'] = [float(value) if pd.notna(value) else 0 for value in grouped['avg_price'].tolist()]
 
-        return results
+        return [
+            {'name': name, **dict(zip(fields, values))}
+            for name, *values in zip(names, *fields.values())
+        ]
 
     def _aggregate_sales_by_month(self, df: pd.DataFrame) -> List[Dict]:
         """Aggregate sales by month for trend analysis."""
@@ -909,19 +1721,18 @@ class DeltaLakeClient:
         # Sort by month
         grouped = grouped.sort_values('month')
 
-        results = []
-        for _, row in grouped.iterrows():
-            item = {
-                'name': str(row['month']) if pd.notna(row['month']) else 'Unknown',
-                'sold_count': int(row['sold_count']),
-            }
-            if 'avg_days_to_sell' in grouped.columns:
-                item['avg_days_to_sell'] = float(row['avg_days_to_sell']) if pd.notna(row['avg_days_to_sell']) else None
-            if 'total_value' in grouped.columns:
-                item['total_value'] = float(row['total_value']) if pd.notna(row['total_value']) else 0
-            results.append(item)
+        # Columns to Python lists once, then zip - no per-row Series like iterrows
+        names = grouped['month'].astype(object).where(grouped['month'].notna(), 'Unknown').astype(str).tolist()
+        fields = {'sold_count': [int(count) for count in grouped['sold_count'].tolist()]}
+        if 'avg_days_to_sell' in grouped.columns:
+            fields['avg_days_to_sell'] = [None if pd.isna(days) else float(days) for days in grouped['avg_days_to_sell'].tolist()]
+        if 'total_value' in grouped.columns:
+            fields['total_value'] = [float(value) if pd.notna(value) else 0 for value in grouped['total_value'].tolist()]
 
-        return results
+        return [
+            {'name': name, **dict(zip(fields, values))}
+            for name, *values in zip(names, *fields.values())
+        ]
 
     def _empty_sales_velocity_response(self) -> Dict[str, Any]:
         """Return empty sales velocity response."""
@@ -948,7 +1759,7 @@ class DeltaLakeClient:
         if sales is None or 'calendar_date' not in sales.columns:
             return {'min_date': None, 'max_date': None}
 
-        dates = pd.to_datetime(sales['calendar_date'])
+        dates = sales['calendar_date']
         return {
             'min_date': dates.min().strftime('%Y-%m-%d') if not dates.empty else None,
             'max_date': dates.max().strftime('%Y-%m-%d') if not dates.empty else None,
@@ -969,50 +1780,38 @@ class DeltaLakeClient:
         - TRAVEL TRAILER (Towable)
         - Other categories
         """
+        # Repeated date ranges are served from the LRU response cache
+        return self._cached_response(
+            ('top_floorplans', start_date, end_date, limit),
+            lambda: self._compute_top_floorplans(start_date, end_date, limit),
+        )
+
+    def _compute_top_floorplans(self, start_date: str = None, end_date: str = None, limit: int = 10) -> Dict[str, Any]:
+        """Compute the top floorplans of each RV type category from the cached sales."""
         sales = self._cache.get('sales')
         if sales is None or 'floorplan' not in sales.columns:
             return self._empty_top_floorplans_response()
 
-        # Use mask-based filtering for date range
+        # Date range narrows row positions without building a full-length mask first
         has_date_filters = start_date is not None or end_date is not None
 
-        if has_date_filters and 'calendar_date' in sales.columns:
-            mask = pd.Series(True, index=sales.index)
-            if start_date:
-                try:
-                    start_dt = pd.to_datetime(start_date)
-                    mask &= pd.to_datetime(sales['calendar_date']) >= start_dt
-                except Exception:
-                    pass
-            if end_date:
-                try:
-                    end_dt = pd.to_datetime(end_date)
-                    mask &= pd.to_datetime(sales['calendar_date']) <= end_dt
-                except Exception:
-                    pass
-            df = sales[mask]
+        if has_date_filters:
+            rows = self._filter_date_range(sales, np.arange(len(sales)), start_date, end_date)
+            # Take only the matching rows of the columns the breakdown reads
+            columns = [col for col in TOP_FLOORPLANS_COLUMNS if col in sales.columns]
+            df = sales.iloc[rows, sales.columns.get_indexer(columns)]
         else:
+            rows = None
             df = sales
 
         if len(df) == 0:
             return self._empty_top_floorplans_response()
 
-        # Define RV type categories
-        categories = {
-            'CLASS A': ['CLASS A'],
-            'CLASS B': ['CLASS B'],
-            'CLASS C': ['CLASS C'],
-            'FIFTH WHEEL': ['FIFTH WHEEL'],
-            'TRAVEL TRAILER': ['TRAVEL TRAILER'],
-            'OTHER': []  # Will capture everything else
-        }
-
-        # Get all unique RV types
+        # Named categories hold their own rv_type; OTHER captures every other rv_type present
         all_rv_types = df['rv_type'].dropna().unique().tolist() if 'rv_type' in df.columns else []
-        categorized = set()
-        for cat_types in categories.values():
-            categorized.update(cat_types)
-        categories['OTHER'] = [t for t in all_rv_types if t not in categorized]
+        named = FLOORPLAN_CATEGORIES[:-1]
+        categories = {category: [category] for category in named}
+        categories['OTHER'] = [t for t in all_rv_types if t not in named]
 
         result = {
             'total_sold': len(df),
@@ -1022,42 +1821,52 @@ class DeltaLakeClient:
                 'end_date': end_date
             }
         }
+        if self._floorplan_categories is None:
+            return result
+
+        # Each row's category as a grouping key (rows without an rv_type belong to none)
+        codes = self._floorplan_categories if rows is None else self._floorplan_categories[rows]
+        category = pd.Series(
+            pd.Categorical.from_codes(codes, categories=FLOORPLAN_CATEGORIES), index=df.index, name='category'
+        )
+
+        # One grouping pass for every category's floorplans, and one for the category totals
+        # observed=True keeps categorical keys from expanding to their cartesian product
+        stats = df.groupby([category, df['floorplan'], df['manufacturer'], df['model']], observed=True).agg({
+            'stock_number': 'count',
+            'days_to_sell': 'mean',
+            'sale_price': ['sum', 'mean']
+        }).reset_index()
+        stats.columns = ['category', 'floorplan', 'manufacturer', 'model', 'sold_count', 'avg_days_to_sell', 'total_value', 'avg_price']
+        totals = df.groupby(category, observed=True).agg({'stock_number': 'count', 'days_to_sell': 'mean'})
+        floorplans_by_category = dict(iter(stats.groupby('category', observed=True, sort=False)))
 
         # Build top floorplans for each category
-        for category, rv_types in categories.items():
-            if not rv_types:
+        for category_name, rv_types in categories.items():
+            if not rv_types or category_name not in totals.index:
                 continue
 
-            cat_df = df[df['rv_type'].isin(rv_types)]
-            if len(cat_df) == 0:
+            floorplan_stats = floorplans_by_category.get(category_name)
+            if floorplan_stats is None:
                 continue
-
-            # Group by floorplan and aggregate
-            floorplan_stats = cat_df.groupby(['floorplan', 'manufacturer', 'model']).agg({
-                'stock_number': 'count',
-                'days_to_sell': 'mean',
-                'sale_price': ['sum', 'mean']
-            }).reset_index()
-
-            floorplan_stats.columns = ['floorplan', 'manufacturer', 'model', 'sold_count', 'avg_days_to_sell', 'total_value', 'avg_price']
             floorplan_stats = floorplan_stats.sort_values('sold_count', ascending=False).head(limit)
 
-            # Convert to list of dicts - much faster than iterrows
-            floorplan_stats['floorplan'] = floorplan_stats['floorplan'].fillna('Unknown').astype(str)
-            floorplan_stats['manufacturer'] = floorplan_stats['manufacturer'].fillna('Unknown').astype(str)
-            floorplan_stats['model'] = floorplan_stats['model'].fillna('Unknown').astype(str)
+            # Convert to list of dicts from per-column lists - much faster than iterrows
+            floorplan_stats['floorplan'] = floorplan_stats['floorplan'].astype(object).fillna('Unknown').astype(str)
+            floorplan_stats['manufacturer'] = floorplan_stats['manufacturer'].astype(object).fillna('Unknown').astype(str)
+            floorplan_stats['model'] = floorplan_stats['model'].astype(object).fillna('Unknown').astype(str)
             floorplan_stats['sold_count'] = floorplan_stats['sold_count'].astype(int)
             floorplan_stats['total_value'] = floorplan_stats['total_value'].fillna(0)
             floorplan_stats['avg_price'] = floorplan_stats['avg_price'].fillna(0)
-            category_items = floorplan_stats[['floorplan', 'manufacturer', 'model', 'sold_count', 'avg_days_to_sell', 'total_value', 'avg_price']].to_dict('records')
+            category_items = self._to_records(floorplan_stats[['floorplan', 'manufacturer', 'model', 'sold_count', 'avg_days_to_sell', 'total_value', 'avg_price']])
 
             if category_items:
                 # Use 'floorplans' key to match frontend TypeScript interface
                 result['categories'].append({
-                    'category': category,
+                    'category': category_name,
                     'rv_types': rv_types,
-                    'total_sold': int(cat_df['stock_number'].count()),
-                    'avg_days_to_sell': float(cat_df['days_to_sell'].mean()) if 'days_to_sell' in cat_df.columns else None,
+                    'total_sold': int(totals.at[category_name, 'stock_number']),
+                    'avg_days_to_sell': float(totals.at[category_name, 'days_to_sell']),
                     'floorplans': category_items
                 })
 
@@ -1070,3 +1879,7 @@ class DeltaLakeClient:
             'categories': [],
             'date_range': {'start_date': None, 'end_date': None}
         }
+
+
+# Shared client instance - import this rather than constructing DeltaLakeClient
+client = DeltaLakeClient()
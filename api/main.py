@@ -7,16 +7,27 @@ Run with: uvicorn main:app --reload --port 8000
 Environment variables:
     USE_DELTALAKE=true  - Use Delta Lake direct access (50s startup)
     USE_DELTALAKE=false - Use GraphQL API (20-25 min startup, default)
+    GRAPHQL_CACHE_DIR   - Where GraphQL mode snapshots the dimension and aggregation caches (empty disables)
 """
 
+import hashlib
 import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
-import requests
+import httpx
+import numpy as np
+import orjson
+import pandas as pd
 from azure.identity import DefaultAzureCredential
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -24,13 +35,141 @@ from pydantic import BaseModel
 USE_DELTALAKE = os.getenv('USE_DELTALAKE', 'false').lower() == 'true'
 
 if USE_DELTALAKE:
-    from deltalake_adapter import DeltaLakeClient
+    from deltalake_adapter import client as deltalake_client
 
 # Configuration
 WORKSPACE_ID = "9c727ce4-5f7e-4008-b31e-f3e3bd8e0adc"
 GRAPHQL_ID = "5c282d47-9d39-475c-ba43-5145fdc021b8"
 GRAPHQL_ENDPOINT = f"https://{WORKSPACE_ID.replace('-', '')}.z9c.graphql.fabric.microsoft.com/v1/workspaces/{WORKSPACE_ID}/graphqlapis/{GRAPHQL_ID}/graphql"
 
+# (connect, read) timeout in seconds - full-table dimension queries can take minutes to return
+GRAPHQL_TIMEOUT = httpx.Timeout(300.0, connect=5.0)
+
+# Keep-alive connections to the GraphQL endpoint - HTTP/2 multiplexes concurrent batch queries on few of them
+GRAPHQL_POOL_SIZE = 32
+
+# Throttled or failed queries are retried this many times (with exponential backoff) on these statuses
+GRAPHQL_RETRIES = 3
+GRAPHQL_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Independent batch queries (dimension lookups by skey) in flight at once
+GRAPHQL_MAX_WORKERS = 10
+
+# Pre-computed filter aggregations built at once at startup (each runs up to three queries itself)
+FILTER_CACHE_WORKERS = 4
+
+# Skey batches sent as aliased fields of one GraphQL document (kept small for the query complexity limit)
+BATCHES_PER_QUERY = 4
+
+# Aggregated summaries per filter combination are reused for this many seconds (at most this many kept)
+SUMMARIES_CACHE_TTL = 15 * 60
+SUMMARIES_CACHE_SIZE = 256
+
+# Dimension rows fetched by skey are reused for this many seconds (at most this many rows kept)
+DIMENSION_CACHE_TTL = 15 * 60
+DIMENSION_CACHE_SIZE = 200000
+
+# Snapshot of the dimension caches reused across restarts while younger than DIMENSION_SNAPSHOT_TTL seconds (empty string disables).
+# Snapshots are JSON, in a directory only this user may write to
+DIMENSION_SNAPSHOT_DIR = os.getenv('GRAPHQL_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'graphql_cache'))
+DIMENSION_SNAPSHOT_TTL = 60 * 60
+
+# The aggregation caches are snapshotted there too, reused while younger than this and the inventory totals
+# (per condition, product model and dealership) are unchanged. Edits to dimension rows alone (a dealership
+# changing dealer_group or state) don't change those totals, so they show up once the snapshot expires
+AGGREGATION_SNAPSHOT_TTL = 6 * 60 * 60
+
+# Dimension filters pushed down to the fact query as skey lists, when they match at most this many skeys
+# (sent in chunks of 100, the GraphQL IN operator limit)
+MAX_PUSHDOWN_SKEYS = 1000
+
+# Dimension fields that can be pushed down, with the fact table key they resolve to
+SKEY_FILTER_FIELDS = {
+    "rv_type": "dim_product_model_skey",
+    "manufacturer": "dim_product_model_skey",
+    "dealership": "dim_dealership_skey",
+    "dealer_group": "dim_dealership_skey",
+    "state": "dim_dealership_skey",
+}
+
+# Inventory page for get_inventory - constant text with the filter as a variable, so Fabric can reuse its parsed plan
+# NOTE: Excludes manufacturer_logo_small to avoid 64MB response limit
+INVENTORY_QUERY = """
+query Inventory($first: Int!, $filter: fact_inventory_currentsFilterInput) {
+    fact_inventory_currents(first: $first, orderBy: { price: DESC }, filter: $filter) {
+        items {
+            stock_number
+            condition
+            price
+            days_on_lot
+            dim_product_models {
+                rv_type
+                manufacturer
+                model
+                model_year
+                floorplan
+            }
+            dim_dealerships {
+                dealership
+                dealer_group
+                city
+                state
+            }
+        }
+    }
+}
+"""
+
+# Breakdown fields of the aggregation caches, by the dimension table (and fact table skey) they come from
+SKEY_BREAKDOWNS = [
+    ("dim_product_model_skey", "dim_product_models", ["rv_type", "manufacturer"]),
+    ("dim_dealership_skey", "dim_dealerships", ["dealer_group", "state", "region", "city", "county"]),
+]
+
+# Per-condition, per-product-model and per-dealership totals of all inventory. The conditions feed the
+# aggregations cache; all three are the version the aggregation snapshot is checked against, so units
+# moving between dealers, models (rv_type, manufacturer) or conditions invalidate it
+INVENTORY_TOTALS_QUERY = """
+{
+    conditions: fact_inventory_currents(first: 100) {
+        groupBy(fields: [condition]) {
+            fields { condition }
+            aggregations {
+                count(field: price)
+                sum(field: price)
+                avg(field: price)
+                min(field: price)
+                max(field: price)
+            }
+        }
+    }
+    products: fact_inventory_currents(first: 100000) {
+        groupBy(fields: [dim_product_model_skey]) {
+            fields { dim_product_model_skey }
+            aggregations {
+                count(field: price)
+                sum(field: price)
+            }
+        }
+    }
+    dealers: fact_inventory_currents(first: 100000) {
+        groupBy(fields: [dim_dealership_skey]) {
+            fields { dim_dealership_skey }
+            aggregations {
+                count(field: price)
+                sum(field: price)
+            }
+        }
+    }
+}
+"""
+
+# Inventory cache fields kept as column arrays so filters run as vectorized compares
+INVENTORY_FILTER_FIELDS = ["dealership", "dealer_group", "rv_type", "manufacturer", "condition", "state"]
+
+# Further inventory columns kept as arrays only to be grouped by in the filtered aggregations
+INVENTORY_BREAKDOWN_FIELDS = ["region", "city", "county"]
+
 
 app = FastAPI(
     title="RV Market Intelligence API",
@@ -48,6 +187,257 @@ app.add_middleware(
 )
 
 
+def _intern(value):
+    """Intern dimension strings so repeated values share one object (None passes through)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _snapshot_path(name: str) -> str:
+    """Path of a snapshot file in DIMENSION_SNAPSHOT_DIR, creating the directory private to this user.
+
+    Raises PermissionError if the directory (e.g. one planted in the shared temp dir) belongs
+    to another user or others can write to it.
+    """
+    os.makedirs(DIMENSION_SNAPSHOT_DIR, mode=0o700, exist_ok=True)
+    _check_snapshot_owner(os.lstat(DIMENSION_SNAPSHOT_DIR), DIMENSION_SNAPSHOT_DIR)
+    return os.path.join(DIMENSION_SNAPSHOT_DIR, name)
+
+
+def _check_snapshot_owner(st: os.stat_result, path: str):
+    """Raise PermissionError unless path is owned by this user and not writable by anyone else (POSIX only)."""
+    if not hasattr(os, "getuid"):
+        return
+    if stat.S_ISLNK(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} must be owned by this user and not writable by others")
+
+
+def _read_snapshot(name: str, ttl: float):
+    """Parse the snapshot written by _write_snapshot if it is younger than ttl seconds (None if missing or older)."""
+    try:
+        with open(_snapshot_path(name), 'rb') as f:
+            st = os.fstat(f.fileno())
+            _check_snapshot_owner(st, f.name)
+            if datetime.now().timestamp() - st.st_mtime >= ttl:
+                return None
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _write_snapshot(name: str, data):
+    """Write data as a JSON snapshot file readable and writable only by this user, replacing it atomically."""
+    path = _snapshot_path(name)
+    fd = os.open(f"{path}.tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+    os.replace(f"{path}.tmp", path)
+
+
+def _graphql_value(value) -> str:
+    """Render a filter value (dicts, lists, strings, numbers) as a GraphQL literal."""
+    if isinstance(value, dict):
+        return "{ " + ", ".join(f"{k}: {_graphql_value(v)}" for k, v in value.items()) + " }"
+    if isinstance(value, list):
+        return "[" + ", ".join(_graphql_value(v) for v in value) + "]"
+    if isinstance(value, str):
+        return orjson.dumps(value).decode()
+    return str(value)
+
+
+def _filter_argument(filters: list[str], combined: list[dict] = ()) -> str:
+    """Build the ', filter: {...}' argument from field filters and whole filter objects."""
+    if len(combined) == 1 and not filters:
+        return f", filter: {_graphql_value(combined[0])}"
+    if combined:
+        # Filter objects (skey lists, or-groups) can't share one object, so everything is and-ed
+        objects = [f"{{ {f} }}" for f in filters] + [_graphql_value(f) for f in combined]
+        return f", filter: {{ and: [{', '.join(objects)}] }}"
+    if filters:
+        return f", filter: {{ {', '.join(filters)} }}"
+    return ""
+
+
+def _inventory_version(totals: dict) -> str:
+    """Fingerprint of the inventory from its INVENTORY_TOTALS_QUERY results."""
+    rows = sorted(
+        (alias, str(g.get("fields")), *(round(value or 0) for _, value in sorted(g.get("aggregations", {}).items())))
+        for alias in ("conditions", "products", "dealers")
+        for g in (totals.get(alias) or {}).get("groupBy", [])
+    )
+    return hashlib.sha1(repr(rows).encode()).hexdigest()
+
+
+def _group_by_query(field: str, filter_str: str = "") -> str:
+    """Inventory price count/sum/avg grouped by one fact table field."""
+    return f"""
+    {{
+        fact_inventory_currents(first: 100000{filter_str}) {{
+            groupBy(fields: [{field}]) {{
+                fields {{ {field} }}
+                aggregations {{
+                    count(field: price)
+                    sum(field: price)
+                    avg(field: price)
+                }}
+            }}
+        }}
+    }}
+    """
+
+
+def _weight_by_count(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the weighted/priced_count columns _format_breakdown averages prices with."""
+    # Group average prices are weighted by count, over the groups with a positive average
+    priced = df["avg"] > 0
+    df["weighted"] = (df["avg"] * df["count"]).where(priced, 0)
+    df["priced_count"] = df["count"].where(priced, 0)
+    return df
+
+
+def _field_groups(groups: list, field: str) -> pd.DataFrame:
+    """One row per value of a field grouped by in Fabric, shaped like _skey_aggregations rows."""
+    fields = [g.get("fields", {}) for g in groups]
+    aggs = [g.get("aggregations", {}) for g in groups]
+    df = pd.DataFrame({
+        field: pd.Series([f.get(field) for f in fields], dtype=object),
+        "count": [a.get("count") or 0 for a in aggs],
+        "total_value": [a.get("sum") or 0 for a in aggs],
+        "avg": [a.get("avg") or 0 for a in aggs],
+    })
+    return _weight_by_count(df)
+
+
+def _has_value(column: pd.Series) -> pd.Series:
+    """Mask of the rows with a dimension value (not None and not empty)."""
+    return column.notna() & (column != "")
+
+
+def _format_breakdown(df: pd.DataFrame, column: str, limit: Optional[int] = None) -> list[dict]:
+    """Sum per-skey aggregation rows (see _skey_aggregations) by a dimension column, largest count first."""
+    keyed = df[_has_value(df[column])]
+    if keyed.empty:
+        return []
+    # Dense codes in first-seen order, then one bincount reduction per measure
+    codes, names = pd.factorize(keyed[column], sort=False)
+    size = len(names)
+    counts = np.bincount(codes, weights=keyed["count"].to_numpy(dtype=np.float64), minlength=size).astype(np.int64)
+    total_values = np.bincount(codes, weights=keyed["total_value"].to_numpy(dtype=np.float64), minlength=size)
+    weighted = np.bincount(codes, weights=keyed["weighted"].to_numpy(dtype=np.float64), minlength=size)
+    priced_counts = np.bincount(codes, weights=keyed["priced_count"].to_numpy(dtype=np.float64), minlength=size)
+    # Stable, so groups with equal counts keep first-seen order
+    order = np.argsort(-counts, kind="stable")
+    if limit:
+        order = order[:limit]
+    return [
+        {
+            "name": name,
+            "count": count,
+            "total_value": total_value,
+            "avg_price": weight / priced_count if priced_count > 0 else 0,
+            "min_price": 0,
+            "max_price": 0,
+        }
+        for name, count, total_value, weight, priced_count in zip(
+            names[order].tolist(),
+            counts[order].tolist(),
+            total_values[order].tolist(),
+            weighted[order].tolist(),
+            priced_counts[order].tolist(),
+        )
+    ]
+
+
+def _inventory_breakdown(column: pd.Categorical, prices: np.ndarray, limit: Optional[int] = None, with_prices: bool = False) -> list[dict]:
+    """Count/total per value of a filtered inventory column, largest count first.
+
+    With with_prices, avg/min/max are taken over the positive prices; otherwise avg
+    is total/count and min/max are 0.
+    """
+    # Rows with a value (missing codes are -1 and index the trailing False)
+    named = np.append(np.asarray(column.categories != ""), False)
+    valid = named[column.codes]
+    codes, prices = column.codes[valid], prices[valid]
+    if not len(codes):
+        return []
+    size = len(column.categories)
+    counts = np.bincount(codes, minlength=size)
+    totals = np.bincount(codes, weights=prices, minlength=size)
+
+    # Groups in first-seen order, then stable by count so ties keep that order
+    groups, first = np.unique(codes, return_index=True)
+    groups = groups[np.argsort(first)]
+    groups = groups[np.argsort(-counts[groups], kind="stable")]
+    if limit:
+        groups = groups[:limit]
+
+    if with_prices:
+        positive = prices > 0
+        priced_codes, priced = codes[positive], prices[positive]
+        price_counts = np.bincount(priced_codes, minlength=size)
+        price_sums = np.bincount(priced_codes, weights=priced, minlength=size)
+        min_prices = np.full(size, np.inf)
+        np.minimum.at(min_prices, priced_codes, priced)
+        max_prices = np.full(size, -np.inf)
+        np.maximum.at(max_prices, priced_codes, priced)
+
+    result = []
+    for code, name in zip(groups.tolist(), column.categories[groups].tolist()):
+        count, total = int(counts[code]), float(totals[code])
+        if with_prices and price_counts[code]:
+            avg_price = float(price_sums[code] / price_counts[code])
+            min_price, max_price = float(min_prices[code]), float(max_prices[code])
+        else:
+            avg_price = total / count if count > 0 else 0
+            min_price = max_price = 0
+        result.append({
+            "name": name,
+            "count": count,
+            "total_value": total,
+            "avg_price": avg_price,
+            "min_price": min_price,
+            "max_price": max_price,
+        })
+    return result
+
+
+def _dimension_totals(items: list, key_field: str, lookup, field: str, limit: Optional[int] = None) -> list[dict]:
+    """Item count and price total per dimension value (lookup(skey)[field]), largest count first.
+
+    Columnar: one lookup per distinct skey, then _inventory_breakdown's bincounts over
+    the per-item codes instead of a dict of running totals per item.
+    """
+    codes, skeys = pd.factorize(pd.Series([item.get(key_field) for item in items], dtype=object))
+    # Items without a skey (code -1) pick up the trailing None
+    values = np.array([lookup(skey).get(field) for skey in skeys] + [None], dtype=object)
+    prices = np.array([item.get("price") or 0 for item in items], dtype=np.float64)
+    return [
+        {"name": group["name"], "count": group["count"], "total_value": group["total_value"]}
+        for group in _inventory_breakdown(pd.Categorical(values[codes]), prices, limit)
+    ]
+
+
+def _cube_groups(cells: pd.DataFrame) -> tuple[list, list, list]:
+    """Condition, product and dealer groupBy results (as Fabric returns them) summed from inventory cube cells."""
+    def group_by(field, extremes=False):
+        keyed = cells[cells[field].notna()]
+        grouped = keyed.groupby(field, sort=False)
+        totals = grouped.agg(count=("count", "sum"), sum=("sum", "sum"))
+        if extremes:
+            totals["min"] = grouped["min"].min()
+            totals["max"] = grouped["max"].max()
+        groups = []
+        for key, count, total in zip(totals.index.tolist(), totals["count"].astype(int).tolist(), totals["sum"].tolist()):
+            groups.append({"fields": {field: key}, "aggregations": {"count": count, "sum": total, "avg": total / count if count else None}})
+        if extremes:
+            # Cells with only null prices have no min/max
+            for group, low, high in zip(groups, totals["min"].tolist(), totals["max"].tolist()):
+                group["aggregations"]["min"] = None if pd.isna(low) else low
+                group["aggregations"]["max"] = None if pd.isna(high) else high
+        return groups
+
+    return group_by("condition", extremes=True), group_by("dim_product_model_skey"), group_by("dim_dealership_skey")
+
+
 class FabricGraphQLClient:
     """Client for querying Fabric GraphQL API with caching."""
 
@@ -60,22 +450,60 @@ class FabricGraphQLClient:
     _floorplan_cache = None  # {dim_product_skey: {floorplan}}
     _dealers_cache = None   # {dim_dealership_skey: {dealer_group, state, dealership}}
     _cache_loaded = False
+    _cache_lock = threading.Lock()  # Prevents concurrent requests from loading the dimension caches twice
 
     # Cache for aggregated results (computed at startup)
     _aggregations_cache = None
 
     # Cache for filtered aggregations (pre-computed for common filters)
     _filtered_aggregations_cache = None  # {"condition:NEW": {...}, "rv_type:TRAVEL TRAILER": {...}}
+    _aggregations_version = None  # _inventory_version of the inventory the aggregation caches were built from
+    _fact_fields = None  # Field names of fact_inventory_currents (introspected once, see _fact_inventory_fields)
+
+    # Cache for get_aggregated_summaries results (LRU, expire after SUMMARIES_CACHE_TTL)
+    _summaries_cache = None  # {(rv_type, dealer_group, manufacturer, condition, state, min_price, max_price): (fetched_at, summaries)}
+    _summaries_lock = threading.Lock()
+
+    # Cache for fetch_dimension_tables rows (LRU, expire after DIMENSION_CACHE_TTL)
+    _dimension_rows = None  # {(table_name, key_field, fields, skey): (fetched_at, row or None if not found)}
+    _pending_dimension_rows = None  # {(table_name, key_field, fields, skey): Event set once the fetch finishes}
+    _dimension_lock = threading.Lock()
+
+    # Cache for filter dropdown options (built once the dimension caches are loaded)
+    _filter_options = None
+
+    # Inverted dimension caches for filter push-down (built once the dimension caches are loaded)
+    _dimension_index = None  # {field: {value: {skey, ...}}}, only for caches holding the whole table
+    _dimensions_queried_at = None  # When this process last queried the dimension caches (None if loaded from a snapshot)
+    _dimension_refresh_lock = threading.Lock()  # Held while a background dimension refresh runs
 
     # Cache for inventory data (for fast filtered queries)
     _inventory_cache = None  # List of inventory items with joined dimension data
+    _inventory_arrays = None  # Column arrays of the inventory cache: {field: Categorical} (INVENTORY_FILTER_FIELDS, INVENTORY_BREAKDOWN_FIELDS) + price
+    _inventory_lock = threading.Lock()  # Prevents concurrent requests from fetching the inventory twice
+    _inventory_split_prices = None  # {filter_str: price of the batch_size-th highest priced item} for parallel nested fetches
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.credential = DefaultAzureCredential()
+            cls._instance.session = cls._instance._create_session()
         return cls._instance
 
+    def _create_session(self) -> httpx.Client:
+        """Create the HTTP/2 client reused by every query (concurrent queries share one TLS connection)."""
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=GRAPHQL_RETRIES,  # Connection failures only; statuses are retried in execute_query
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=GRAPHQL_POOL_SIZE),
+        )
+        # Fabric compresses responses when asked, which shrinks the large fact payloads several-fold
+        return httpx.Client(
+            transport=transport,
+            timeout=GRAPHQL_TIMEOUT,
+            headers={"Content-Type": "application/json", "Accept-Encoding": "gzip"},
+        )
+
     def _get_token(self):
         """Get or refresh the access token."""
         now = datetime.now().timestamp()
@@ -89,39 +517,61 @@ class FabricGraphQLClient:
 
     def execute_query(self, query: str, variables: dict = None) -> dict:
         """Execute a GraphQL query and return results."""
-        headers = {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = {"Authorization": f"Bearer {self._get_token()}"}
 
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
         print(f"DEBUG: Calling endpoint: {GRAPHQL_ENDPOINT}")
-        response = requests.post(GRAPHQL_ENDPOINT, headers=headers, json=payload)
-        print(f"DEBUG: Response status: {response.status_code}")
+        for attempt in range(GRAPHQL_RETRIES + 1):
+            response = self.session.post(GRAPHQL_ENDPOINT, headers=headers, json=payload)
+            print(f"DEBUG: Response status: {response.status_code}")
+            # Queries are read-only, so throttled or failed POSTs are safe to retry
+            if response.status_code not in GRAPHQL_RETRY_STATUSES or attempt == GRAPHQL_RETRIES:
+                break
+            retry_after = response.headers.get("Retry-After", "")
+            time.sleep(float(retry_after) if retry_after.isdigit() else 0.3 * 2 ** attempt)
 
         if response.status_code != 200:
             raise Exception(f"GraphQL request failed: {response.status_code} - {response.text}")
 
-        result = response.json()
+        # orjson parses the raw bytes directly, much faster than response.json() on multi-MB payloads
+        result = orjson.loads(response.content)
         if "errors" in result:
             print(f"DEBUG: Full response: {result}")
             raise Exception(f"GraphQL errors: {result['errors']}")
 
         return result.get("data", {})
 
-    def load_cache(self):
-        """Load all products and dealers into cache. Call once at startup or on first request."""
-        if self._cache_loaded:
+    def load_cache(self, refresh: bool = False):
+        """Load all products and dealers into cache. Call once at startup or on first request.
+
+        A snapshot younger than DIMENSION_SNAPSHOT_TTL is reused instead of querying;
+        refresh=True always re-queries the dimension tables.
+        """
+        if self._cache_loaded and not refresh:
             return
 
-        print("Loading dimension table caches...")
+        with self._cache_lock:
+            # Concurrent first requests wait here for the one load instead of querying in parallel
+            if self._cache_loaded and not refresh:
+                return
+            self._build_dimension_caches(refresh)
+
+    def _build_dimension_caches(self, refresh: bool):
+        """Load the product, floorplan and dealer caches from the snapshot or GraphQL."""
         start = datetime.now()
+        if not refresh and self._load_dimension_snapshot():
+            self._cache_loaded = True
+            elapsed = (datetime.now() - start).total_seconds()
+            print(f"Cache loaded from snapshot: {len(self._products_cache)} product models, {len(self._floorplan_cache)} floorplans, {len(self._dealers_cache)} dealers in {elapsed:.1f}s")
+            return
+
+        print("Loading dimension table caches...")
 
         # Load all products (up to 100k)
-        self._products_cache = {}
+        products = {}
         query = """
         {
             dim_product_models(first: 100000) {
@@ -137,15 +587,15 @@ class FabricGraphQLClient:
         result = self.execute_query(query)
         items = result.get("dim_product_models", {}).get("items", [])
         for p in items:
-            self._products_cache[p["dim_product_model_skey"]] = {
-                "rv_type": p.get("rv_type"),
-                "manufacturer": p.get("manufacturer"),
-                "model": p.get("model")
+            products[p["dim_product_model_skey"]] = {
+                "rv_type": _intern(p.get("rv_type")),
+                "manufacturer": _intern(p.get("manufacturer")),
+                "model": _intern(p.get("model"))
             }
-        print(f"  Loaded {len(self._products_cache)} product models")
+        print(f"  Loaded {len(products)} product models")
 
         # Load all floorplans from dim_products (separate table with dim_product_skey)
-        self._floorplan_cache = {}
+        floorplans = {}
         query = """
         {
             dim_products(first: 100000) {
@@ -159,13 +609,13 @@ class FabricGraphQLClient:
         result = self.execute_query(query)
         items = result.get("dim_products", {}).get("items", [])
         for p in items:
-            self._floorplan_cache[p["dim_product_skey"]] = {
-                "floorplan": p.get("floorplan")
+            floorplans[p["dim_product_skey"]] = {
+                "floorplan": _intern(p.get("floorplan"))
             }
-        print(f"  Loaded {len(self._floorplan_cache)} floorplans")
+        print(f"  Loaded {len(floorplans)} floorplans")
 
         # Load all dealers (up to 10k)
-        self._dealers_cache = {}
+        dealers = {}
         query = """
         {
             dim_dealerships(first: 10000) {
@@ -184,19 +634,136 @@ class FabricGraphQLClient:
         result = self.execute_query(query)
         items = result.get("dim_dealerships", {}).get("items", [])
         for d in items:
-            self._dealers_cache[d["dim_dealership_skey"]] = {
-                "dealer_group": d.get("dealer_group"),
-                "state": d.get("state"),
-                "dealership": d.get("dealership"),
-                "region": d.get("region"),
-                "city": d.get("city"),
-                "county": d.get("county")
+            dealers[d["dim_dealership_skey"]] = {
+                "dealer_group": _intern(d.get("dealer_group")),
+                "state": _intern(d.get("state")),
+                "dealership": _intern(d.get("dealership")),
+                "region": _intern(d.get("region")),
+                "city": _intern(d.get("city")),
+                "county": _intern(d.get("county"))
             }
-        print(f"  Loaded {len(self._dealers_cache)} dealers")
+        print(f"  Loaded {len(dealers)} dealers")
 
+        # Swapped in together so readers never see a partly built cache during a refresh
+        self._products_cache, self._floorplan_cache, self._dealers_cache = products, floorplans, dealers
+        self._dimensions_queried_at = start.timestamp()
         self._cache_loaded = True
+        self._filter_options = None  # Built from the dimension caches
+        self._dimension_index = None
+        self._save_dimension_snapshot()
         elapsed = (datetime.now() - start).total_seconds()
-        print(f"Cache loaded: {len(self._products_cache)} product models, {len(self._floorplan_cache)} floorplans, {len(self._dealers_cache)} dealers in {elapsed:.1f}s")
+        print(f"Cache loaded: {len(products)} product models, {len(floorplans)} floorplans, {len(dealers)} dealers in {elapsed:.1f}s")
+
+    def _save_dimension_snapshot(self) -> bool:
+        """Write the dimension caches to DIMENSION_SNAPSHOT_DIR for the next process start."""
+        if not DIMENSION_SNAPSHOT_DIR:
+            return False
+        try:
+            # (skey, row) pairs keep integer skeys, which JSON object keys can't
+            _write_snapshot("dimensions.json", {
+                "products": list(self._products_cache.items()),
+                "floorplans": list(self._floorplan_cache.items()),
+                "dealers": list(self._dealers_cache.items()),
+            })
+        except Exception as e:
+            print(f"Error saving dimension snapshot: {e}")
+            return False
+        return True
+
+    def _load_dimension_snapshot(self) -> bool:
+        """Load the dimension caches from a snapshot younger than DIMENSION_SNAPSHOT_TTL, if any."""
+        if not DIMENSION_SNAPSHOT_DIR:
+            return False
+        try:
+            snapshot = _read_snapshot("dimensions.json", DIMENSION_SNAPSHOT_TTL)
+        except Exception as e:
+            print(f"Error loading dimension snapshot: {e}")
+            return False
+        if snapshot is None:
+            return False
+
+        def intern_rows(pairs):
+            return {skey: {field: _intern(value) for field, value in row.items()} for skey, row in pairs}
+
+        self._products_cache = intern_rows(snapshot["products"])
+        self._floorplan_cache = intern_rows(snapshot["floorplans"])
+        self._dealers_cache = intern_rows(snapshot["dealers"])
+        self._dimensions_queried_at = None
+        self._filter_options = None  # Built from the dimension caches
+        self._dimension_index = None
+        return True
+
+    def _build_dimension_index(self) -> dict:
+        """Map each SKEY_FILTER_FIELDS value to the skeys that have it."""
+        self.load_cache()
+        index = {}
+        # A cache that hit its query's first: limit may be missing rows, and pushing
+        # its skeys down would drop facts that do match, so it is not indexed
+        tables = []
+        if len(self._products_cache) < 100000:
+            tables.append(self._products_cache)
+        if len(self._dealers_cache) < 10000:
+            tables.append(self._dealers_cache)
+        for rows in tables:
+            for skey, row in rows.items():
+                for field, value in row.items():
+                    if field in SKEY_FILTER_FIELDS and value:
+                        index.setdefault(field, {}).setdefault(value, set()).add(skey)
+        return index
+
+    def _skey_filters(self, **values) -> tuple[list[dict], set]:
+        """Translate dimension filter values into GraphQL filters on the fact table's skeys.
+
+        Returns the filter objects and the fields they cover. A field is left out (to be
+        post-filtered) when its value is unknown or matches more than MAX_PUSHDOWN_SKEYS skeys.
+        Nothing is pushed down unless this process queried the dimension caches within
+        DIMENSION_CACHE_TTL: fact rows pointing at skeys added since an older load (or a
+        snapshot) would be dropped by Fabric, while the nested fields still match them.
+        """
+        self.load_cache()
+        queried_at = self._dimensions_queried_at
+        if queried_at is None or datetime.now().timestamp() - queried_at >= DIMENSION_CACHE_TTL:
+            self._refresh_dimensions_in_background()
+            return [], set()
+        if self._dimension_index is None:
+            self._dimension_index = self._build_dimension_index()
+
+        skeys_by_key = {}
+        fields_by_key = defaultdict(set)
+        for field, value in values.items():
+            skeys = self._dimension_index.get(field, {}).get(value) if value else None
+            if not skeys:
+                continue
+            key_field = SKEY_FILTER_FIELDS[field]
+            # Filters on the same dimension table narrow each other
+            skeys_by_key[key_field] = skeys_by_key[key_field] & skeys if key_field in skeys_by_key else skeys
+            fields_by_key[key_field].add(field)
+
+        filters = []
+        pushed = set()
+        for key_field, skeys in skeys_by_key.items():
+            if not skeys or len(skeys) > MAX_PUSHDOWN_SKEYS:
+                continue
+            skeys = sorted(skeys)
+            chunks = [{key_field: {"in": skeys[i:i + 100]}} for i in range(0, len(skeys), 100)]
+            filters.append(chunks[0] if len(chunks) == 1 else {"or": chunks})
+            pushed |= fields_by_key[key_field]
+        return filters, pushed
+
+    def _refresh_dimensions_in_background(self):
+        """Re-query the dimension caches on a background thread (one refresh at a time), so push-down can resume."""
+        if not self._dimension_refresh_lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                self.load_cache(refresh=True)
+            except Exception as e:
+                print(f"Error refreshing dimension caches: {e}")
+            finally:
+                self._dimension_refresh_lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
 
     def get_product(self, skey):
         """Get product from cache."""
@@ -215,37 +782,165 @@ class FabricGraphQLClient:
 
         This ensures we get dimension data for ALL skeys found in inventory,
         not just those in the pre-loaded cache (which may be limited to 100k).
+        Skeys the pre-loaded cache does hold are answered from it without a query.
         """
-        results = {}
-        if not skeys:
-            return results
+        return self.lookup_dimension_tables([(table_name, key_field, skeys, fields)])[0]
+
+    def fetch_dimension_tables(self, lookups: list) -> list:
+        """Fetch dimension data for several (table_name, key_field, skeys, fields) lookups at once.
+
+        Rows are cached for DIMENSION_CACHE_TTL seconds, and skeys another request is
+        already fetching are waited on instead of fetched twice, so concurrent
+        summaries share one round trip per skey.
+        Returns one {skey: {field: value}} dict per lookup.
+        """
+        now = datetime.now().timestamp()
+        results = [{} for _ in lookups]
+        to_fetch = []  # Skeys this call registered as pending, per lookup
+        waits = []  # (lookup index, cache key, Event) for skeys pending in other requests
+        with self._dimension_lock:
+            if self._dimension_rows is None:
+                self._dimension_rows = OrderedDict()
+                self._pending_dimension_rows = {}
+            for index, (table_name, key_field, skeys, fields) in enumerate(lookups):
+                missing = []
+                for skey in set(skeys):
+                    key = (table_name, key_field, tuple(fields), skey)
+                    cached = self._dimension_rows.get(key)
+                    if cached and now - cached[0] < DIMENSION_CACHE_TTL:
+                        self._dimension_rows.move_to_end(key)
+                        if cached[1] is not None:
+                            results[index][skey] = cached[1]
+                    elif key in self._pending_dimension_rows:
+                        waits.append((index, key, self._pending_dimension_rows[key]))
+                    else:
+                        self._pending_dimension_rows[key] = threading.Event()
+                        missing.append(skey)
+                to_fetch.append((table_name, key_field, missing, fields))
+
+        try:
+            fetched_at = datetime.now().timestamp()
+            fetched = self._fetch_dimension_batches(to_fetch)
+            with self._dimension_lock:
+                for index, (table_name, key_field, missing, fields) in enumerate(to_fetch):
+                    for skey in missing:
+                        row = fetched[index].get(skey)
+                        self._dimension_rows[(table_name, key_field, tuple(fields), skey)] = (fetched_at, row)
+                        if row is not None:
+                            results[index][skey] = row
+                while len(self._dimension_rows) > DIMENSION_CACHE_SIZE:
+                    self._dimension_rows.popitem(last=False)
+        finally:
+            with self._dimension_lock:
+                for table_name, key_field, missing, fields in to_fetch:
+                    for skey in missing:
+                        self._pending_dimension_rows.pop((table_name, key_field, tuple(fields), skey)).set()
+
+        # Rows another request was fetching; refetch any that request failed to store
+        retry = defaultdict(list)
+        for index, key, event in waits:
+            event.wait()
+            with self._dimension_lock:
+                cached = self._dimension_rows.get(key)
+            if cached is None:
+                retry[index].append(key[3])
+            elif cached[1] is not None:
+                results[index][key[3]] = cached[1]
+        if retry:
+            refetched = self._fetch_dimension_batches([
+                (table_name, key_field, retry.get(index, []), fields)
+                for index, (table_name, key_field, _, fields) in enumerate(lookups)
+            ])
+            for index, rows in enumerate(refetched):
+                results[index].update(rows)
+        return results
+
+    def lookup_dimension_tables(self, lookups: list) -> list:
+        """Like fetch_dimension_tables, but answered from the loaded dimension caches where possible.
+
+        Only skeys missing from _products_cache / _dealers_cache (rows added since the
+        cache loaded, or beyond its first: limit) are fetched from GraphQL.
+        """
+        self.load_cache()
+        caches = {"dim_product_models": self._products_cache, "dim_dealerships": self._dealers_cache}
+        results = []
+        misses = []
+        for table_name, key_field, skeys, fields in lookups:
+            cache = caches.get(table_name)
+            # The cache only answers lookups for fields it holds
+            if cache is None or any(f != key_field and f not in next(iter(cache.values()), {}) for f in fields):
+                cache = {}
+            found = {}
+            missing = []
+            for skey in skeys:
+                row = cache.get(skey)
+                if row is None:
+                    missing.append(skey)
+                else:
+                    found[skey] = row
+            results.append(found)
+            misses.append((table_name, key_field, missing, fields))
+
+        if any(missing for _, _, missing, _ in misses):
+            for found, fetched in zip(results, self.fetch_dimension_tables(misses)):
+                found.update(fetched)
+        return results
+
+    def _fetch_dimension_batches(self, lookups: list) -> list:
+        """Fetch (table_name, key_field, skeys, fields) lookups from GraphQL, bypassing the row cache.
 
+        Skey batches of every lookup are packed as aliased fields into shared GraphQL
+        documents (b0: dim_product_models(...), b1: dim_dealerships(...)), so one round
+        trip answers several batches, and the documents run concurrently.
+        Returns one {skey: {field: value}} dict per lookup.
+        """
         BATCH_SIZE = 100  # GraphQL IN operator limit
-        fields_str = "\n                        ".join(fields)
-        unique_skeys = list(set(skeys))  # Deduplicate
+        results = [{} for _ in lookups]
+        batches = []  # (lookup index, skeys)
+        for index, (table_name, key_field, skeys, fields) in enumerate(lookups):
+            unique_skeys = list(set(skeys))  # Deduplicate
+            if not unique_skeys:
+                continue
+            print(f"  Fetching {table_name} data for {len(unique_skeys)} skeys in {len(unique_skeys) // BATCH_SIZE + 1} batches...")
+            batches.extend((index, unique_skeys[i:i + BATCH_SIZE]) for i in range(0, len(unique_skeys), BATCH_SIZE))
+        if not batches:
+            return results
 
-        print(f"  Fetching {table_name} data for {len(unique_skeys)} skeys in {len(unique_skeys) // BATCH_SIZE + 1} batches...")
+        documents = [batches[i:i + BATCHES_PER_QUERY] for i in range(0, len(batches), BATCHES_PER_QUERY)]
 
-        for i in range(0, len(unique_skeys), BATCH_SIZE):
-            batch = unique_skeys[i:i + BATCH_SIZE]
-            batch_str = ', '.join(str(k) for k in batch)
+        # Documents are independent, so they run concurrently over the shared HTTP/2 client
+        with ThreadPoolExecutor(max_workers=GRAPHQL_MAX_WORKERS) as executor:
+            document_results = executor.map(lambda document: self._run_batch_query(lookups, document), documents)
+            for document, result in zip(documents, document_results):
+                for alias, (index, _) in enumerate(document):
+                    _, key_field, _, fields = lookups[index]
+                    for item in result.get(f"b{alias}", {}).get("items", []):
+                        results[index][item[key_field]] = {f: item.get(f) for f in fields}
 
-            query = f"""
-            {{
-                {table_name}(first: 1000, filter: {{ {key_field}: {{ in: [{batch_str}] }} }}) {{
-                    items {{
-                        {fields_str}
-                    }}
+        for (table_name, _, skeys, _), table_results in zip(lookups, results):
+            if skeys:
+                print(f"  Fetched {len(table_results)} {table_name} records")
+        return results
+
+    def _run_batch_query(self, lookups: list, document: list) -> dict:
+        """Fetch one document of (lookup index, skeys) batches, each under alias b<position>."""
+        fields_query = []
+        for alias, (index, batch) in enumerate(document):
+            table_name, key_field, _, fields = lookups[index]
+            batch_str = ', '.join(str(k) for k in batch)
+            fields_str = "\n                    ".join(fields)
+            fields_query.append(f"""
+            b{alias}: {table_name}(first: 1000, filter: {{ {key_field}: {{ in: [{batch_str}] }} }}) {{
+                items {{
+                    {fields_str}
                 }}
-            }}
-            """
-            result = self.execute_query(query)
-            items = result.get(table_name, {}).get("items", [])
-            for item in items:
-                results[item[key_field]] = {f: item.get(f) for f in fields}
+            }}""")
 
-        print(f"  Fetched {len(results)} {table_name} records")
-        return results
+        query = f"""
+        {{{''.join(fields_query)}
+        }}
+        """
+        return self.execute_query(query)
 
     def list_dealers(self) -> list[str]:
         """Get list of available dealers from CACHED dim_dealerships - instant!"""
@@ -289,38 +984,63 @@ class FabricGraphQLClient:
         # When using nested queries, fetch in batches to avoid timeout
         # Fabric API times out on large nested queries
         if include_nested:
-            all_items = []
             batch_size = 50000
-            # Fetch two batches to get ~100k records
-            for offset in [0, 50000]:
-                # Use price ordering with offset simulation via condition filter
-                if offset == 0:
-                    batch_filter = filter_str
-                else:
-                    # Get items with lower prices (second batch)
-                    # Skip items we already have by using price < min price from first batch
-                    if all_items:
-                        min_price = min(item.get("price") or 0 for item in all_items)
-                        batch_filter = f', filter: {{ price: {{ lt: {min_price} }} }}'
-                    else:
-                        batch_filter = filter_str
-
-                query = f"""
-                {{
-                    fact_inventory_currents(first: {batch_size}, orderBy: {{ price: DESC }}{batch_filter}) {{
-                        items {{
-                            {fields_str}{nested_str}
-                        }}
-                    }}
-                }}
-                """
-                result = self.execute_query(query)
-                items = result.get("fact_inventory_currents", {}).get("items", [])
-                print(f"  Batch {offset//batch_size + 1}: fetched {len(items)} items")
-                all_items.extend(items)
+            max_items = 2 * batch_size  # ~100k records
+            if self._inventory_split_prices is None:
+                self._inventory_split_prices = {}
+            split_price = self._inventory_split_prices.get(filter_str)
+            if split_price is not None:
+                # Fetch both halves at once, split at the last fetch's batch_size-th highest price
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    upper, lower = executor.map(
+                        lambda price_filter: self._fetch_inventory_batch(fields_str, nested_str, filter_str, price_filter, batch_size),
+                        [f'{{ price: {{ gt: {split_price} }} }}', f'{{ price: {{ lte: {split_price} }} }}'],
+                    )
+                print(f"  Batches 1-2 (split at price {split_price}): fetched {len(upper)} + {len(lower)} items")
+                # A full upper half means prices moved up past the split, so page on from it instead
+                batches = [upper, lower] if len(upper) < batch_size else [upper]
+            else:
+                batches = [self._fetch_inventory_batch(fields_str, nested_str, filter_str, None, batch_size)]
+                print(f"  Batch 1: fetched {len(batches[0])} items")
 
-                if len(items) < batch_size:
-                    break  # No more items
+            all_items = []
+            min_price = None  # Lowest price fetched so far - the next batch's cursor
+            seen_stock_numbers = set()
+            requested = batch_size
+            while True:
+                added = 0
+                batch = batches.pop(0)
+                for item in batch:
+                    stock_number = item.get("stock_number")
+                    if stock_number is not None:
+                        if stock_number in seen_stock_numbers:
+                            continue
+                        seen_stock_numbers.add(stock_number)
+                    price = item.get("price")
+                    if price is not None and (min_price is None or price < min_price):
+                        min_price = price
+                    all_items.append(item)
+                    added += 1
+                if batches:
+                    continue
+                # A short batch is the last one. The lte cursor re-fetches boundary-price items that are
+                # dropped above, so the raw batch size is compared, not the items added; a batch
+                # adding nothing new (all at one price) would repeat forever
+                if len(batch) < requested or added == 0 or len(all_items) >= max_items or min_price is None:
+                    break  # No more items (or no priced items to page from)
+
+                # Get items priced at or below the lowest price so far (next batch);
+                # boundary-price items already fetched are dropped by stock_number above
+                operator = "lte" if "stock_number" in fields else "lt"
+                requested = min(batch_size, max_items - len(all_items))
+                batches.append(self._fetch_inventory_batch(
+                    fields_str, nested_str, filter_str, f'{{ price: {{ {operator}: {min_price} }} }}', requested
+                ))
+                print(f"  Batch (price {operator} {min_price}): fetched {len(batches[0])} items")
+
+            # Items arrive in descending price order, so this is where the next fetch can split
+            if len(all_items) > batch_size:
+                self._inventory_split_prices[filter_str] = all_items[batch_size - 1].get("price")
 
             print(f"  Total fetched: {len(all_items)} inventory items")
             return all_items
@@ -339,11 +1059,40 @@ class FabricGraphQLClient:
             print(f"  Fetched {len(items)} inventory items")
             return items
 
+    def _fetch_inventory_batch(self, fields_str: str, nested_str: str, filter_str: str, price_filter: Optional[str], first: int) -> list[dict]:
+        """Fetch one price-ordered batch of fact_inventory_currents, narrowed by an optional price filter."""
+        if price_filter is None:
+            batch_filter = filter_str
+        elif filter_str:
+            # Keep the caller's filter (filter_str is ', filter: { ... }')
+            batch_filter = f', filter: {{ and: [{filter_str.split("filter:", 1)[1].strip()}, {price_filter}] }}'
+        else:
+            batch_filter = f', filter: {price_filter}'
+
+        query = f"""
+        {{
+            fact_inventory_currents(first: {first}, orderBy: {{ price: DESC }}{batch_filter}) {{
+                items {{
+                    {fields_str}{nested_str}
+                }}
+            }}
+        }}
+        """
+        result = self.execute_query(query)
+        return result.get("fact_inventory_currents", {}).get("items", [])
+
     def get_filter_options(self) -> dict:
         """Get available filter options from CACHED dimension tables - instant response!"""
         # Ensure cache is loaded
         self.load_cache()
 
+        # Dimension caches don't change once loaded, so the options are built once
+        if self._filter_options is None:
+            self._filter_options = self._compute_filter_options()
+        return self._filter_options
+
+    def _compute_filter_options(self) -> dict:
+        """Collect the sorted distinct filter values from the dimension caches."""
         # Get RV types and manufacturers from cached products
         rv_types = set()
         manufacturers = set()
@@ -398,52 +1147,34 @@ class FabricGraphQLClient:
         Uses a single query with nested dim_product_models/dim_dealerships - no batch fetching needed!
         """
 
-        # Build filter conditions for fact_inventory_currents
+        # Build filter conditions for fact_inventory_currents (passed as the $filter variable)
         filters = []
         if condition:
-            filters.append(f'condition: {{ eq: "{condition}" }}')
+            filters.append({"condition": {"eq": condition}})
         if min_price is not None:
-            filters.append(f'price: {{ gte: {min_price} }}')
+            filters.append({"price": {"gte": min_price}})
         if max_price is not None:
-            filters.append(f'price: {{ lte: {max_price} }}')
+            filters.append({"price": {"lte": max_price}})
+
+        # Dimension filters matching few skeys are sent as skey lists so Fabric filters them
+        skey_filters, pushed = self._skey_filters(
+            rv_type=rv_type, manufacturer=manufacturer, dealership=dealer, dealer_group=dealer_group, state=state
+        )
+        filters.extend(skey_filters)
 
         # Determine fetch count - higher when we have dimension filters (need to post-filter)
-        has_dimension_filters = bool(rv_type or dealer or manufacturer or state or dealer_group)
+        has_dimension_filters = any(
+            value and field not in pushed
+            for field, value in [("rv_type", rv_type), ("dealership", dealer), ("manufacturer", manufacturer),
+                                 ("state", state), ("dealer_group", dealer_group)]
+        )
         fetch_count = min(10000, limit * 10) if has_dimension_filters else min(5000, limit * 3)
 
-        filter_str = ""
-        if filters:
-            filter_str = f", filter: {{ {', '.join(filters)} }}"
-
-        # Single query with nested dimension data via relationships
-        # NOTE: Excludes manufacturer_logo_small to avoid 64MB response limit
-        query = f"""
-        {{
-            fact_inventory_currents(first: {fetch_count}, orderBy: {{ price: DESC }}{filter_str}) {{
-                items {{
-                    stock_number
-                    condition
-                    price
-                    days_on_lot
-                    dim_product_models {{
-                        rv_type
-                        manufacturer
-                        model
-                        model_year
-                        floorplan
-                    }}
-                    dim_dealerships {{
-                        dealership
-                        dealer_group
-                        city
-                        state
-                    }}
-                }}
-            }}
-        }}
-        """
-
-        result = self.execute_query(query)
+        # Same query text for every filter combination, so Fabric can reuse its parsed plan
+        result = self.execute_query(INVENTORY_QUERY, {
+            "first": fetch_count,
+            "filter": None if not filters else filters[0] if len(filters) == 1 else {"and": filters},
+        })
         inventory_items = result.get("fact_inventory_currents", {}).get("items", [])
 
         if not inventory_items:
@@ -504,17 +1235,20 @@ class FabricGraphQLClient:
 
     def get_inventory_summary(self, dealer: Optional[str] = None) -> dict:
         """Get summary statistics for inventory."""
-        query = """
-        {
-            fact_inventory_currents(first: 10000) {
-                items {
+        # A known dealer is filtered by Fabric through its dim_dealership_skey
+        skey_filters, pushed = self._skey_filters(dealership=dealer)
+        filter_str = _filter_argument([], skey_filters)
+        query = f"""
+        {{
+            fact_inventory_currents(first: 10000{filter_str}) {{
+                items {{
                     price
                     condition
                     dim_product_model_skey
                     dim_dealership_skey
-                }
-            }
-        }
+                }}
+            }}
+        }}
         """
         result = self.execute_query(query)
         items = result.get("fact_inventory_currents", {}).get("items", [])
@@ -536,54 +1270,24 @@ class FabricGraphQLClient:
         product_keys = list(set(item["dim_product_model_skey"] for item in items if item.get("dim_product_model_skey")))
         dealer_keys = list(set(item["dim_dealership_skey"] for item in items if item.get("dim_dealership_skey")))
 
-        # Batch queries to avoid GraphQL IN operator limit of 100
-        BATCH_SIZE = 100
-        products = {}
-        for i in range(0, len(product_keys), BATCH_SIZE):
-            batch = product_keys[i:i + BATCH_SIZE]
-            product_query = f"""
-            {{
-                dim_product_models(first: 1000, filter: {{ dim_product_model_skey: {{ in: [{', '.join(str(k) for k in batch)}] }} }}) {{
-                    items {{
-                        dim_product_model_skey
-                        manufacturer
-                        model
-                        rv_type
-                    }}
-                }}
-            }}
-            """
-            product_result = self.execute_query(product_query)
-            for p in product_result.get("dim_product_models", {}).get("items", []):
-                products[p["dim_product_model_skey"]] = p
-
-        dealerships = {}
-        for i in range(0, len(dealer_keys), BATCH_SIZE):
-            batch = dealer_keys[i:i + BATCH_SIZE]
-            dealer_query = f"""
-            {{
-                dim_dealerships(first: 500, filter: {{ dim_dealership_skey: {{ in: [{', '.join(str(k) for k in batch)}] }} }}) {{
-                    items {{
-                        dim_dealership_skey
-                        dealership
-                    }}
-                }}
-            }}
-            """
-            dealer_result = self.execute_query(dealer_query)
-            for d in dealer_result.get("dim_dealerships", {}).get("items", []):
-                dealerships[d["dim_dealership_skey"]] = d
+        # From the dimension caches; misses are batched to avoid the GraphQL IN operator limit of 100
+        products, dealerships = self.lookup_dimension_tables([
+            ("dim_product_models", "dim_product_model_skey", product_keys,
+             ["dim_product_model_skey", "manufacturer", "model", "rv_type"]),
+            ("dim_dealerships", "dim_dealership_skey", dealer_keys,
+             ["dim_dealership_skey", "dealership"]),
+        ])
 
-        # Filter by dealer if specified
+        # Filter by dealer if specified (and not already filtered by Fabric)
         filtered_items = items
-        if dealer:
+        if dealer and "dealership" not in pushed:
             filtered_items = [
                 item for item in items
                 if dealerships.get(item.get("dim_dealership_skey"), {}).get("dealership") == dealer
             ]
 
         # Calculate statistics
-        prices = [item["price"] for item in filtered_items if item.get("price")]
+        prices = np.fromiter((item["price"] for item in filtered_items if item.get("price")), dtype=np.float64)
         makes = set()
         models = set()
         dealers_set = set()
@@ -614,9 +1318,9 @@ class FabricGraphQLClient:
             "unique_makes": len(makes),
             "unique_models": len(models),
             "dealers_with_data": len(dealers_set),
-            "avg_price": sum(prices) / len(prices) if prices else 0,
-            "min_price": min(prices) if prices else 0,
-            "max_price": max(prices) if prices else 0,
+            "avg_price": float(prices.mean()) if len(prices) else 0,
+            "min_price": float(prices.min()) if len(prices) else 0,
+            "max_price": float(prices.max()) if len(prices) else 0,
             "by_class": by_class,
             "by_condition": by_condition
         }
@@ -630,6 +1334,36 @@ class FabricGraphQLClient:
         state: Optional[str] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None
+    ) -> dict:
+        """Get comprehensive aggregated summaries, cached per filter combination for SUMMARIES_CACHE_TTL seconds."""
+        key = (rv_type, dealer_group, manufacturer, condition, state, min_price, max_price)
+        with self._summaries_lock:
+            if self._summaries_cache is None:
+                self._summaries_cache = OrderedDict()
+            cached = self._summaries_cache.get(key)
+            if cached and datetime.now().timestamp() - cached[0] < SUMMARIES_CACHE_TTL:
+                self._summaries_cache.move_to_end(key)
+                return cached[1]
+
+        # Computed outside the lock - a full inventory fetch must not block other filter combinations
+        fetched_at = datetime.now().timestamp()
+        summaries = self._compute_aggregated_summaries(*key)
+        with self._summaries_lock:
+            self._summaries_cache[key] = (fetched_at, summaries)
+            self._summaries_cache.move_to_end(key)
+            if len(self._summaries_cache) > SUMMARIES_CACHE_SIZE:
+                self._summaries_cache.popitem(last=False)
+        return summaries
+
+    def _compute_aggregated_summaries(
+        self,
+        rv_type: Optional[str] = None,
+        dealer_group: Optional[str] = None,
+        manufacturer: Optional[str] = None,
+        condition: Optional[str] = None,
+        state: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None
     ) -> dict:
         """Get comprehensive aggregated summaries with breakdowns by rv_type, dealer_group, and manufacturer."""
 
@@ -642,7 +1376,11 @@ class FabricGraphQLClient:
         if max_price is not None:
             filters.append(f'price: {{ lte: {max_price} }}')
 
-        filter_str = f", filter: {{ {', '.join(filters)} }}" if filters else ""
+        # Dimension filters matching few skeys are sent as skey lists, so far fewer rows come back
+        skey_filters, _ = self._skey_filters(
+            rv_type=rv_type, manufacturer=manufacturer, dealer_group=dealer_group, state=state
+        )
+        filter_str = _filter_argument(filters, skey_filters)
 
         # Fetch ALL inventory records using pagination
         print("Fetching all inventory for aggregation...")
@@ -667,390 +1405,204 @@ class FabricGraphQLClient:
         product_keys = list(set(item["dim_product_model_skey"] for item in all_items if item.get("dim_product_model_skey")))
         dealer_keys = list(set(item["dim_dealership_skey"] for item in all_items if item.get("dim_dealership_skey")))
 
-        # Batch fetch products
-        BATCH_SIZE = 100
-        products = {}
-        for i in range(0, len(product_keys), BATCH_SIZE):
-            batch = product_keys[i:i + BATCH_SIZE]
-            product_query = f"""
-            {{
-                dim_product_models(first: 1000, filter: {{ dim_product_model_skey: {{ in: [{', '.join(str(k) for k in batch)}] }} }}) {{
-                    items {{
-                        dim_product_model_skey
-                        manufacturer
-                        model
-                        rv_type
-                    }}
-                }}
-            }}
-            """
-            product_result = self.execute_query(product_query)
-            for p in product_result.get("dim_product_models", {}).get("items", []):
-                products[p["dim_product_model_skey"]] = p
-
-        # Batch fetch dealerships
-        dealerships = {}
-        for i in range(0, len(dealer_keys), BATCH_SIZE):
-            batch = dealer_keys[i:i + BATCH_SIZE]
-            dealer_query = f"""
-            {{
-                dim_dealerships(first: 500, filter: {{ dim_dealership_skey: {{ in: [{', '.join(str(k) for k in batch)}] }} }}) {{
-                    items {{
-                        dim_dealership_skey
-                        dealership
-                        dealer_group
-                        state
-                    }}
-                }}
-            }}
-            """
-            dealer_result = self.execute_query(dealer_query)
-            for d in dealer_result.get("dim_dealerships", {}).get("items", []):
-                dealerships[d["dim_dealership_skey"]] = d
-
-        # Apply dimension filters and aggregate
-        by_rv_type = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": [], "days_on_lot": []})
-        by_dealer_group = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": [], "days_on_lot": []})
-        by_manufacturer = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": [], "days_on_lot": []})
-        by_condition = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_state = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-
-        total_value = 0
-        all_prices = []
-        filtered_count = 0
-
-        for item in all_items:
-            product = products.get(item.get("dim_product_model_skey"), {})
-            dealership = dealerships.get(item.get("dim_dealership_skey"), {})
+        # Look up products and dealerships in the dimension caches, fetching only the misses
+        products, dealerships = self.lookup_dimension_tables([
+            ("dim_product_models", "dim_product_model_skey", product_keys,
+             ["dim_product_model_skey", "manufacturer", "model", "rv_type"]),
+            ("dim_dealerships", "dim_dealership_skey", dealer_keys,
+             ["dim_dealership_skey", "dealership", "dealer_group", "state"]),
+        ])
 
-            item_rv_type = product.get("rv_type")
-            item_manufacturer = product.get("manufacturer")
-            item_dealer_group = dealership.get("dealer_group")
-            item_state = dealership.get("state")
-            item_condition = item.get("condition")
-            price = item.get("price") or 0
-            days = item.get("days_on_lot") or 0
+        # Join dimension columns onto the items (hash lookups per column, not per item)
+        df = pd.DataFrame(all_items, columns=["price", "condition", "days_on_lot", "dim_product_model_skey", "dim_dealership_skey"])
+        for column in ("rv_type", "manufacturer"):
+            df[column] = df["dim_product_model_skey"].map(pd.Series({k: p.get(column) for k, p in products.items()}, dtype=object))
+        for column in ("dealer_group", "state"):
+            df[column] = df["dim_dealership_skey"].map(pd.Series({k: d.get(column) for k, d in dealerships.items()}, dtype=object))
+        # Missing prices count as 0; numeric dtypes even when a whole column is null
+        df["price"] = pd.to_numeric(df["price"]).fillna(0)
+        df["days_on_lot"] = pd.to_numeric(df["days_on_lot"])
+
+        # Apply dimension filters as one boolean mask
+        mask = pd.Series(True, index=df.index)
+        if rv_type:
+            mask &= df["rv_type"] == rv_type
+        if dealer_group:
+            mask &= df["dealer_group"] == dealer_group
+        if manufacturer:
+            mask &= df["manufacturer"] == manufacturer
+        if state:
+            mask &= df["state"] == state
+        df = df[mask]
 
-            # Apply dimension filters
-            if rv_type and item_rv_type != rv_type:
-                continue
-            if dealer_group and item_dealer_group != dealer_group:
-                continue
-            if manufacturer and item_manufacturer != manufacturer:
-                continue
-            if state and item_state != state:
-                continue
+        # Price and days-on-lot stats only count positive values
+        df = df.assign(
+            positive_price=df["price"].where(df["price"] > 0),
+            positive_days=df["days_on_lot"].where(df["days_on_lot"] > 0),
+        )
+        all_prices = df["positive_price"].dropna()
+
+        def format_aggregation(column, include_days_on_lot=False):
+            # Items without a value (None or empty) aren't grouped; groups keep first-seen order for ties
+            keyed = df[df[column].notna() & (df[column] != "")]
+            if keyed.empty:
+                return []
+            aggregations = {
+                "count": ("price", "size"),
+                "total_value": ("price", "sum"),
+                "avg_price": ("positive_price", "mean"),
+                "min_price": ("positive_price", "min"),
+                "max_price": ("positive_price", "max"),
+            }
+            if include_days_on_lot:
+                aggregations["avg_days_on_lot"] = ("positive_days", "mean")
+            grouped = keyed.groupby(column, sort=False).agg(**aggregations)
+            grouped = grouped.sort_values("count", ascending=False, kind="stable")
+            grouped[["avg_price", "min_price", "max_price"]] = grouped[["avg_price", "min_price", "max_price"]].fillna(0)
 
-            filtered_count += 1
-            total_value += price
-            if price > 0:
-                all_prices.append(price)
-
-            # Aggregate by rv_type
-            if item_rv_type:
-                by_rv_type[item_rv_type]["count"] += 1
-                by_rv_type[item_rv_type]["total_value"] += price
-                if price > 0:
-                    by_rv_type[item_rv_type]["prices"].append(price)
-                if days > 0:
-                    by_rv_type[item_rv_type]["days_on_lot"].append(days)
-
-            # Aggregate by dealer_group
-            if item_dealer_group:
-                by_dealer_group[item_dealer_group]["count"] += 1
-                by_dealer_group[item_dealer_group]["total_value"] += price
-                if price > 0:
-                    by_dealer_group[item_dealer_group]["prices"].append(price)
-                if days > 0:
-                    by_dealer_group[item_dealer_group]["days_on_lot"].append(days)
-
-            # Aggregate by manufacturer
-            if item_manufacturer:
-                by_manufacturer[item_manufacturer]["count"] += 1
-                by_manufacturer[item_manufacturer]["total_value"] += price
-                if price > 0:
-                    by_manufacturer[item_manufacturer]["prices"].append(price)
-                if days > 0:
-                    by_manufacturer[item_manufacturer]["days_on_lot"].append(days)
-
-            # Aggregate by condition
-            if item_condition:
-                by_condition[item_condition]["count"] += 1
-                by_condition[item_condition]["total_value"] += price
-                if price > 0:
-                    by_condition[item_condition]["prices"].append(price)
-
-            # Aggregate by state
-            if item_state:
-                by_state[item_state]["count"] += 1
-                by_state[item_state]["total_value"] += price
-                if price > 0:
-                    by_state[item_state]["prices"].append(price)
-
-        def format_aggregation(agg_dict):
             result = []
-            for key, data in sorted(agg_dict.items(), key=lambda x: x[1]["count"], reverse=True):
-                prices = data["prices"]
-                entry = {
-                    "name": key,
-                    "count": data["count"],
-                    "total_value": data["total_value"],
-                    "avg_price": sum(prices) / len(prices) if prices else 0,
-                    "min_price": min(prices) if prices else 0,
-                    "max_price": max(prices) if prices else 0,
-                }
-                if "days_on_lot" in data and data["days_on_lot"]:
-                    entry["avg_days_on_lot"] = sum(data["days_on_lot"]) / len(data["days_on_lot"])
+            for key, *values in zip(grouped.index.tolist(), *(grouped[col].tolist() for col in grouped.columns)):
+                entry = {"name": key, **dict(zip(grouped.columns, values))}
+                # Groups without any positive days_on_lot have no average
+                if include_days_on_lot and pd.isna(entry["avg_days_on_lot"]):
+                    del entry["avg_days_on_lot"]
                 result.append(entry)
             return result
 
         return {
-            "total_units": filtered_count,
-            "total_value": total_value,
-            "avg_price": sum(all_prices) / len(all_prices) if all_prices else 0,
-            "min_price": min(all_prices) if all_prices else 0,
-            "max_price": max(all_prices) if all_prices else 0,
-            "by_rv_type": format_aggregation(by_rv_type)[:10],  # Top 10 RV types
-            "by_dealer_group": format_aggregation(by_dealer_group)[:5],  # Top 5 dealer groups
-            "by_manufacturer": format_aggregation(by_manufacturer)[:5],  # Top 5 manufacturers
-            "by_condition": format_aggregation(by_condition),  # All conditions (just 2)
-            "by_state": format_aggregation(by_state)[:65]  # All US states + Canadian provinces
+            "total_units": len(df),
+            "total_value": float(df["price"].sum()),
+            "avg_price": float(all_prices.mean()) if len(all_prices) else 0,
+            "min_price": float(all_prices.min()) if len(all_prices) else 0,
+            "max_price": float(all_prices.max()) if len(all_prices) else 0,
+            "by_rv_type": format_aggregation("rv_type", include_days_on_lot=True)[:10],  # Top 10 RV types
+            "by_dealer_group": format_aggregation("dealer_group", include_days_on_lot=True)[:5],  # Top 5 dealer groups
+            "by_manufacturer": format_aggregation("manufacturer", include_days_on_lot=True)[:5],  # Top 5 manufacturers
+            "by_condition": format_aggregation("condition"),  # All conditions (just 2)
+            "by_state": format_aggregation("state")[:65]  # All US states + Canadian provinces
         }
 
-    def build_aggregations_cache(self):
-        """Build aggregations cache at startup - runs groupBy queries once."""
-        print("Building aggregations cache...")
-        start = datetime.now()
-
-        # 1. Get condition aggregations (fast - only 2 groups)
-        condition_query = """
-        {
-            fact_inventory_currents(first: 100) {
-                groupBy(fields: [condition]) {
-                    fields { condition }
-                    aggregations {
-                        count(field: price)
-                        sum(field: price)
-                        avg(field: price)
-                        min(field: price)
-                        max(field: price)
-                    }
-                }
-            }
-        }
-        """
-        cond_result = self.execute_query(condition_query)
-        cond_groups = cond_result.get("fact_inventory_currents", {}).get("groupBy", [])
-
-        by_condition = []
-        total_units = 0
-        total_value = 0.0
-
-        for g in cond_groups:
-            cond = g.get("fields", {}).get("condition")
-            aggs = g.get("aggregations", {})
-            if cond:
-                count = aggs.get("count") or 0
-                total = aggs.get("sum") or 0
-                by_condition.append({
-                    "name": cond,
-                    "count": count,
-                    "total_value": total,
-                    "avg_price": aggs.get("avg") or 0,
-                    "min_price": aggs.get("min") or 0,
-                    "max_price": aggs.get("max") or 0
-                })
-                total_units += count
-                total_value += total
-        print(f"  Condition aggregations: {total_units} total units")
-
-        # 2. Get product-level aggregations (for rv_type, manufacturer)
-        product_query = """
-        {
-            fact_inventory_currents(first: 100000) {
-                groupBy(fields: [dim_product_model_skey]) {
-                    fields { dim_product_model_skey }
-                    aggregations {
-                        count(field: price)
-                        sum(field: price)
-                        avg(field: price)
-                    }
-                }
-            }
-        }
-        """
-        prod_result = self.execute_query(product_query)
-        prod_groups = prod_result.get("fact_inventory_currents", {}).get("groupBy", [])
-
-        # Collect ALL product skeys from inventory groupBy (these represent ALL 184k units)
-        inventory_product_skeys = [
-            g.get("fields", {}).get("dim_product_model_skey")
-            for g in prod_groups
-            if g.get("fields", {}).get("dim_product_model_skey")
-        ]
-        product_skey_to_aggs = {
-            g.get("fields", {}).get("dim_product_model_skey"): g.get("aggregations", {})
-            for g in prod_groups
-            if g.get("fields", {}).get("dim_product_model_skey")
-        }
-
-        # Fetch dimension data specifically for skeys found in inventory (not from pre-loaded cache)
-        # This ensures we get data for ALL inventory products, even if dimension cache was limited
-        products_for_inventory = self.fetch_dimension_data_for_skeys(
-            "dim_product_models", "dim_product_model_skey",
-            inventory_product_skeys,
-            ["dim_product_model_skey", "rv_type", "manufacturer"]
+    def _skey_aggregations(self, groups: list, key_field: str, table_name: str, fields: list) -> pd.DataFrame:
+        """One row per groupBy skey - its count/sum/avg price aggregations plus the skey's dimension fields."""
+        # Single pass over the groupBy rows straight into columns
+        skeys, counts, sums, avgs = [], [], [], []
+        for g in groups:
+            skey = g.get("fields", {}).get(key_field)
+            if skey:
+                aggs = g.get("aggregations", {})
+                skeys.append(skey)
+                counts.append(aggs.get("count") or 0)
+                sums.append(aggs.get("sum") or 0)
+                avgs.append(aggs.get("avg") or 0)
+        dimension = self.fetch_dimension_data_for_skeys(table_name, key_field, skeys, [key_field] + fields)
+
+        # Left hash join of the aggregations onto the dimension rows (keeps the groupBy order)
+        df = pd.DataFrame({key_field: np.array(skeys, dtype=np.int64), "count": counts, "total_value": sums, "avg": avgs})
+        dim_df = pd.DataFrame.from_records(
+            [(skey, *(row.get(field) for field in fields)) for skey, row in dimension.items()],
+            columns=[key_field] + fields,
         )
+        df = df.merge(dim_df.astype({key_field: np.int64, **{field: object for field in fields}}), on=key_field, how="left")
+        return _weight_by_count(df)
 
-        by_rv_type = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_manufacturer = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        missing_product_count = 0
-        missing_product_inventory = 0
-
-        for pkey in inventory_product_skeys:
-            aggs = product_skey_to_aggs.get(pkey, {})
-            product = products_for_inventory.get(pkey, {})
-
-            count = aggs.get("count") or 0
-            total = aggs.get("sum") or 0
-            avg_p = aggs.get("avg") or 0
-
-            rv_type = product.get("rv_type")
-            mfr = product.get("manufacturer")
-
-            if not rv_type and not mfr:
-                missing_product_count += 1
-                missing_product_inventory += count
-
-            if rv_type:
-                by_rv_type[rv_type]["count"] += count
-                by_rv_type[rv_type]["total_value"] += total
-                if avg_p > 0:
-                    by_rv_type[rv_type]["avg_prices"].append((avg_p, count))
-
-            if mfr:
-                by_manufacturer[mfr]["count"] += count
-                by_manufacturer[mfr]["total_value"] += total
-                if avg_p > 0:
-                    by_manufacturer[mfr]["avg_prices"].append((avg_p, count))
-
-        if missing_product_count > 0:
-            print(f"  WARNING: {missing_product_count} products not found in dim_product_models ({missing_product_inventory} inventory units)")
-        print(f"  Product aggregations: {len(prod_groups)} product groups -> {len(by_rv_type)} rv_types, {len(by_manufacturer)} manufacturers")
-
-        # 3. Get dealer-level aggregations (for dealer_group, state)
-        dealer_query = """
-        {
-            fact_inventory_currents(first: 100000) {
-                groupBy(fields: [dim_dealership_skey]) {
-                    fields { dim_dealership_skey }
-                    aggregations {
-                        count(field: price)
-                        sum(field: price)
-                        avg(field: price)
-                    }
-                }
-            }
-        }
+    def _fact_inventory_fields(self) -> set:
+        """Field names of fact_inventory_currents, introspected once per process (empty if that fails)."""
+        if self._fact_fields is None:
+            try:
+                result = self.execute_query('{ __type(name: "fact_inventory_currents") { fields { name } } }')
+                self._fact_fields = {f["name"] for f in (result.get("__type") or {}).get("fields") or []}
+            except Exception as e:
+                print(f"Error introspecting fact_inventory_currents, grouping by skeys: {e}")
+                self._fact_fields = set()
+        return self._fact_fields
+
+    def _skey_breakdowns(self, skey_groups: dict, verbose: bool = False) -> dict:
+        """{field: rows} for the SKEY_BREAKDOWNS fields, from {key_field: per-skey groupBy results}."""
+        breakdowns = {}
+        for key_field, table_name, fields in SKEY_BREAKDOWNS:
+            if key_field not in skey_groups:
+                continue
+            groups = skey_groups[key_field]
+            # One row per skey in inventory, joined with dimension data fetched for exactly
+            # those skeys, even if the dimension cache was limited
+            by_skey = self._skey_aggregations(groups, key_field, table_name, fields)
+            if verbose:
+                missing = by_skey[~_has_value(by_skey[fields[0]]) & ~_has_value(by_skey[fields[1]])]
+                if len(missing) > 0:
+                    print(f"  WARNING: {len(missing)} {key_field} values not found in {table_name} ({missing['count'].sum()} inventory units)")
+                print(f"  {table_name} aggregations: {len(groups)} skey groups -> " + ", ".join(
+                    f"{by_skey[field][_has_value(by_skey[field])].nunique()} {field}" for field in fields
+                ))
+            breakdowns.update({field: by_skey for field in fields})
+        return breakdowns
+
+    def _inventory_breakdowns(self, filter_str: str = "", verbose: bool = False) -> dict:
+        """{field: rows for _format_breakdown} for every SKEY_BREAKDOWNS field of the (filtered) inventory.
+
+        A field fact_inventory_currents has itself is grouped by in Fabric; the rest come
+        from per-skey groupBy results joined with their dimension table. A skey query is
+        only sent while some field of its table still needs it.
         """
-        dealer_result = self.execute_query(dealer_query)
-        dealer_groups = dealer_result.get("fact_inventory_currents", {}).get("groupBy", [])
-
-        # Collect ALL dealer skeys from inventory groupBy (these represent ALL 184k units)
-        inventory_dealer_skeys = [
-            g.get("fields", {}).get("dim_dealership_skey")
-            for g in dealer_groups
-            if g.get("fields", {}).get("dim_dealership_skey")
+        fact_fields = self._fact_inventory_fields()
+        direct = [field for _, _, fields in SKEY_BREAKDOWNS for field in fields if field in fact_fields]
+        group_fields = direct + [
+            key_field for key_field, _, fields in SKEY_BREAKDOWNS
+            if any(field not in fact_fields for field in fields)
         ]
-        dealer_skey_to_aggs = {
-            g.get("fields", {}).get("dim_dealership_skey"): g.get("aggregations", {})
-            for g in dealer_groups
-            if g.get("fields", {}).get("dim_dealership_skey")
-        }
-
-        # Fetch dimension data specifically for skeys found in inventory (not from pre-loaded cache)
-        # This ensures we get data for ALL inventory dealers, even if dimension cache was limited
-        dealers_for_inventory = self.fetch_dimension_data_for_skeys(
-            "dim_dealerships", "dim_dealership_skey",
-            inventory_dealer_skeys,
-            ["dim_dealership_skey", "dealer_group", "state", "region", "city", "county"]
-        )
-
-        by_dealer_group = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_state = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_region = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_city = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_county = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        missing_dealer_count = 0
-        missing_dealer_inventory = 0
-
-        for dkey in inventory_dealer_skeys:
-            aggs = dealer_skey_to_aggs.get(dkey, {})
-            dealer = dealers_for_inventory.get(dkey, {})
-
-            count = aggs.get("count") or 0
-            total = aggs.get("sum") or 0
-            avg_p = aggs.get("avg") or 0
 
-            dg = dealer.get("dealer_group")
-            state = dealer.get("state")
-            region = dealer.get("region")
-            city = dealer.get("city")
-            county = dealer.get("county")
-
-            if not dg and not state:
-                missing_dealer_count += 1
-                missing_dealer_inventory += count
+        # Independent groupBy queries - all in flight at once
+        with ThreadPoolExecutor(max_workers=len(group_fields)) as executor:
+            results = executor.map(lambda field: self.execute_query(_group_by_query(field, filter_str)), group_fields)
+            groups = {
+                field: result.get("fact_inventory_currents", {}).get("groupBy", [])
+                for field, result in zip(group_fields, results)
+            }
 
-            if dg:
-                by_dealer_group[dg]["count"] += count
-                by_dealer_group[dg]["total_value"] += total
-                if avg_p > 0:
-                    by_dealer_group[dg]["avg_prices"].append((avg_p, count))
+        breakdowns = self._skey_breakdowns(groups, verbose)
+        for field in direct:
+            breakdowns[field] = _field_groups(groups[field], field)
+            if verbose:
+                print(f"  {field} aggregations: {len(groups[field])} groups (grouped in Fabric)")
+        return breakdowns
 
-            if state:
-                by_state[state]["count"] += count
-                by_state[state]["total_value"] += total
-                if avg_p > 0:
-                    by_state[state]["avg_prices"].append((avg_p, count))
+    def build_aggregations_cache(self):
+        """Build aggregations cache at startup - runs groupBy queries once."""
+        print("Building aggregations cache...")
+        start = datetime.now()
 
-            if region:
-                by_region[region]["count"] += count
-                by_region[region]["total_value"] += total
-                if avg_p > 0:
-                    by_region[region]["avg_prices"].append((avg_p, count))
+        # 1. Condition aggregations (fast - only 2 groups), independent of the breakdowns so fetched alongside them
+        executor = ThreadPoolExecutor(max_workers=1)
+        cond_future = executor.submit(self.execute_query, INVENTORY_TOTALS_QUERY)
+        executor.shutdown(wait=False)
 
-            if city:
-                by_city[city]["count"] += count
-                by_city[city]["total_value"] += total
-                if avg_p > 0:
-                    by_city[city]["avg_prices"].append((avg_p, count))
+        # 2./3. Product-level (rv_type, manufacturer) and dealer-level (dealer_group, state, ...) breakdowns
+        breakdowns = self._inventory_breakdowns(verbose=True)
 
-            if county:
-                by_county[county]["count"] += count
-                by_county[county]["total_value"] += total
-                if avg_p > 0:
-                    by_county[county]["avg_prices"].append((avg_p, count))
+        cond_result = cond_future.result()
+        cond_groups = cond_result.get("conditions", {}).get("groupBy", [])
+        version = _inventory_version(cond_result)
 
-        if missing_dealer_count > 0:
-            print(f"  WARNING: {missing_dealer_count} dealers not found in dim_dealerships ({missing_dealer_inventory} inventory units)")
-        print(f"  Dealer aggregations: {len(dealer_groups)} dealer groups -> {len(by_dealer_group)} dealer_groups, {len(by_state)} states, {len(by_region)} regions, {len(by_city)} cities")
+        by_condition = []
+        total_units = 0
+        total_value = 0.0
 
-        def format_agg(agg_dict, limit=None):
-            result = []
-            for key, data in sorted(agg_dict.items(), key=lambda x: x[1]["count"], reverse=True):
-                total_weighted = sum(p * c for p, c in data["avg_prices"])
-                total_count = sum(c for _, c in data["avg_prices"])
-                avg_p = total_weighted / total_count if total_count > 0 else 0
-                result.append({
-                    "name": key,
-                    "count": data["count"],
-                    "total_value": data["total_value"],
-                    "avg_price": avg_p,
-                    "min_price": 0,
-                    "max_price": 0
+        for g in cond_groups:
+            cond = g.get("fields", {}).get("condition")
+            aggs = g.get("aggregations", {})
+            if cond:
+                count = aggs.get("count") or 0
+                total = aggs.get("sum") or 0
+                by_condition.append({
+                    "name": cond,
+                    "count": count,
+                    "total_value": total,
+                    "avg_price": aggs.get("avg") or 0,
+                    "min_price": aggs.get("min") or 0,
+                    "max_price": aggs.get("max") or 0
                 })
-            return result[:limit] if limit else result
+                total_units += count
+                total_value += total
+        print(f"  Condition aggregations: {total_units} total units")
 
         overall_avg = total_value / total_units if total_units > 0 else 0
 
@@ -1060,16 +1612,18 @@ class FabricGraphQLClient:
             "avg_price": overall_avg,
             "min_price": min((c["min_price"] for c in by_condition if c["min_price"] > 0), default=0),
             "max_price": max((c["max_price"] for c in by_condition), default=0),
-            "by_rv_type": format_agg(by_rv_type, 10),
-            "by_dealer_group": format_agg(by_dealer_group, 10),
-            "by_manufacturer": format_agg(by_manufacturer, 10),
+            "by_rv_type": _format_breakdown(breakdowns["rv_type"], "rv_type", 10),
+            "by_dealer_group": _format_breakdown(breakdowns["dealer_group"], "dealer_group", 10),
+            "by_manufacturer": _format_breakdown(breakdowns["manufacturer"], "manufacturer", 10),
             "by_condition": sorted(by_condition, key=lambda x: x["count"], reverse=True),
-            "by_state": format_agg(by_state, 65),  # All US states + Canadian provinces
-            "by_region": format_agg(by_region, 10),
-            "by_city": format_agg(by_city, 20),  # More cities, so show top 20
-            "by_county": format_agg(by_county, 15)
+            "by_state": _format_breakdown(breakdowns["state"], "state", 65),  # All US states + Canadian provinces
+            "by_region": _format_breakdown(breakdowns["region"], "region", 10),
+            "by_city": _format_breakdown(breakdowns["city"], "city", 20),  # More cities, so show top 20
+            "by_county": _format_breakdown(breakdowns["county"], "county", 15)
         }
 
+        self._aggregations_version = version
+
         elapsed = (datetime.now() - start).total_seconds()
         print(f"Aggregations cache built in {elapsed:.1f}s")
 
@@ -1090,14 +1644,11 @@ class FabricGraphQLClient:
         condition_filters = ["NEW", "USED"]
         rv_type_filters = ["TRAVEL TRAILER", "FIFTH WHEEL", "CLASS A", "CLASS B", "CLASS C", "OTHER", "CAMPING TRAILER", "PARK MODEL"]
 
-        # Helper to build aggregations for a single filter
-        def build_for_filter(filter_field: str, filter_value: str, filter_key: str):
-            """Build aggregations for a specific filter using native groupBy."""
-            print(f"  Building aggregations for {filter_key}...")
-
-            # Build filter string for GraphQL
-            filter_str = f', filter: {{ {filter_field}: {{ eq: "{filter_value}" }} }}'
+        # Per (product, dealer, condition, rv_type) cell totals - each filter below is a subset of them
+        cube = self._fetch_inventory_cube()
 
+        def fetch_groups(filter_str: str):
+            """Condition groupBy results and product/dealer breakdowns for one filter (concurrent round trips)."""
             # 1. Get totals from condition groupBy (with filter)
             condition_query = f"""
             {{
@@ -1115,8 +1666,25 @@ class FabricGraphQLClient:
                 }}
             }}
             """
-            cond_result = self.execute_query(condition_query)
-            cond_groups = cond_result.get("fact_inventory_currents", {}).get("groupBy", [])
+
+            # The condition query runs alongside the breakdown queries
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                cond_future = executor.submit(self.execute_query, condition_query)
+                breakdowns = self._inventory_breakdowns(filter_str)
+                cond_groups = cond_future.result().get("fact_inventory_currents", {}).get("groupBy", [])
+            return cond_groups, breakdowns
+
+        # Helper to build aggregations for a single filter
+        def build_for_filter(filter_field: str, filter_value: str, filter_key: str):
+            """Build aggregations for a specific filter from the cube, or native groupBy without one."""
+            print(f"  Building aggregations for {filter_key}...")
+
+            if cube is not None:
+                cond_groups, prod_groups, dealer_groups = _cube_groups(cube[cube[filter_field] == filter_value])
+                breakdowns = self._skey_breakdowns({"dim_product_model_skey": prod_groups, "dim_dealership_skey": dealer_groups})
+            else:
+                # Build filter string for GraphQL
+                cond_groups, breakdowns = fetch_groups(f', filter: {{ {filter_field}: {{ eq: "{filter_value}" }} }}')
 
             by_condition = []
             total_units = 0
@@ -1148,166 +1716,6 @@ class FabricGraphQLClient:
             if min_price == float('inf'):
                 min_price = 0
 
-            # 2. Get product-level aggregations (for rv_type, manufacturer)
-            product_query = f"""
-            {{
-                fact_inventory_currents(first: 100000{filter_str}) {{
-                    groupBy(fields: [dim_product_model_skey]) {{
-                        fields {{ dim_product_model_skey }}
-                        aggregations {{
-                            count(field: price)
-                            sum(field: price)
-                            avg(field: price)
-                        }}
-                    }}
-                }}
-            }}
-            """
-            prod_result = self.execute_query(product_query)
-            prod_groups = prod_result.get("fact_inventory_currents", {}).get("groupBy", [])
-
-            # Collect product skeys and fetch dimension data
-            inventory_product_skeys = [
-                g.get("fields", {}).get("dim_product_model_skey")
-                for g in prod_groups
-                if g.get("fields", {}).get("dim_product_model_skey")
-            ]
-            product_skey_to_aggs = {
-                g.get("fields", {}).get("dim_product_model_skey"): g.get("aggregations", {})
-                for g in prod_groups
-                if g.get("fields", {}).get("dim_product_model_skey")
-            }
-
-            products_for_inventory = self.fetch_dimension_data_for_skeys(
-                "dim_product_models", "dim_product_model_skey",
-                inventory_product_skeys,
-                ["dim_product_model_skey", "rv_type", "manufacturer"]
-            )
-
-            by_rv_type = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-            by_manufacturer = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-
-            for pkey in inventory_product_skeys:
-                aggs = product_skey_to_aggs.get(pkey, {})
-                product = products_for_inventory.get(pkey, {})
-                count = aggs.get("count") or 0
-                total = aggs.get("sum") or 0
-                avg_p = aggs.get("avg") or 0
-
-                rv_type = product.get("rv_type")
-                if rv_type:
-                    by_rv_type[rv_type]["count"] += count
-                    by_rv_type[rv_type]["total_value"] += total
-                    if avg_p > 0:
-                        by_rv_type[rv_type]["avg_prices"].append((avg_p, count))
-
-                mfr = product.get("manufacturer")
-                if mfr:
-                    by_manufacturer[mfr]["count"] += count
-                    by_manufacturer[mfr]["total_value"] += total
-                    if avg_p > 0:
-                        by_manufacturer[mfr]["avg_prices"].append((avg_p, count))
-
-            # 3. Get dealer-level aggregations (for dealer_group, state)
-            dealer_query = f"""
-            {{
-                fact_inventory_currents(first: 100000{filter_str}) {{
-                    groupBy(fields: [dim_dealership_skey]) {{
-                        fields {{ dim_dealership_skey }}
-                        aggregations {{
-                            count(field: price)
-                            sum(field: price)
-                            avg(field: price)
-                        }}
-                    }}
-                }}
-            }}
-            """
-            dealer_result = self.execute_query(dealer_query)
-            dealer_groups = dealer_result.get("fact_inventory_currents", {}).get("groupBy", [])
-
-            inventory_dealer_skeys = [
-                g.get("fields", {}).get("dim_dealership_skey")
-                for g in dealer_groups
-                if g.get("fields", {}).get("dim_dealership_skey")
-            ]
-            dealer_skey_to_aggs = {
-                g.get("fields", {}).get("dim_dealership_skey"): g.get("aggregations", {})
-                for g in dealer_groups
-                if g.get("fields", {}).get("dim_dealership_skey")
-            }
-
-            dealers_for_inventory = self.fetch_dimension_data_for_skeys(
-                "dim_dealerships", "dim_dealership_skey",
-                inventory_dealer_skeys,
-                ["dim_dealership_skey", "dealer_group", "state", "region", "city", "county"]
-            )
-
-            by_dealer_group = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-            by_state = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-            by_region = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-            by_city = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-            by_county = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-
-            for dkey in inventory_dealer_skeys:
-                aggs = dealer_skey_to_aggs.get(dkey, {})
-                dealer = dealers_for_inventory.get(dkey, {})
-                count = aggs.get("count") or 0
-                total = aggs.get("sum") or 0
-                avg_p = aggs.get("avg") or 0
-
-                dg = dealer.get("dealer_group")
-                if dg:
-                    by_dealer_group[dg]["count"] += count
-                    by_dealer_group[dg]["total_value"] += total
-                    if avg_p > 0:
-                        by_dealer_group[dg]["avg_prices"].append((avg_p, count))
-
-                state = dealer.get("state")
-                if state:
-                    by_state[state]["count"] += count
-                    by_state[state]["total_value"] += total
-                    if avg_p > 0:
-                        by_state[state]["avg_prices"].append((avg_p, count))
-
-                region = dealer.get("region")
-                if region:
-                    by_region[region]["count"] += count
-                    by_region[region]["total_value"] += total
-                    if avg_p > 0:
-                        by_region[region]["avg_prices"].append((avg_p, count))
-
-                city = dealer.get("city")
-                if city:
-                    by_city[city]["count"] += count
-                    by_city[city]["total_value"] += total
-                    if avg_p > 0:
-                        by_city[city]["avg_prices"].append((avg_p, count))
-
-                county = dealer.get("county")
-                if county:
-                    by_county[county]["count"] += count
-                    by_county[county]["total_value"] += total
-                    if avg_p > 0:
-                        by_county[county]["avg_prices"].append((avg_p, count))
-
-            # Format results
-            def format_agg(agg_dict, limit=None):
-                result = []
-                for key, data in sorted(agg_dict.items(), key=lambda x: x[1]["count"], reverse=True):
-                    total_weighted = sum(p * c for p, c in data["avg_prices"])
-                    total_count = sum(c for _, c in data["avg_prices"])
-                    avg_p = total_weighted / total_count if total_count > 0 else 0
-                    result.append({
-                        "name": key,
-                        "count": data["count"],
-                        "total_value": data["total_value"],
-                        "avg_price": avg_p,
-                        "min_price": 0,
-                        "max_price": 0
-                    })
-                return result[:limit] if limit else result
-
             overall_avg = total_value / total_units if total_units > 0 else 0
 
             return {
@@ -1316,264 +1724,127 @@ class FabricGraphQLClient:
                 "avg_price": overall_avg,
                 "min_price": min_price,
                 "max_price": max_price,
-                "by_rv_type": format_agg(by_rv_type, 10),
-                "by_dealer_group": format_agg(by_dealer_group, 10),
-                "by_manufacturer": format_agg(by_manufacturer, 10),
+                "by_rv_type": _format_breakdown(breakdowns["rv_type"], "rv_type", 10),
+                "by_dealer_group": _format_breakdown(breakdowns["dealer_group"], "dealer_group", 10),
+                "by_manufacturer": _format_breakdown(breakdowns["manufacturer"], "manufacturer", 10),
                 "by_condition": sorted(by_condition, key=lambda x: x["count"], reverse=True),
-                "by_state": format_agg(by_state, 65),  # All US states + Canadian provinces
-                "by_region": format_agg(by_region, 10),
-                "by_city": format_agg(by_city, 20),
-                "by_county": format_agg(by_county, 15)
+                "by_state": _format_breakdown(breakdowns["state"], "state", 65),  # All US states + Canadian provinces
+                "by_region": _format_breakdown(breakdowns["region"], "region", 10),
+                "by_city": _format_breakdown(breakdowns["city"], "city", 20),
+                "by_county": _format_breakdown(breakdowns["county"], "county", 15)
             }
 
-        # Build caches for condition filters
-        for cond in condition_filters:
-            key = f"condition:{cond}"
+        def build_entry(filter_field: str, filter_value: str):
+            key = f"{filter_field}:{filter_value}"
             try:
-                self._filtered_aggregations_cache[key] = build_for_filter("condition", cond, key)
-                print(f"    {key}: {self._filtered_aggregations_cache[key]['total_units']:,} units")
+                entry = build_for_filter(filter_field, filter_value, key)
+                print(f"    {key}: {entry['total_units']:,} units")
+                return key, entry
             except Exception as e:
                 print(f"    {key}: FAILED - {str(e)[:100]}")
+                return key, None
 
-        # Build caches for RV type filters
-        for rv_type in rv_type_filters:
-            key = f"rv_type:{rv_type}"
-            try:
-                self._filtered_aggregations_cache[key] = build_for_filter("rv_type", rv_type, key)
-                print(f"    {key}: {self._filtered_aggregations_cache[key]['total_units']:,} units")
-            except Exception as e:
-                print(f"    {key}: FAILED - {str(e)[:100]}")
+        # Build caches for condition and RV type filters, several filters at a time
+        filters = [("condition", cond) for cond in condition_filters] + [("rv_type", rv_type) for rv_type in rv_type_filters]
+        with ThreadPoolExecutor(max_workers=FILTER_CACHE_WORKERS) as executor:
+            for key, entry in executor.map(lambda f: build_entry(*f), filters):
+                if entry is not None:
+                    self._filtered_aggregations_cache[key] = entry
 
         elapsed = (datetime.now() - start).total_seconds()
         print(f"Filtered aggregations cache built in {elapsed:.1f}s ({len(self._filtered_aggregations_cache)} filter combinations)")
 
-    def get_filtered_aggregations_cached(self, filter_key: str) -> dict:
-        """Return pre-computed filtered aggregations if available."""
-        if self._filtered_aggregations_cache is None:
-            return None
-        return self._filtered_aggregations_cache.get(filter_key)
-
-    def _build_aggregations_for_product_skeys(self, product_skeys: list, rv_type_name: str) -> dict:
-        """Build aggregations for inventory items matching given product skeys."""
-        # For large sets, we need to batch the queries
-        # Use condition groupBy with product skey filter
-        BATCH_SIZE = 100  # GraphQL IN operator limited to 100 values
-
-        total_units = 0
-        total_value = 0.0
-        min_price = float('inf')
-        max_price = 0
-        by_condition = defaultdict(lambda: {"count": 0, "total_value": 0, "min_price": float('inf'), "max_price": 0})
-        by_dealer_group = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_state = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_region = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_city = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_county = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-        by_manufacturer = defaultdict(lambda: {"count": 0, "total_value": 0, "avg_prices": []})
-
-        # Process in batches
-        for i in range(0, len(product_skeys), BATCH_SIZE):
-            batch = product_skeys[i:i + BATCH_SIZE]
-            batch_str = ', '.join(str(k) for k in batch)
-            filter_str = f', filter: {{ dim_product_model_skey: {{ in: [{batch_str}] }} }}'
-
-            # Get condition aggregations for this batch
-            cond_query = f"""
-            {{
-                fact_inventory_currents(first: 100{filter_str}) {{
-                    groupBy(fields: [condition]) {{
-                        fields {{ condition }}
-                        aggregations {{
-                            count(field: price)
-                            sum(field: price)
-                            avg(field: price)
-                            min(field: price)
-                            max(field: price)
-                        }}
-                    }}
-                }}
-            }}
-            """
-            cond_result = self.execute_query(cond_query)
-            for g in cond_result.get("fact_inventory_currents", {}).get("groupBy", []):
-                cond = g.get("fields", {}).get("condition")
-                aggs = g.get("aggregations", {})
-                if cond:
-                    count = aggs.get("count") or 0
-                    total = aggs.get("sum") or 0
-                    by_condition[cond]["count"] += count
-                    by_condition[cond]["total_value"] += total
-                    total_units += count
-                    total_value += total
-                    if aggs.get("min") and aggs.get("min") > 0:
-                        by_condition[cond]["min_price"] = min(by_condition[cond]["min_price"], aggs.get("min"))
-                        min_price = min(min_price, aggs.get("min"))
-                    if aggs.get("max"):
-                        by_condition[cond]["max_price"] = max(by_condition[cond]["max_price"], aggs.get("max"))
-                        max_price = max(max_price, aggs.get("max"))
-
-            # Get dealer aggregations for this batch
-            dealer_query = f"""
-            {{
-                fact_inventory_currents(first: 100000{filter_str}) {{
-                    groupBy(fields: [dim_dealership_skey]) {{
-                        fields {{ dim_dealership_skey }}
-                        aggregations {{
-                            count(field: price)
-                            sum(field: price)
-                            avg(field: price)
-                        }}
-                    }}
-                }}
-            }}
-            """
-            dealer_result = self.execute_query(dealer_query)
-            dealer_groups = dealer_result.get("fact_inventory_currents", {}).get("groupBy", [])
-
-            dealer_skeys = [g.get("fields", {}).get("dim_dealership_skey") for g in dealer_groups if g.get("fields", {}).get("dim_dealership_skey")]
-            dealers_data = self.fetch_dimension_data_for_skeys(
-                "dim_dealerships", "dim_dealership_skey", dealer_skeys,
-                ["dim_dealership_skey", "dealer_group", "state", "region", "city", "county"]
-            )
-
-            for g in dealer_groups:
-                dkey = g.get("fields", {}).get("dim_dealership_skey")
-                aggs = g.get("aggregations", {})
-                dealer = dealers_data.get(dkey, {})
-                count = aggs.get("count") or 0
-                total = aggs.get("sum") or 0
-                avg_p = aggs.get("avg") or 0
-
-                dg = dealer.get("dealer_group")
-                if dg:
-                    by_dealer_group[dg]["count"] += count
-                    by_dealer_group[dg]["total_value"] += total
-                    if avg_p > 0:
-                        by_dealer_group[dg]["avg_prices"].append((avg_p, count))
-
-                state = dealer.get("state")
-                if state:
-                    by_state[state]["count"] += count
-                    by_state[state]["total_value"] += total
-                    if avg_p > 0:
-                        by_state[state]["avg_prices"].append((avg_p, count))
-
-                region = dealer.get("region")
-                if region:
-                    by_region[region]["count"] += count
-                    by_region[region]["total_value"] += total
-                    if avg_p > 0:
-                        by_region[region]["avg_prices"].append((avg_p, count))
-
-                city = dealer.get("city")
-                if city:
-                    by_city[city]["count"] += count
-                    by_city[city]["total_value"] += total
-                    if avg_p > 0:
-                        by_city[city]["avg_prices"].append((avg_p, count))
-
-                county = dealer.get("county")
-                if county:
-                    by_county[county]["count"] += count
-                    by_county[county]["total_value"] += total
-                    if avg_p > 0:
-                        by_county[county]["avg_prices"].append((avg_p, count))
-
-        # Get manufacturers from the product skeys we already have
-        products_data = self.fetch_dimension_data_for_skeys(
-            "dim_product_models", "dim_product_model_skey", product_skeys,
-            ["dim_product_model_skey", "manufacturer"]
-        )
-
-        # We need to get manufacturer counts from inventory
-        # Re-query with product skey batches
-        for i in range(0, len(product_skeys), BATCH_SIZE):
-            batch = product_skeys[i:i + BATCH_SIZE]
-            batch_str = ', '.join(str(k) for k in batch)
-            filter_str = f', filter: {{ dim_product_model_skey: {{ in: [{batch_str}] }} }}'
-
-            prod_query = f"""
-            {{
-                fact_inventory_currents(first: 100000{filter_str}) {{
-                    groupBy(fields: [dim_product_model_skey]) {{
-                        fields {{ dim_product_model_skey }}
-                        aggregations {{
-                            count(field: price)
-                            sum(field: price)
-                            avg(field: price)
-                        }}
-                    }}
-                }}
-            }}
-            """
-            prod_result = self.execute_query(prod_query)
-            for g in prod_result.get("fact_inventory_currents", {}).get("groupBy", []):
-                pkey = g.get("fields", {}).get("dim_product_model_skey")
-                aggs = g.get("aggregations", {})
-                product = products_data.get(pkey, {})
-                count = aggs.get("count") or 0
-                total = aggs.get("sum") or 0
-                avg_p = aggs.get("avg") or 0
+        # A partial build (some filters failed) is not kept for the next start
+        if len(self._filtered_aggregations_cache) == len(filters):
+            self._save_aggregations_snapshot()
 
-                mfr = product.get("manufacturer")
-                if mfr:
-                    by_manufacturer[mfr]["count"] += count
-                    by_manufacturer[mfr]["total_value"] += total
-                    if avg_p > 0:
-                        by_manufacturer[mfr]["avg_prices"].append((avg_p, count))
+    def load_aggregations_snapshot(self) -> bool:
+        """Load both aggregation caches from a snapshot of the current inventory, if there is one.
 
-        if min_price == float('inf'):
-            min_price = 0
+        The snapshot must be younger than AGGREGATION_SNAPSHOT_TTL and match the
+        inventory's per-condition, per-product-model and per-dealership totals (one query).
+        """
+        if not DIMENSION_SNAPSHOT_DIR:
+            return False
+        try:
+            snapshot = _read_snapshot("aggregations.json", AGGREGATION_SNAPSHOT_TTL)
+            if snapshot is None:
+                return False
+            result = self.execute_query(INVENTORY_TOTALS_QUERY)
+        except Exception as e:
+            print(f"Error loading aggregations snapshot: {e}")
+            return False
+
+        version = _inventory_version(result)
+        if snapshot["version"] != version:
+            print("Aggregations snapshot is out of date (inventory totals changed)")
+            return False
+        self._aggregations_cache = snapshot["aggregations"]
+        self._filtered_aggregations_cache = snapshot["filtered"]
+        self._aggregations_version = version
+        print(f"Aggregations loaded from snapshot ({len(self._filtered_aggregations_cache)} filter combinations)")
+        return True
+
+    def _save_aggregations_snapshot(self) -> bool:
+        """Write both aggregation caches, with the inventory version they were built from, to DIMENSION_SNAPSHOT_DIR."""
+        if not DIMENSION_SNAPSHOT_DIR or self._aggregations_cache is None or self._aggregations_version is None:
+            return False
+        try:
+            _write_snapshot("aggregations.json", {
+                "version": self._aggregations_version,
+                "aggregations": self._aggregations_cache,
+                "filtered": self._filtered_aggregations_cache,
+            })
+        except Exception as e:
+            print(f"Error saving aggregations snapshot: {e}")
+            return False
+        return True
 
-        # Format results
-        def format_agg(agg_dict, limit=None):
-            result = []
-            for key, data in sorted(agg_dict.items(), key=lambda x: x[1]["count"], reverse=True):
-                if "avg_prices" in data:
-                    total_weighted = sum(p * c for p, c in data["avg_prices"])
-                    total_count = sum(c for _, c in data["avg_prices"])
-                    avg_p = total_weighted / total_count if total_count > 0 else 0
-                else:
-                    avg_p = 0
-                result.append({
-                    "name": key,
-                    "count": data["count"],
-                    "total_value": data["total_value"],
-                    "avg_price": avg_p,
-                    "min_price": data.get("min_price", 0) if data.get("min_price") != float('inf') else 0,
-                    "max_price": data.get("max_price", 0)
-                })
-            return result[:limit] if limit else result
+    def _fetch_inventory_cube(self) -> Optional[pd.DataFrame]:
+        """Price totals per (product, dealer, condition, rv_type) cell, in one groupBy query.
 
-        overall_avg = total_value / total_units if total_units > 0 else 0
+        Any groupBy over those fields, filtered on any of them, can be summed from the cells.
+        Returns None if the query fails or the cells don't fit one response.
+        """
+        query = """
+        {
+            fact_inventory_currents(first: 100000) {
+                groupBy(fields: [dim_product_model_skey, dim_dealership_skey, condition, rv_type]) {
+                    fields { dim_product_model_skey dim_dealership_skey condition rv_type }
+                    aggregations {
+                        count(field: price)
+                        sum(field: price)
+                        min(field: price)
+                        max(field: price)
+                    }
+                }
+            }
+        }
+        """
+        try:
+            groups = self.execute_query(query).get("fact_inventory_currents", {}).get("groupBy", [])
+        except Exception as e:
+            print(f"  Inventory cube query failed, using per-filter queries: {str(e)[:100]}")
+            return None
+        if len(groups) >= 100000:
+            print("  Inventory cube truncated, using per-filter queries")
+            return None
 
-        # Format condition results
-        cond_list = []
-        for cond, data in by_condition.items():
-            cond_list.append({
-                "name": cond,
-                "count": data["count"],
-                "total_value": data["total_value"],
-                "avg_price": data["total_value"] / data["count"] if data["count"] > 0 else 0,
-                "min_price": data["min_price"] if data["min_price"] != float('inf') else 0,
-                "max_price": data["max_price"]
-            })
+        fields = ["dim_product_model_skey", "dim_dealership_skey", "condition", "rv_type"]
+        cube = pd.DataFrame({
+            field: pd.Series([g.get("fields", {}).get(field) for g in groups], dtype=object)
+            for field in fields
+        })
+        for aggregation in ("count", "sum", "min", "max"):
+            cube[aggregation] = pd.to_numeric(pd.Series([g.get("aggregations", {}).get(aggregation) for g in groups], dtype=object))
+        print(f"  Inventory cube: {len(cube)} cells")
+        return cube
 
-        return {
-            "total_units": total_units,
-            "total_value": total_value,
-            "avg_price": overall_avg,
-            "min_price": min_price,
-            "max_price": max_price,
-            "by_rv_type": [{"name": rv_type_name, "count": total_units, "total_value": total_value, "avg_price": overall_avg, "min_price": min_price, "max_price": max_price}],
-            "by_dealer_group": format_agg(by_dealer_group, 10),
-            "by_manufacturer": format_agg(by_manufacturer, 10),
-            "by_condition": sorted(cond_list, key=lambda x: x["count"], reverse=True),
-            "by_state": format_agg(by_state, 65),  # All US states + Canadian provinces
-            "by_region": format_agg(by_region, 10),
-            "by_city": format_agg(by_city, 20),
-            "by_county": format_agg(by_county, 15)
-        }
+    def get_filtered_aggregations_cached(self, filter_key: str) -> dict:
+        """Return pre-computed filtered aggregations if available."""
+        if self._filtered_aggregations_cache is None:
+            return None
+        return self._filtered_aggregations_cache.get(filter_key)
 
     def load_inventory_cache(self):
         """Load all inventory with joined dimension data for fast filtered queries AND display.
@@ -1583,6 +1854,13 @@ class FabricGraphQLClient:
         if self._inventory_cache is not None:
             return
 
+        with self._inventory_lock:
+            if self._inventory_cache is not None:
+                return
+            self._build_inventory_cache()
+
+    def _build_inventory_cache(self):
+        """Fetch inventory and join it with the dimension caches."""
         print("Loading inventory cache (using manual joins)...")
         start = datetime.now()
 
@@ -1595,8 +1873,8 @@ class FabricGraphQLClient:
             include_nested=False
         )
 
-        # Build cache by joining with dimension caches
-        self._inventory_cache = []
+        # Build cache by joining with dimension caches (published only once complete)
+        inventory_cache = []
         for item in items:
             # Join with dimension caches using skeys
             product_model = self._products_cache.get(item.get("dim_product_model_skey")) or {}
@@ -1607,7 +1885,7 @@ class FabricGraphQLClient:
             dealer_state = dealer.get("state")
             location = f"{dealer_city}, {dealer_state}" if dealer_city and dealer_state else dealer_state or ""
 
-            self._inventory_cache.append({
+            inventory_cache.append({
                 "stock_number": item.get("stock_number"),
                 "price": item.get("price") or 0,
                 "condition": item.get("condition"),
@@ -1630,9 +1908,37 @@ class FabricGraphQLClient:
                 "dim_dealership_skey": item.get("dim_dealership_skey"),
             })
 
+        self._inventory_arrays = self._build_inventory_arrays(inventory_cache)
+        self._inventory_cache = inventory_cache
         elapsed = (datetime.now() - start).total_seconds()
         print(f"Inventory cache loaded: {len(self._inventory_cache)} items in {elapsed:.1f}s")
 
+    def _build_inventory_arrays(self, inventory_cache: list) -> dict:
+        """Columnar copies of the filterable inventory fields, aligned with the cache list."""
+        # Categoricals, so a filter compares integer codes instead of strings
+        arrays = {
+            field: pd.Categorical([item[field] for item in inventory_cache])
+            for field in INVENTORY_FILTER_FIELDS + INVENTORY_BREAKDOWN_FIELDS
+        }
+        arrays["price"] = np.array([item["price"] for item in inventory_cache], dtype=np.float64)
+        return arrays
+
+    def _filter_inventory_rows(self, min_price: Optional[float] = None, max_price: Optional[float] = None, **filters) -> np.ndarray:
+        """Positions of the cached inventory items matching every filter, from one boolean mask."""
+        arrays = self._inventory_arrays
+        mask = np.ones(len(arrays["price"]), dtype=bool)
+        for field, value in filters.items():
+            if value:
+                categories = arrays[field].categories
+                if value not in categories:
+                    return np.array([], dtype=np.intp)
+                mask &= arrays[field].codes == categories.get_loc(value)
+        if min_price is not None:
+            mask &= arrays["price"] >= min_price
+        if max_price is not None:
+            mask &= arrays["price"] <= max_price
+        return np.flatnonzero(mask)
+
     def get_cached_inventory(
         self,
         dealer: Optional[str] = None,
@@ -1648,28 +1954,21 @@ class FabricGraphQLClient:
         """Get inventory from cache with filters - instant response!"""
         self.load_inventory_cache()
 
-        # Filter in memory
-        filtered = self._inventory_cache
-        if dealer:
-            filtered = [i for i in filtered if i.get("dealership") == dealer]
-        if dealer_group:
-            filtered = [i for i in filtered if i.get("dealer_group") == dealer_group]
-        if rv_type:
-            filtered = [i for i in filtered if i.get("rv_type") == rv_type]
-        if manufacturer:
-            filtered = [i for i in filtered if i.get("manufacturer") == manufacturer]
-        if condition:
-            filtered = [i for i in filtered if i.get("condition") == condition]
-        if state:
-            filtered = [i for i in filtered if i.get("state") == state]
-        if min_price is not None:
-            filtered = [i for i in filtered if (i.get("price") or 0) >= min_price]
-        if max_price is not None:
-            filtered = [i for i in filtered if (i.get("price") or 0) <= max_price]
+        # Filter in memory (vectorized over the column arrays)
+        rows = self._filter_inventory_rows(
+            dealership=dealer,
+            dealer_group=dealer_group,
+            rv_type=rv_type,
+            manufacturer=manufacturer,
+            condition=condition,
+            state=state,
+            min_price=min_price,
+            max_price=max_price,
+        )
 
-        # Sort by price DESC and limit
-        filtered.sort(key=lambda x: x.get("price") or 0, reverse=True)
-        filtered = filtered[:limit]
+        # Sort by price DESC (ties keep cache order) and limit - only these items are materialized
+        rows = rows[np.argsort(-self._inventory_arrays["price"][rows], kind="stable")][:limit]
+        filtered = [self._inventory_cache[i] for i in rows]
 
         # Format for response
         results = []
@@ -1713,106 +2012,40 @@ class FabricGraphQLClient:
         # Ensure inventory cache is loaded
         self.load_inventory_cache()
 
-        # Filter in memory (instant!)
-        filtered = self._inventory_cache
-        if rv_type:
-            filtered = [i for i in filtered if i["rv_type"] == rv_type]
-        if dealer_group:
-            filtered = [i for i in filtered if i["dealer_group"] == dealer_group]
-        if manufacturer:
-            filtered = [i for i in filtered if i["manufacturer"] == manufacturer]
-        if condition:
-            filtered = [i for i in filtered if i["condition"] == condition]
-        if state:
-            filtered = [i for i in filtered if i["state"] == state]
-        if min_price is not None:
-            filtered = [i for i in filtered if i["price"] >= min_price]
-        if max_price is not None:
-            filtered = [i for i in filtered if i["price"] <= max_price]
-
-        # Aggregate
-        by_rv_type = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_dealer_group = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_manufacturer = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_condition = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_state = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_region = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_city = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_county = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
+        # Filter in memory (instant!) - one vectorized mask over the column arrays
+        rows = self._filter_inventory_rows(
+            rv_type=rv_type,
+            dealer_group=dealer_group,
+            manufacturer=manufacturer,
+            condition=condition,
+            state=state,
+            min_price=min_price,
+            max_price=max_price,
+        )
 
-        total_value = 0.0
-        all_prices = []
+        # Breakdowns and overall totals as array reductions over the filtered rows
+        arrays = self._inventory_arrays
+        prices = arrays["price"][rows]
 
-        for item in filtered:
-            price = item["price"]
-            total_value += price
-            if price > 0:
-                all_prices.append(price)
-
-            if item["rv_type"]:
-                by_rv_type[item["rv_type"]]["count"] += 1
-                by_rv_type[item["rv_type"]]["total_value"] += price
-                if price > 0:
-                    by_rv_type[item["rv_type"]]["prices"].append(price)
-
-            if item["dealer_group"]:
-                by_dealer_group[item["dealer_group"]]["count"] += 1
-                by_dealer_group[item["dealer_group"]]["total_value"] += price
-
-            if item["manufacturer"]:
-                by_manufacturer[item["manufacturer"]]["count"] += 1
-                by_manufacturer[item["manufacturer"]]["total_value"] += price
-
-            if item["condition"]:
-                by_condition[item["condition"]]["count"] += 1
-                by_condition[item["condition"]]["total_value"] += price
-                if price > 0:
-                    by_condition[item["condition"]]["prices"].append(price)
-
-            if item["state"]:
-                by_state[item["state"]]["count"] += 1
-                by_state[item["state"]]["total_value"] += price
-
-            if item.get("region"):
-                by_region[item["region"]]["count"] += 1
-                by_region[item["region"]]["total_value"] += price
-
-            if item.get("city"):
-                by_city[item["city"]]["count"] += 1
-                by_city[item["city"]]["total_value"] += price
-
-            if item.get("county"):
-                by_county[item["county"]]["count"] += 1
-                by_county[item["county"]]["total_value"] += price
-
-        def format_agg(agg_dict, limit=10):
-            result = []
-            for key, data in sorted(agg_dict.items(), key=lambda x: x[1]["count"], reverse=True):
-                prices = data.get("prices", [])
-                result.append({
-                    "name": key,
-                    "count": data["count"],
-                    "total_value": data["total_value"],
-                    "avg_price": sum(prices) / len(prices) if prices else (data["total_value"] / data["count"] if data["count"] > 0 else 0),
-                    "min_price": min(prices) if prices else 0,
-                    "max_price": max(prices) if prices else 0,
-                })
-            return result[:limit]
+        def format_agg(field, limit=10, with_prices=False):
+            return _inventory_breakdown(arrays[field][rows], prices, limit, with_prices)
 
+        positive_prices = prices[prices > 0]
+        has_prices = positive_prices.size > 0
         return {
-            "total_units": len(filtered),
-            "total_value": total_value,
-            "avg_price": sum(all_prices) / len(all_prices) if all_prices else 0,
-            "min_price": min(all_prices) if all_prices else 0,
-            "max_price": max(all_prices) if all_prices else 0,
-            "by_rv_type": format_agg(by_rv_type, 10),
-            "by_dealer_group": format_agg(by_dealer_group, 10),
-            "by_manufacturer": format_agg(by_manufacturer, 10),
-            "by_condition": format_agg(by_condition),
-            "by_state": format_agg(by_state, 65),  # All US states + Canadian provinces
-            "by_region": format_agg(by_region, 10),
-            "by_city": format_agg(by_city, 20),
-            "by_county": format_agg(by_county, 15),
+            "total_units": len(rows),
+            "total_value": float(prices.sum()),
+            "avg_price": float(positive_prices.mean()) if has_prices else 0,
+            "min_price": float(positive_prices.min()) if has_prices else 0,
+            "max_price": float(positive_prices.max()) if has_prices else 0,
+            "by_rv_type": format_agg("rv_type", 10, with_prices=True),
+            "by_dealer_group": format_agg("dealer_group", 10),
+            "by_manufacturer": format_agg("manufacturer", 10),
+            "by_condition": format_agg("condition", 10, with_prices=True),
+            "by_state": format_agg("state", 65),  # All US states + Canadian provinces
+            "by_region": format_agg("region", 10),
+            "by_city": format_agg("city", 20),
+            "by_county": format_agg("county", 15),
         }
 
     def get_native_aggregations(self) -> dict:
@@ -1845,7 +2078,6 @@ class FabricGraphQLClient:
         by_condition = []
         total_units = 0
         total_value = 0.0
-        all_prices = []
 
         for group in condition_groups:
             fields = group.get("fields", {})
@@ -1868,8 +2100,6 @@ class FabricGraphQLClient:
                 })
                 total_units += count
                 total_value += total
-                if avg_p > 0:
-                    all_prices.extend([avg_p] * count)  # Approximate for overall avg
 
         # 2. Get aggregations by product to map to rv_type
         product_query = """
@@ -1917,8 +2147,8 @@ class FabricGraphQLClient:
                 products[p["dim_product_model_skey"]] = p
 
         # Aggregate by rv_type
-        by_rv_type_dict = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
-        by_manufacturer_dict = defaultdict(lambda: {"count": 0, "total_value": 0, "prices": []})
+        by_rv_type_dict = defaultdict(lambda: {"count": 0, "total_value": 0, "weighted_sum": 0.0, "weighted_count": 0, "min_avg": float('inf'), "max_avg": 0})
+        by_manufacturer_dict = defaultdict(lambda: {"count": 0, "total_value": 0, "weighted_sum": 0.0, "weighted_count": 0, "min_avg": float('inf'), "max_avg": 0})
 
         for group in product_groups:
             fields = group.get("fields", {})
@@ -1936,30 +2166,35 @@ class FabricGraphQLClient:
                 by_rv_type_dict[rv_type]["count"] += count
                 by_rv_type_dict[rv_type]["total_value"] += total
                 if avg_p > 0:
-                    by_rv_type_dict[rv_type]["prices"].append((avg_p, count))
+                    by_rv_type_dict[rv_type]["weighted_sum"] += avg_p * count
+                    by_rv_type_dict[rv_type]["weighted_count"] += count
+                    by_rv_type_dict[rv_type]["min_avg"] = min(by_rv_type_dict[rv_type]["min_avg"], avg_p)
+                    by_rv_type_dict[rv_type]["max_avg"] = max(by_rv_type_dict[rv_type]["max_avg"], avg_p)
 
             if manufacturer:
                 by_manufacturer_dict[manufacturer]["count"] += count
                 by_manufacturer_dict[manufacturer]["total_value"] += total
                 if avg_p > 0:
-                    by_manufacturer_dict[manufacturer]["prices"].append((avg_p, count))
+                    by_manufacturer_dict[manufacturer]["weighted_sum"] += avg_p * count
+                    by_manufacturer_dict[manufacturer]["weighted_count"] += count
+                    by_manufacturer_dict[manufacturer]["min_avg"] = min(by_manufacturer_dict[manufacturer]["min_avg"], avg_p)
+                    by_manufacturer_dict[manufacturer]["max_avg"] = max(by_manufacturer_dict[manufacturer]["max_avg"], avg_p)
 
         def format_dict_aggregation(agg_dict):
             result = []
             for key, data in sorted(agg_dict.items(), key=lambda x: x[1]["count"], reverse=True):
                 # Weighted average price
-                total_weighted = sum(p * c for p, c in data["prices"])
-                total_count = sum(c for _, c in data["prices"])
-                avg_p = total_weighted / total_count if total_count > 0 else 0
+                total_count = data["weighted_count"]
+                avg_p = data["weighted_sum"] / total_count if total_count > 0 else 0
 
-                prices_only = [p for p, _ in data["prices"]]
+                priced = data["min_avg"] != float('inf')
                 result.append({
                     "name": key,
                     "count": data["count"],
                     "total_value": data["total_value"],
                     "avg_price": avg_p,
-                    "min_price": min(prices_only) if prices_only else 0,
-                    "max_price": max(prices_only) if prices_only else 0
+                    "min_price": data["min_avg"] if priced else 0,
+                    "max_price": data["max_avg"] if priced else 0
                 })
             return result
 
@@ -2059,7 +2294,7 @@ if USE_DELTALAKE:
     print("  Expected startup time: ~50 seconds")
     print("  Full 187K inventory (no limits)")
     print("=" * 60)
-    client = DeltaLakeClient()
+    client = deltalake_client
 else:
     print("=" * 60)
     print("USING GRAPHQL API")
@@ -2080,8 +2315,9 @@ async def startup_event():
         print("Server starting - pre-loading GraphQL caches...")
         client.load_cache()  # Products + Dealers dimension tables
         client.load_inventory_cache()  # Inventory with joined dimensions
-        client.build_aggregations_cache()  # Pre-computed aggregations (no filters)
-        client.build_filtered_aggregations_cache()  # Pre-computed aggregations for common filters
+        if not client.load_aggregations_snapshot():  # Reused while the inventory is unchanged
+            client.build_aggregations_cache()  # Pre-computed aggregations (no filters)
+            client.build_filtered_aggregations_cache()  # Pre-computed aggregations for common filters
         print("Server ready - all GraphQL caches loaded!")
 
 
@@ -2147,6 +2383,11 @@ async def test_relationship():
 async def get_filters():
     """Get available filter options (RV types, states, conditions)."""
     try:
+        if USE_DELTALAKE:
+            # Delta Lake pre-serializes the options at cache load
+            cached_json = client.get_filter_options_json()
+            if cached_json is not None:
+                return Response(content=cached_json, media_type="application/json")
         options = client.get_filter_options()
         return FilterOptionsResponse(**options)
     except Exception as e:
@@ -2157,6 +2398,11 @@ async def get_filters():
 async def get_dealers():
     """Get list of available dealers."""
     try:
+        if USE_DELTALAKE:
+            # Delta Lake pre-serializes the sorted dealer list at cache load
+            cached_json = client.get_dealers_json()
+            if cached_json is not None:
+                return Response(content=cached_json, media_type="application/json")
         dealers = client.list_dealers()
         return DealersResponse(dealers=dealers, count=len(dealers))
     except Exception as e:
@@ -2355,21 +2601,9 @@ async def get_agg_rv_type(limit: Optional[int] = None):
         items = client.fetch_all_inventory(fields=["dim_product_model_skey", "price"])
 
         # Aggregate by rv_type using CACHED products (no API calls!)
-        by_type = defaultdict(lambda: {"count": 0, "total_value": 0})
-        for item in items:
-            product = client.get_product(item.get("dim_product_model_skey"))
-            rv_type = product.get("rv_type")
-            if rv_type:
-                by_type[rv_type]["count"] += 1
-                by_type[rv_type]["total_value"] += item.get("price") or 0
-
-        # Sort (and optionally limit)
-        sorted_types = sorted(by_type.items(), key=lambda x: x[1]["count"], reverse=True)
-        if limit:
-            sorted_types = sorted_types[:limit]
         return {
             "total_sample": len(items),
-            "by_rv_type": [{"name": k, "count": v["count"], "total_value": v["total_value"]} for k, v in sorted_types]
+            "by_rv_type": _dimension_totals(items, "dim_product_model_skey", client.get_product, "rv_type", limit)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2386,20 +2620,9 @@ async def get_agg_dealer_group(limit: Optional[int] = None):
         items = client.fetch_all_inventory(fields=["dim_dealership_skey", "price"])
 
         # Aggregate using CACHED dealers (no API calls!)
-        by_group = defaultdict(lambda: {"count": 0, "total_value": 0})
-        for item in items:
-            dealer = client.get_dealer(item.get("dim_dealership_skey"))
-            group = dealer.get("dealer_group")
-            if group:
-                by_group[group]["count"] += 1
-                by_group[group]["total_value"] += item.get("price") or 0
-
-        sorted_groups = sorted(by_group.items(), key=lambda x: x[1]["count"], reverse=True)
-        if limit:
-            sorted_groups = sorted_groups[:limit]
         return {
             "total_sample": len(items),
-            "by_dealer_group": [{"name": k, "count": v["count"], "total_value": v["total_value"]} for k, v in sorted_groups]
+            "by_dealer_group": _dimension_totals(items, "dim_dealership_skey", client.get_dealer, "dealer_group", limit)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2416,20 +2639,9 @@ async def get_agg_manufacturer(limit: Optional[int] = None):
         items = client.fetch_all_inventory(fields=["dim_product_model_skey", "price"])
 
         # Aggregate using CACHED products (no API calls!)
-        by_mfr = defaultdict(lambda: {"count": 0, "total_value": 0})
-        for item in items:
-            product = client.get_product(item.get("dim_product_model_skey"))
-            mfr = product.get("manufacturer")
-            if mfr:
-                by_mfr[mfr]["count"] += 1
-                by_mfr[mfr]["total_value"] += item.get("price") or 0
-
-        sorted_mfrs = sorted(by_mfr.items(), key=lambda x: x[1]["count"], reverse=True)
-        if limit:
-            sorted_mfrs = sorted_mfrs[:limit]
         return {
             "total_sample": len(items),
-            "by_manufacturer": [{"name": k, "count": v["count"], "total_value": v["total_value"]} for k, v in sorted_mfrs]
+            "by_manufacturer": _dimension_totals(items, "dim_product_model_skey", client.get_product, "manufacturer", limit)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2446,20 +2658,9 @@ async def get_agg_state(limit: Optional[int] = None):
         items = client.fetch_all_inventory(fields=["dim_dealership_skey", "price"])
 
         # Aggregate using CACHED dealers (no API calls!)
-        by_state = defaultdict(lambda: {"count": 0, "total_value": 0})
-        for item in items:
-            dealer = client.get_dealer(item.get("dim_dealership_skey"))
-            state = dealer.get("state")
-            if state:
-                by_state[state]["count"] += 1
-                by_state[state]["total_value"] += item.get("price") or 0
-
-        sorted_states = sorted(by_state.items(), key=lambda x: x[1]["count"], reverse=True)
-        if limit:
-            sorted_states = sorted_states[:limit]
         return {
             "total_sample": len(items),
-            "by_state": [{"name": k, "count": v["count"], "total_value": v["total_value"]} for k, v in sorted_states]
+            "by_state": _dimension_totals(items, "dim_dealership_skey", client.get_dealer, "state", limit)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2489,6 +2690,11 @@ async def get_aggregated_summaries(
 
         if not has_filters:
             # FAST PATH: Return cached aggregations (instant!)
+            if USE_DELTALAKE:
+                # Delta Lake pre-serializes the response bytes at cache load
+                cached_json = client.get_fast_aggregations_json()
+                if cached_json is not None:
+                    return Response(content=cached_json, media_type="application/json")
             return client.get_fast_aggregations()
 
         # Check for pre-computed single-filter caches (instant!)
@@ -2504,6 +2710,12 @@ async def get_aggregated_summaries(
 
         if single_filter_count == 1 and not has_price_filter:
             # Try pre-computed cache
+            if USE_DELTALAKE and (condition or rv_class):
+                cache_key = f"condition:{condition}" if condition else f"rv_type:{rv_class}"
+                cached_json = client.get_filtered_aggregations_cached_json(cache_key)
+                if cached_json is not None:
+                    return Response(content=cached_json, media_type="application/json")
+
             if condition:
                 cached = client.get_filtered_aggregations_cached(f"condition:{condition}")
                 if cached:
@@ -2515,6 +2727,22 @@ async def get_aggregated_summaries(
 
         # FILTERED PATH: Use cached inventory data + filter in memory
         # (Falls back here for multi-filter or non-cached single filters)
+        if USE_DELTALAKE:
+            # Delta Lake caches the encoded bytes per normalized filter combination
+            cached_json = client.get_filtered_aggregations_json(
+                rv_type=rv_class,
+                dealer_group=dealer_group,
+                manufacturer=manufacturer,
+                condition=condition,
+                state=state,
+                model=model,
+                floorplan=floorplan,
+                min_price=min_price,
+                max_price=max_price
+            )
+            if cached_json is not None:
+                return Response(content=cached_json, media_type="application/json")
+
         return client.get_filtered_aggregations(
             rv_type=rv_class,
             dealer_group=dealer_group,
@@ -2545,7 +2773,8 @@ async def get_sales_velocity(
     model: Optional[str] = Query(default=None, description="Filter by model"),
     floorplan: Optional[str] = Query(default=None, description="Filter by floorplan"),
     start_date: Optional[str] = Query(default=None, description="Start date (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(default=None, description="End date (YYYY-MM-DD)")
+    end_date: Optional[str] = Query(default=None, description="End date (YYYY-MM-DD)"),
+    include: Optional[str] = Query(default=None, description="Comma-separated breakdowns to compute (e.g. by_rv_type,by_month); all if omitted")
 ):
     """
     Get sales velocity metrics including days to sell, sales trends, and breakdowns by dimensions.
@@ -2566,6 +2795,22 @@ async def get_sales_velocity(
                 "avg_days_to_sell": None,
             }
 
+        # Unfiltered and single condition / rv_type sales velocity (all breakdowns) is pre-serialized at cache load
+        if include is None:
+            cached_json = client.get_sales_velocity_json(
+                rv_type=rv_class,
+                dealer_group=dealer_group,
+                manufacturer=manufacturer,
+                condition=condition,
+                state=state,
+                model=model,
+                floorplan=floorplan,
+                start_date=start_date,
+                end_date=end_date
+            )
+            if cached_json is not None:
+                return Response(content=cached_json, media_type="application/json")
+
         return client.get_sales_velocity_filtered(
             rv_type=rv_class,
             dealer_group=dealer_group,
@@ -2575,7 +2820,8 @@ async def get_sales_velocity(
             model=model,
             floorplan=floorplan,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            include=include
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -28,10 +28,16 @@ Prerequisites:
     az login
 """
 
+import hashlib
+import json
+import os
+import stat
+import tempfile
 import pandas as pd
+import pyarrow.feather as feather
 from deltalake import DeltaTable
 from azure.identity import DefaultAzureCredential
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import time
 
 # =============================================================================
@@ -51,6 +57,40 @@ CACHE_TABLES = {
     'dim_date': 'dates',
 }
 
+# Directory for Arrow IPC snapshots of the built cache (empty string disables)
+SNAPSHOT_DIR = os.getenv('DELTA_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'delta_cache'))
+
+# Columns read from each table - the parquet reader skips every other column chunk.
+# Facts drop the per-model median/overpriced metrics (never served from the cache);
+# dimensions keep only their join key plus the attributes copied onto fact rows.
+CACHE_COLUMNS = {
+    'fact_inventory_current': [
+        'stock_number', 'dim_dealership_skey', 'dim_product_model_skey', 'dim_product_skey',
+        'condition', 'first_seen_date', 'last_seen_date', 'days_on_lot', 'price',
+    ],
+    'fact_inventory_sales': [
+        'stock_number', 'sold_date_skey', 'dim_dealership_skey', 'dim_product_model_skey',
+        'dim_product_skey', 'condition', 'first_seen_date', 'last_seen_date', 'days_to_sell',
+        'sale_price',
+    ],
+    'dim_product_model': [
+        'dim_product_model_skey', 'rv_type', 'manufacturer', 'model', 'parent_company',
+        'company', 'model_year',
+    ],
+    'dim_product': ['dim_product_skey', 'floorplan'],
+    'dim_dealership': [
+        'dim_dealership_skey', 'dealer_group', 'dealership', 'state', 'region', 'city', 'county',
+    ],
+    'dim_date': ['dim_date_skey', 'calendar_date', 'month_year', 'quarter_year'],
+}
+
+# Snapshots are only reused by the code and column set that built them, so a change to
+# build_cache or CACHE_COLUMNS rebuilds instead of serving frames in the old shape
+with open(__file__, 'rb') as _source:
+    SNAPSHOT_SOURCE_KEY = hashlib.sha1(
+        _source.read() + json.dumps(CACHE_COLUMNS, sort_keys=True).encode()
+    ).hexdigest()
+
 
 # =============================================================================
 # AUTHENTICATION
@@ -84,12 +124,23 @@ def get_table_uri(table: str) -> str:
     return f"abfss://{WORKSPACE_ID}@onelake.dfs.fabric.microsoft.com/{LAKEHOUSE_ID}/Tables/gold/{table}"
 
 
-def read_table(table: str) -> Optional[pd.DataFrame]:
-    """Read a Delta table into pandas DataFrame."""
+def read_table(table: str, columns: List[str] = None, filters: Any = None) -> Optional[pd.DataFrame]:
+    """
+    Read a Delta table into pandas DataFrame.
+
+    Args:
+        table: Table name
+        columns: List of columns to read (None for all)
+        filters: Row filters pushed into the scan - DNF tuples, e.g. [('condition', '=', 'NEW')],
+                 or a pyarrow.dataset.Expression. Files/row groups whose min/max statistics
+                 can't match are skipped.
+    """
     uri = get_table_uri(table)
     try:
         dt = DeltaTable(uri, storage_options=get_storage_options())
-        return dt.to_pandas()
+        arrow_table = dt.to_pyarrow_table(columns=columns, filters=filters)
+        # Release Arrow buffers column by column during conversion (roughly halves peak memory)
+        return arrow_table.to_pandas(split_blocks=True, self_destruct=True)
     except Exception as e:
         print(f"Error reading {table}: {e}")
         return None
@@ -131,22 +182,22 @@ def build_cache(verbose: bool = True) -> Dict[str, Any]:
     log("Loading dimension tables...")
 
     log("  - dim_product_model...")
-    cache['products'] = read_table('dim_product_model')
+    cache['products'] = read_table('dim_product_model', columns=CACHE_COLUMNS['dim_product_model'])
     if cache['products'] is not None:
         log(f"    Loaded {len(cache['products']):,} product models")
 
     log("  - dim_product (floorplans)...")
-    cache['floorplans'] = read_table('dim_product')
+    cache['floorplans'] = read_table('dim_product', columns=CACHE_COLUMNS['dim_product'])
     if cache['floorplans'] is not None:
         log(f"    Loaded {len(cache['floorplans']):,} floorplans")
 
     log("  - dim_dealership...")
-    cache['dealers'] = read_table('dim_dealership')
+    cache['dealers'] = read_table('dim_dealership', columns=CACHE_COLUMNS['dim_dealership'])
     if cache['dealers'] is not None:
         log(f"    Loaded {len(cache['dealers']):,} dealers")
 
     log("  - dim_date...")
-    cache['dates'] = read_table('dim_date')
+    cache['dates'] = read_table('dim_date', columns=CACHE_COLUMNS['dim_date'])
     if cache['dates'] is not None:
         log(f"    Loaded {len(cache['dates']):,} dates")
 
@@ -156,12 +207,12 @@ def build_cache(verbose: bool = True) -> Dict[str, Any]:
     log("Loading fact tables...")
 
     log("  - fact_inventory_current...")
-    inventory_raw = read_table('fact_inventory_current')
+    inventory_raw = read_table('fact_inventory_current', columns=CACHE_COLUMNS['fact_inventory_current'])
     if inventory_raw is not None:
         log(f"    Loaded {len(inventory_raw):,} inventory items")
 
     log("  - fact_inventory_sales...")
-    sales_raw = read_table('fact_inventory_sales')
+    sales_raw = read_table('fact_inventory_sales', columns=CACHE_COLUMNS['fact_inventory_sales'])
     if sales_raw is not None:
         log(f"    Loaded {len(sales_raw):,} sales records")
 
@@ -384,6 +435,148 @@ def build_aggregations(cache: Dict[str, Any]) -> Dict[str, Any]:
     return agg
 
 
+# =============================================================================
+# CACHE SNAPSHOTS
+# =============================================================================
+
+def get_table_versions() -> Dict[str, int]:
+    """Get the current Delta version of every cached table."""
+    return {
+        table: DeltaTable(get_table_uri(table), storage_options=get_storage_options()).version()
+        for table in CACHE_TABLES
+    }
+
+
+def _check_snapshot_dir(snapshot_dir: str, create: bool = False):
+    """
+    Raise PermissionError unless snapshot_dir is owned by this user and not writable by
+    anyone else (POSIX only), so nobody else can plant frames or a stamp in a shared /tmp.
+    With create, a missing directory is first created readable only by this user.
+    """
+    if create:
+        os.makedirs(snapshot_dir, mode=0o700, exist_ok=True)
+    st = os.lstat(snapshot_dir)
+    if not hasattr(os, 'getuid'):
+        return
+    if stat.S_ISLNK(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{snapshot_dir} must be owned by this user and not writable by others")
+
+
+def save_snapshot(cache: Dict[str, Any], snapshot_dir: str = SNAPSHOT_DIR,
+                  source_key: str = SNAPSHOT_SOURCE_KEY) -> bool:
+    """
+    Write the built cache to uncompressed Arrow IPC (Feather v2) files.
+
+    Categorical and nullable dtypes round-trip, so a process restart can memory-map
+    the snapshot instead of re-reading and re-joining the Delta tables. The version
+    stamp is written last and only matches if every table is still at that version
+    and source_key (the code that built and converted the frames) is unchanged.
+    """
+    if not snapshot_dir:
+        return False
+    start_time = time.time()
+    try:
+        versions = get_table_versions()
+        _check_snapshot_dir(snapshot_dir, create=True)
+        # Drop the old stamp first so a partially written snapshot is never loaded,
+        # along with any responses pre-computed from the old snapshot
+        stamp_path = os.path.join(snapshot_dir, 'stamp.json')
+        for path in (stamp_path, os.path.join(snapshot_dir, 'responses.json')):
+            if os.path.exists(path):
+                os.remove(path)
+        frames = []
+        for key, value in cache.items():
+            if isinstance(value, pd.DataFrame):
+                tmp_path = os.path.join(snapshot_dir, f"{key}.arrow.tmp")
+                feather.write_feather(value, tmp_path, compression='uncompressed')
+                os.replace(tmp_path, os.path.join(snapshot_dir, f"{key}.arrow"))
+                frames.append(key)
+        stamp = {
+            'source': source_key,
+            'versions': versions,
+            'frames': frames,
+            'aggregations': cache.get('aggregations', {}),
+        }
+        with open(stamp_path, 'w') as f:
+            json.dump(stamp, f, default=lambda o: o.item() if hasattr(o, 'item') else str(o))
+    except Exception as e:
+        print(f"Error saving cache snapshot: {e}")
+        return False
+    print(f"Saved cache snapshot to {snapshot_dir} in {time.time() - start_time:.1f} seconds")
+    return True
+
+
+def load_snapshot(snapshot_dir: str = SNAPSHOT_DIR,
+                  source_key: str = SNAPSHOT_SOURCE_KEY) -> Optional[Dict[str, Any]]:
+    """Load a cache snapshot if one exists for the current Delta table versions, built by source_key's code."""
+    if not snapshot_dir:
+        return None
+    stamp_path = os.path.join(snapshot_dir, 'stamp.json')
+    if not os.path.exists(stamp_path):
+        return None
+    start_time = time.time()
+    try:
+        _check_snapshot_dir(snapshot_dir)
+        with open(stamp_path) as f:
+            stamp = json.load(f)
+        if stamp.get('source') != source_key:
+            print("Cache snapshot was built by different code, rebuilding from Delta tables")
+            return None
+        if stamp.get('versions') != get_table_versions():
+            print("Cache snapshot is stale, rebuilding from Delta tables")
+            return None
+        cache = {
+            key: feather.read_table(os.path.join(snapshot_dir, f"{key}.arrow"), memory_map=True).to_pandas()
+            for key in stamp['frames']
+        }
+        cache['aggregations'] = stamp.get('aggregations', {})
+    except Exception as e:
+        print(f"Error loading cache snapshot: {e}")
+        return None
+    print(f"Loaded cache snapshot from {snapshot_dir} in {time.time() - start_time:.1f} seconds")
+    return cache
+
+
+def save_responses(responses: Dict[str, Any], source_key: str, snapshot_dir: str = SNAPSHOT_DIR) -> bool:
+    """
+    Write responses pre-computed from the current snapshot next to it.
+
+    source_key identifies the code that computed them, so a deploy with changed
+    aggregation logic recomputes instead of serving the old shapes.
+    """
+    if not snapshot_dir or not os.path.exists(os.path.join(snapshot_dir, 'stamp.json')):
+        return False
+    try:
+        _check_snapshot_dir(snapshot_dir)
+        path = os.path.join(snapshot_dir, 'responses.json')
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump({'source': source_key, 'responses': responses}, f)
+        os.replace(f"{path}.tmp", path)
+    except Exception as e:
+        print(f"Error saving pre-computed responses: {e}")
+        return False
+    return True
+
+
+def load_responses(source_key: str, snapshot_dir: str = SNAPSHOT_DIR) -> Optional[Dict[str, Any]]:
+    """Load responses saved for the current snapshot by the same code, if any."""
+    if not snapshot_dir:
+        return None
+    path = os.path.join(snapshot_dir, 'responses.json')
+    if not os.path.exists(path):
+        return None
+    try:
+        _check_snapshot_dir(snapshot_dir)
+        with open(path) as f:
+            saved = json.load(f)
+    except Exception as e:
+        print(f"Error loading pre-computed responses: {e}")
+        return None
+    if saved.get('source') != source_key:
+        return None
+    return saved.get('responses')
+
+
 # =============================================================================
 # CACHE ACCESS HELPERS
 # =============================================================================